@@ -10,6 +10,7 @@ WAFFLE_NAMESPACE = u'studio'
 # Switches
 ENABLE_ACCESSIBILITY_POLICY_PAGE = u'enable_policy_page'
 ENABLE_CHECKLISTS_PAGE = u'enable_checklists_page'
+ENABLE_INCREMENTAL_SEARCH_INDEXING = u'enable_incremental_search_indexing'
 
 
 def waffle():
@@ -7,12 +7,14 @@ from abc import ABCMeta, abstractmethod
 from datetime import timedelta
 
 from django.conf import settings
+from django.core.cache import cache
 from django.urls import resolve
 from django.utils.translation import ugettext as _
 from django.utils.translation import ugettext_lazy
 from search.search_engine_base import SearchEngine
 from six import add_metaclass
 
+from contentstore.config.waffle import ENABLE_INCREMENTAL_SEARCH_INDEXING, waffle
 from contentstore.course_group_config import GroupConfiguration
 from course_modes.models import CourseMode
 from eventtracking import tracker
@@ -20,6 +22,7 @@ from openedx.core.lib.courses import course_image_url
 from xmodule.annotator_mixin import html_to_text
 from xmodule.library_tools import normalize_key_for_search
 from xmodule.modulestore import ModuleStoreEnum
+from xmodule.modulestore.split_mongo import BlockKey
 
 # REINDEX_AGE is the default amount of time that we look back for changes
 # that might have happened. If we are provided with a time at which the
@@ -28,6 +31,12 @@ from xmodule.modulestore import ModuleStoreEnum
 # how far back from the trigger point to look back in order to index
 REINDEX_AGE = timedelta(0, 60)  # 60 seconds
 
+# Maximum number of documents sent to the search engine in a single bulk request
+INDEX_BATCH_SIZE = 500
+
+# How long to remember the structure version that was last indexed for a course or library
+INDEXED_VERSION_CACHE_TIMEOUT = 60 * 60 * 24 * 30  # 30 days
+
 log = logging.getLogger('edx.modulestore')
 
 
@@ -43,6 +52,53 @@ def strip_html_content_to_text(html_content):
     return text_content
 
 
+def structure_changes(old_blocks, new_blocks):
+    """
+    Compares the blocks of two versions of a split modulestore structure.
+
+    Returns a tuple (changed, removed) of sets of BlockKeys:
+        changed - blocks that are new or edited in the new version, along with all the
+            descendants of blocks whose settings changed and of blocks moved under a new
+            parent, since descendants inherit settings and include the display names of
+            their ancestors in the index
+        removed - blocks that may no longer be reachable in the new version: blocks
+            missing from it and former children of changed blocks
+    """
+    def children(block):
+        """ Returns the BlockKeys of the children of the given block data """
+        return [BlockKey(*child) for child in block.fields.get('children', [])]
+
+    def settings_fields(block):
+        """ Returns the fields of the given block data other than its children """
+        return {name: value for name, value in block.fields.iteritems() if name != 'children'}
+
+    changed = set()
+    changed_subtrees = []
+    removed = set(old_blocks) - set(new_blocks)
+    for block_key, block in new_blocks.iteritems():
+        old_block = old_blocks.get(block_key)
+        if old_block is None:
+            changed.add(block_key)
+        elif old_block.fields != block.fields or old_block.definition != block.definition:
+            changed.add(block_key)
+            removed.update(children(old_block))
+            # Blocks moved here from another parent now inherit from this block.
+            changed_subtrees.extend(set(children(block)) - set(children(old_block)))
+            if settings_fields(old_block) != settings_fields(block) or old_block.defaults != block.defaults:
+                changed_subtrees.append(block_key)
+
+    visited = set()
+    while changed_subtrees:
+        block_key = changed_subtrees.pop()
+        if block_key in visited or block_key not in new_blocks:
+            continue
+        visited.add(block_key)
+        changed.add(block_key)
+        changed_subtrees.extend(children(new_blocks[block_key]))
+
+    return changed, removed
+
+
 def indexing_is_enabled():
     """
     Checks to see if the indexing feature is enabled
@@ -68,6 +124,7 @@ class SearchIndexerBase(object):
     INDEX_NAME = None
     DOCUMENT_TYPE = None
     ENABLE_INDEXING_KEY = None
+    PUBLISHED_BRANCH = ModuleStoreEnum.BranchName.published
 
     INDEX_EVENT = {
         'name': None,
@@ -115,6 +172,44 @@ class SearchIndexerBase(object):
         result_ids = [result["data"]["id"] for result in response["results"]]
         searcher.remove(cls.DOCUMENT_TYPE, result_ids)
 
+    @classmethod
+    def _indexed_version_cache_key(cls, structure_key):
+        """ Cache key under which the last indexed structure version is stored """
+        return u'contentstore.{}.indexed_version.{}'.format(cls.INDEX_NAME, structure_key)
+
+    @classmethod
+    def _get_published_version(cls, modulestore, structure_key):
+        """
+        Returns a tuple of the split modulestore holding the structure and the
+        structure's published version, or (None, None) if it isn't held in split
+        """
+        if modulestore.get_modulestore_type(structure_key) != ModuleStoreEnum.Type.split:
+            return None, None
+        store = modulestore._get_modulestore_for_courselike(structure_key)  # pylint: disable=protected-access
+        index_entry = store.get_course_index(structure_key)
+        if index_entry is None:
+            return None, None
+        return store, index_entry['versions'].get(cls.PUBLISHED_BRANCH)
+
+    @classmethod
+    def _get_structure_changes(cls, store, structure_key, version):
+        """
+        Returns the (changed, removed) BlockKeys between the last indexed
+        version of the structure and the given version (see structure_changes),
+        or None if they can't be determined and everything must be indexed
+        """
+        indexed_version = cache.get(cls._indexed_version_cache_key(structure_key))
+        if indexed_version is None:
+            return None
+        if indexed_version == unicode(version):
+            return set(), set()
+
+        old_structure = store.get_structure(structure_key, indexed_version)
+        new_structure = store.get_structure(structure_key, version)
+        if old_structure is None or new_structure is None:
+            return None
+        return structure_changes(old_structure['blocks'], new_structure['blocks'])
+
     @classmethod
     def index(cls, modulestore, structure_key, triggered_at=None, reindex_age=REINDEX_AGE):
         """
@@ -131,6 +226,9 @@ class SearchIndexerBase(object):
             updating their index but are still walked through in order to identify
             which items may need to be removed from the index
             If None, then a full reindex takes place
+            When incremental indexing is enabled and the structure version that
+            was last indexed is known, only the blocks changed since that version
+            are indexed instead
 
         Returns:
         Number of items that have been added to the index
@@ -143,6 +241,18 @@ class SearchIndexerBase(object):
         structure_key = cls.normalize_structure_key(structure_key)
         location_info = cls._get_location_info(structure_key)
 
+        store, published_version = None, None
+        if waffle().is_enabled(ENABLE_INCREMENTAL_SEARCH_INDEXING):
+            store, published_version = cls._get_published_version(modulestore, structure_key)
+
+        # changed_blocks, when known, is the set of BlockKeys whose index needs to be updated; and
+        # removed_blocks the set of BlockKeys to remove from the index unless they are still found
+        changed_blocks, removed_blocks = None, None
+        if triggered_at is not None and published_version is not None:
+            changed_blocks, removed_blocks = cls._get_structure_changes(
+                store, structure_key, published_version
+            ) or (None, None)
+
         # Wrap counter in dictionary - otherwise we seem to lose scope inside the embedded function `prepare_item_index`
         indexed_count = {
             "count": 0
@@ -180,10 +290,14 @@ class SearchIndexerBase(object):
             Returns:
             item_content_groups - content groups assigned to indexed item
             """
+            if changed_blocks is not None:
+                skip_index = BlockKey.from_usage_key(item.location) not in changed_blocks
+
             is_indexable = hasattr(item, "index_dictionary")
-            item_index_dictionary = item.index_dictionary() if is_indexable else None
+            # only build the index dictionary (and load the content it is built from) when it will be used
+            item_index_dictionary = item.index_dictionary() if is_indexable and not skip_index else None
             # if it's not indexable and it does not have children, then ignore
-            if not item_index_dictionary and not item.has_children:
+            if not (item_index_dictionary or skip_index and is_indexable) and not item.has_children:
                 return
 
             item_content_groups = None
@@ -259,8 +373,18 @@ class SearchIndexerBase(object):
                 # Now index the content
                 for item in structure.get_children():
                     prepare_item_index(item, groups_usage_info=groups_usage_info)
-                searcher.index(cls.DOCUMENT_TYPE, items_index)
-                cls.remove_deleted_items(searcher, structure_key, indexed_items)
+                for batch_start in range(0, len(items_index), INDEX_BATCH_SIZE):
+                    searcher.index(cls.DOCUMENT_TYPE, items_index[batch_start:batch_start + INDEX_BATCH_SIZE])
+
+                if removed_blocks is None:
+                    cls.remove_deleted_items(searcher, structure_key, indexed_items)
+                else:
+                    removed_ids = set(
+                        unicode(cls._id_modifier(structure_key.make_usage_key(block_key.type, block_key.id)))
+                        for block_key in removed_blocks
+                    ) - indexed_items
+                    if removed_ids:
+                        searcher.remove(cls.DOCUMENT_TYPE, list(removed_ids))
         except Exception as err:  # pylint: disable=broad-except
             # broad exception so that index operation does not prevent the rest of the application from working
             log.exception(
@@ -273,6 +397,13 @@ class SearchIndexerBase(object):
         if error_list:
             raise SearchIndexingError('Error(s) present during indexing', error_list)
 
+        if published_version is not None:
+            cache.set(
+                cls._indexed_version_cache_key(structure_key),
+                unicode(published_version),
+                INDEXED_VERSION_CACHE_TIMEOUT
+            )
+
         return indexed_count["count"]
 
     @classmethod
@@ -442,6 +573,8 @@ class LibrarySearchIndexer(SearchIndexerBase):
         'category': 'library_index'
     }
 
+    PUBLISHED_BRANCH = ModuleStoreEnum.BranchName.library
+
     @classmethod
     def normalize_structure_key(cls, structure_key):
         """ Normalizes structure key for use in indexing """
@@ -0,0 +1,26 @@
+"""
+Script for storing the lowercase displayname, which Studio sorts assets by, on the assets
+of all courses which were saved before it was stored
+"""
+import logging
+
+from django.core.management.base import BaseCommand
+
+from xmodule.contentstore.django import contentstore
+
+log = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Store the lowercase displayname of all the assets in contentstore which are missing it
+    """
+    help = 'Store the lowercase displayname of all the assets in contentstore which are missing it'
+
+    def handle(self, *args, **options):
+        """
+        Execute the command
+        """
+        log.info("Storing the lowercase displayname of assets for all courses")
+        assets_updated = contentstore().add_missing_insensitive_displaynames()
+        log.info(u"Total number of assets updated: %d", assets_updated)
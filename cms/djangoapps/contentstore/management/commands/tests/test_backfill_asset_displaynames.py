@@ -0,0 +1,26 @@
+"""
+Tests for the backfill_asset_displaynames management command.
+"""
+from django.core.management import call_command
+
+from xmodule.contentstore.content import StaticContent
+from xmodule.contentstore.django import contentstore
+from xmodule.modulestore.tests.django_utils import ModuleStoreTestCase
+from xmodule.modulestore.tests.factories import CourseFactory
+
+
+class BackfillAssetDisplaynamesTestCase(ModuleStoreTestCase):
+    """
+    Tests storing the lowercase displayname of assets saved before it was stored.
+    """
+    def setUp(self):
+        super(BackfillAssetDisplaynamesTestCase, self).setUp()
+        self.content_store = contentstore()
+        course = CourseFactory.create()
+        self.asset_key = course.id.make_asset_key('asset', 'Example.txt')
+        self.content_store.save(StaticContent(self.asset_key, 'Example.txt', 'text/plain', 'example'))
+        self.content_store.fs_files.update({}, {'$unset': {'displayname_insensitive': True}}, multi=True)
+
+    def test_backfill(self):
+        call_command('backfill_asset_displaynames')
+        self.assertEqual(self.content_store.get_attr(self.asset_key, 'displayname_insensitive'), 'example.txt')
@@ -7,7 +7,9 @@ import base64
 import json
 import os
 import shutil
+import sys
 import tarfile
+import threading
 from datetime import datetime
 from tempfile import NamedTemporaryFile, mkdtemp
 
@@ -31,7 +33,7 @@ from opaque_keys.edx.locator import LibraryLocator, BlockUsageLocator
 from organizations.models import OrganizationCourse
 from path import Path as path
 from pytz import UTC
-from six import iteritems, text_type
+from six import iteritems, reraise, text_type
 from user_tasks.models import UserTaskArtifact, UserTaskStatus
 from user_tasks.tasks import UserTask
 
@@ -74,6 +76,7 @@ User = get_user_model()
 LOGGER = get_task_logger(__name__)
 FILE_READ_CHUNK = 1024  # bytes
 FULL_COURSE_REINDEX_THRESHOLD = 1
+RERUN_PROGRESS_INTERVAL = 5  # seconds
 DEFAULT_ALL_COURSES = False
 DEFAULT_FORCE_UPDATE = False
 DEFAULT_COMMIT = False
@@ -371,6 +374,7 @@ def rerun_course(source_course_key_string, destination_course_key_string, user_i
 
     source_course_key = CourseKey.from_string(source_course_key_string)
     destination_course_key = CourseKey.from_string(destination_course_key_string)
+    assets_copy = None
     try:
         # deserialize the payload
         fields = deserialize_fields(fields) if fields else None
@@ -379,7 +383,18 @@ def rerun_course(source_course_key_string, destination_course_key_string, user_i
         # as the Mongo modulestore doesn't support multiple runs of the same course.
         store = modulestore()
         with store.default_store('split'):
-            store.clone_course(source_course_key, destination_course_key, user_id, fields=fields)
+            # check before copying any asset, so that the assets of an existing course are left alone
+            if store.has_course(destination_course_key, ignore_case=True):
+                raise DuplicateCourseError(destination_course_key, source_course_key)
+
+            # copy the assets while the course content is cloned
+            assets_copy = CourseAssetsCopy(source_course_key, destination_course_key)
+            assets_copy.start()
+            try:
+                store.clone_course(source_course_key, destination_course_key, user_id, fields=fields, copy_assets=False)
+            finally:
+                assets_copy.wait()
+            assets_copy.raise_error()
 
         # set initial permissions for the user to access the course.
         initialize_permissions(destination_course_key, User.objects.get(id=user_id))
@@ -426,9 +441,64 @@ def rerun_course(source_course_key_string, destination_course_key_string, user_i
             # it's possible there was an error even before the course module was created
             pass
 
+        if assets_copy is not None:
+            # the assets are copied separately from the course, and deleting the course leaves them in place
+            contentstore().delete_all_course_assets(destination_course_key)
+
         return u"exception: " + text_type(exc)
 
 
+class CourseAssetsCopy(threading.Thread):
+    """
+    Copies the assets of a course to its rerun in a background thread.
+    """
+    def __init__(self, source_course_key, destination_course_key):
+        super(CourseAssetsCopy, self).__init__(name='course-assets-copy')
+        self.daemon = True
+        self.source_course_key = source_course_key
+        self.destination_course_key = destination_course_key
+        self.progress = (0, 0)
+        self.exc_info = None
+
+    def run(self):
+        try:
+            contentstore().copy_all_course_assets(
+                self.source_course_key, self.destination_course_key, progress_callback=self._update_progress
+            )
+        except Exception:  # pylint: disable=broad-except
+            self.exc_info = sys.exc_info()
+
+    def _update_progress(self, copied, total):
+        """
+        Records the number of assets copied so far, out of the total.
+        """
+        self.progress = (copied, total)
+
+    def wait(self):
+        """
+        Waits for the copy to complete, reporting its progress in the CourseRerunState of the rerun.
+
+        Progress is reported from the calling thread, so that the database is only used by the task itself.
+        """
+        reported_progress = None
+        while self.is_alive():
+            self.join(RERUN_PROGRESS_INTERVAL)
+            progress = self.progress
+            if self.is_alive() and progress[1] and progress != reported_progress:
+                CourseRerunState.objects.progressed(
+                    course_key=self.destination_course_key,
+                    message=u'Copied {} of {} files'.format(*progress),
+                )
+                reported_progress = progress
+
+    def raise_error(self):
+        """
+        Raises the error which made the copy fail, if any.
+        """
+        if self.exc_info is not None:
+            reraise(*self.exc_info)
+
+
 def deserialize_fields(json_fields):
     fields = json.loads(json_fields)
     for field_name, value in iteritems(fields):
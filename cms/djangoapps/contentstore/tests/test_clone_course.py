@@ -2,18 +2,20 @@
 Unit tests for cloning a course between the same and different module stores.
 """
 import json
+from threading import Event
 
 from django.conf import settings
 from mock import Mock, patch
 from opaque_keys.edx.locator import CourseLocator
 
-from contentstore.tasks import rerun_course
+from contentstore.tasks import CourseAssetsCopy, rerun_course
 from contentstore.tests.utils import CourseTestCase
 from course_action_state.managers import CourseRerunUIStateManager
 from course_action_state.models import CourseRerunState
 from student.auth import has_course_author_access
 from xmodule.contentstore.content import StaticContent
 from xmodule.contentstore.django import contentstore
+from xmodule.contentstore.mongo import chunks_query_for_course
 from xmodule.modulestore import EdxJSONEncoder, ModuleStoreEnum
 from xmodule.modulestore.tests.factories import CourseFactory
 
@@ -135,3 +137,63 @@ class CloneCourseTest(CourseTestCase):
                 course_key=split_course4_id,
                 state=CourseRerunUIStateManager.State.FAILED
             )
+
+    def test_rerun_course_asset_copy_error(self):
+        """
+        Tests that a rerun fails, and its course is deleted, if its assets can't be copied
+        """
+        course = CourseFactory.create(default_store=ModuleStoreEnum.Type.split)
+        rerun_id = CourseLocator(org=course.id.org, course=course.id.course, run='asset_copy_error')
+        CourseRerunState.objects.initiated(course.id, rerun_id, self.user, 'rerun')
+        with patch(
+            'xmodule.contentstore.mongo.MongoContentStore.copy_all_course_assets', Mock(side_effect=Exception)
+        ):
+            result = rerun_course.delay(unicode(course.id), unicode(rerun_id), self.user.id)
+        self.assertIn("exception: ", result.get())
+        self.assertIsNone(self.store.get_course(rerun_id), "Didn't delete course after error")
+        CourseRerunState.objects.find_first(course_key=rerun_id, state=CourseRerunUIStateManager.State.FAILED)
+
+    def test_rerun_course_clone_error_deletes_assets(self):
+        """
+        Tests that the assets copied for a rerun are deleted if its course can't be cloned,
+        so that the rerun can be retried
+        """
+        course = CourseFactory.create(default_store=ModuleStoreEnum.Type.split)
+        content = StaticContent(
+            course.id.make_asset_key('asset', 'handouts.txt'), 'handouts.txt', 'text/plain', 'handouts'
+        )
+        contentstore().save(content)
+        rerun_id = CourseLocator(org=course.id.org, course=course.id.course, run='clone_error')
+
+        for __ in range(2):
+            CourseRerunState.objects.initiated(course.id, rerun_id, self.user, 'rerun')
+            with patch.object(self.store, 'clone_course', Mock(side_effect=Exception)):
+                result = rerun_course.delay(unicode(course.id), unicode(rerun_id), self.user.id)
+            self.assertIn("exception: ", result.get())
+            self.assertEqual(contentstore().get_all_content_for_course(rerun_id)[1], 0)
+            self.assertEqual(contentstore().chunks.find(chunks_query_for_course(rerun_id)).count(), 0)
+
+    @patch('contentstore.tasks.RERUN_PROGRESS_INTERVAL', 0.01)
+    def test_course_assets_copy_progress(self):
+        """
+        Tests that the progress of the copy of the assets of a rerun is reported in its state
+        """
+        rerun_id = CourseLocator(org=self.course.id.org, course=self.course.id.course, run='asset_copy_progress')
+        CourseRerunState.objects.initiated(self.course.id, rerun_id, self.user, 'rerun')
+        progress_reported = Event()
+
+        def copy_all_course_assets(*args, **kwargs):  # pylint: disable=unused-argument
+            """Reports some progress, then waits for it to be reported in the rerun state."""
+            kwargs['progress_callback'](1, 2)
+            progress_reported.wait(10)
+
+        with patch.object(contentstore(), 'copy_all_course_assets', copy_all_course_assets):
+            with patch.object(
+                CourseRerunState.objects, 'progressed', side_effect=lambda **kwargs: progress_reported.set()
+            ) as mock_progressed:
+                assets_copy = CourseAssetsCopy(self.course.id, rerun_id)
+                assets_copy.start()
+                assets_copy.wait()
+
+        assets_copy.raise_error()
+        mock_progressed.assert_called_once_with(course_key=rerun_id, message=u'Copied 1 of 2 files')
@@ -4,22 +4,25 @@ Testing indexing of the courseware as it is changed
 import json
 import time
 from datetime import datetime
-from unittest import skip
+from unittest import TestCase, skip
 from uuid import uuid4
 
 import ddt
 import pytest
 from django.conf import settings
+from django.core.cache.backends.locmem import LocMemCache
 from lazy.lazy import lazy
 from mock import patch
 from pytz import UTC
 from search.search_engine_base import SearchEngine
 
+from contentstore.config.waffle import ENABLE_INCREMENTAL_SEARCH_INDEXING, waffle
 from contentstore.courseware_index import (
     CourseAboutSearchIndexer,
     CoursewareSearchIndexer,
     LibrarySearchIndexer,
-    SearchIndexingError
+    SearchIndexingError,
+    structure_changes
 )
 from contentstore.signals.handlers import listen_for_course_publish, listen_for_library_update
 from contentstore.tests.utils import CourseTestCase
@@ -27,11 +30,12 @@ from contentstore.utils import reverse_course_url, reverse_usage_url
 from course_modes.models import CourseMode
 from openedx.core.djangoapps.models.course_details import CourseDetails
 from xmodule.library_tools import normalize_key_for_search
-from xmodule.modulestore import ModuleStoreEnum
+from xmodule.modulestore import BlockData, ModuleStoreEnum
 from xmodule.modulestore.django import SignalHandler, modulestore
 from xmodule.modulestore.edit_info import EditInfoMixin
 from xmodule.modulestore.inheritance import InheritanceMixin
 from xmodule.modulestore.mixed import MixedModuleStore
+from xmodule.modulestore.split_mongo import BlockKey
 from xmodule.modulestore.tests.django_utils import (
     TEST_DATA_MONGO_MODULESTORE,
     TEST_DATA_SPLIT_MODULESTORE,
@@ -544,6 +548,43 @@ class TestCoursewareSearchIndexer(MixedWithOptionsTestCase):
         with self.assertRaises(SearchIndexingError):
             self.reindex_course(store)
 
+    @patch('contentstore.courseware_index.cache', LocMemCache('test_incremental_index', {}))
+    def _test_incremental_index(self, store):
+        """ Make sure that with incremental indexing only the blocks changed since the last index are indexed """
+        with waffle().override(ENABLE_INCREMENTAL_SEARCH_INDEXING, active=True):
+            self.publish_item(store, self.vertical.location)
+            self.assertEqual(self.reindex_course(store), 4)
+
+            # nothing changed since the full index
+            self.assertEqual(self.index_recent_changes(store, datetime.now(UTC)), 0)
+
+            # only the edited html is indexed again
+            html_unit = store.get_item(self.html_unit.location)
+            html_unit.display_name = "Updated Html Content"
+            self.update_item(store, html_unit)
+            self.publish_item(store, self.html_unit.location)
+            self.assertEqual(self.index_recent_changes(store, datetime.now(UTC)), 1)
+            results = {result["data"]["id"]: result["data"] for result in self.search()["results"]}
+            self.assertEqual(
+                results[unicode(self.html_unit.location)]["content"]["display_name"], "Updated Html Content"
+            )
+
+            # renaming the sequential reindexes its subtree, whose location path changed
+            sequential = store.get_item(self.sequential.location)
+            sequential.display_name = "Lesson One"
+            self.update_item(store, sequential)
+            self.publish_item(store, self.sequential.location)
+            self.assertEqual(self.index_recent_changes(store, datetime.now(UTC)), 3)
+            for result in self.search()["results"]:
+                if result["data"]["id"] != unicode(self.chapter.location):
+                    self.assertEqual(result["data"]["location"][1], "Lesson One")
+
+            # the deleted html is removed from the index, along with the parent vertical being reindexed
+            self.delete_item(store, self.html_unit.location)
+            self.publish_item(store, self.vertical.location)
+            self.assertEqual(self.index_recent_changes(store, datetime.now(UTC)), 1)
+            self.assertEqual(self.search()["total"], 3)
+
     @ddt.data(*WORKS_WITH_STORES)
     def test_indexing_course(self, store_type):
         self._perform_test_using_store(store_type, self._test_indexing_course)
@@ -576,6 +617,9 @@ class TestCoursewareSearchIndexer(MixedWithOptionsTestCase):
     def test_exception(self, store_type):
         self._perform_test_using_store(store_type, self._test_exception)
 
+    def test_incremental_index(self):
+        self._perform_test_using_store(ModuleStoreEnum.Type.split, self._test_incremental_index)
+
     @ddt.data(*WORKS_WITH_STORES)
     def test_course_about_property_index(self, store_type):
         self._perform_test_using_store(store_type, self._test_course_about_property_index)
@@ -602,6 +646,63 @@ class TestCoursewareSearchIndexer(MixedWithOptionsTestCase):
         self._perform_test_using_store(store_type, self._test_delete_course_from_search_index_after_course_deletion)
 
 
+class TestStructureChanges(TestCase):
+    """ Tests the computation of the blocks to reindex from two structure versions """
+    def _block(self, children=(), definition='def', **fields):
+        """ Returns the data of a block with the given children BlockKeys """
+        fields['children'] = [list(child) for child in children]
+        return BlockData(block_type='vertical', definition=definition, fields=fields)
+
+    def setUp(self):
+        super(TestStructureChanges, self).setUp()
+        self.course = BlockKey('course', 'course')
+        self.chapter = BlockKey('chapter', 'chapter')
+        self.html = BlockKey('html', 'html')
+        self.old_blocks = {
+            self.course: self._block([self.chapter]),
+            self.chapter: self._block([self.html], display_name='Week 1'),
+            self.html: self._block(),
+        }
+
+    def test_unchanged(self):
+        self.assertEqual(structure_changes(self.old_blocks, dict(self.old_blocks)), (set(), set()))
+
+    def test_content_changed(self):
+        new_blocks = dict(self.old_blocks)
+        new_blocks[self.html] = self._block(definition='new_def')
+        self.assertEqual(structure_changes(self.old_blocks, new_blocks), ({self.html}, set()))
+
+    def test_settings_changed(self):
+        new_blocks = dict(self.old_blocks)
+        new_blocks[self.chapter] = self._block([self.html], display_name='Week 2')
+        self.assertEqual(structure_changes(self.old_blocks, new_blocks), ({self.chapter, self.html}, {self.html}))
+
+    def test_block_removed(self):
+        new_blocks = {
+            self.course: self._block([self.chapter]),
+            self.chapter: self._block(display_name='Week 1'),
+        }
+        self.assertEqual(structure_changes(self.old_blocks, new_blocks), ({self.chapter}, {self.html}))
+
+    def test_unit_moved(self):
+        sequential1, sequential2 = BlockKey('sequential', 'sequential1'), BlockKey('sequential', 'sequential2')
+        unit = BlockKey('vertical', 'unit')
+        old_blocks = {
+            self.chapter: self._block([sequential1, sequential2], display_name='Week 1'),
+            sequential1: self._block([unit], display_name='Lesson 1'),
+            sequential2: self._block(display_name='Lesson 2', start='2030-01-01'),
+            unit: self._block([self.html]),
+            self.html: self._block(),
+        }
+        new_blocks = dict(old_blocks)
+        new_blocks[sequential1] = self._block(display_name='Lesson 1')
+        new_blocks[sequential2] = self._block([unit], display_name='Lesson 2', start='2030-01-01')
+        self.assertEqual(
+            structure_changes(old_blocks, new_blocks),
+            ({sequential1, sequential2, unit, self.html}, {unit}),
+        )
+
+
 @patch('django.conf.settings.SEARCH_ENGINE', 'search.tests.utils.ForceRefreshElasticSearchEngine')
 @ddt.ddt
 class TestLargeCourseDeletions(MixedWithOptionsTestCase):
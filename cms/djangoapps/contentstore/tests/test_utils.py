@@ -3,6 +3,7 @@ import collections
 from datetime import datetime, timedelta
 
 from django.test import TestCase
+from mock import patch
 from opaque_keys.edx.locator import CourseLocator
 from pytz import UTC
 
@@ -11,6 +12,7 @@ from contentstore.tests.utils import CourseTestCase
 from openedx.core.djangoapps.site_configuration.tests.test_util import with_site_configuration_context
 from xmodule.modulestore import ModuleStoreEnum
 from xmodule.modulestore.django import modulestore
+from xmodule.modulestore.split_mongo.caching_descriptor_system import CachingDescriptorSystem
 from xmodule.modulestore.tests.django_utils import ModuleStoreTestCase, SharedModuleStoreTestCase
 from xmodule.modulestore.tests.factories import CourseFactory, ItemFactory
 from xmodule.partitions.partitions import Group, UserPartition
@@ -322,6 +324,85 @@ class InheritedStaffLockTest(StaffLockTest):
         self.assertFalse(utils.ancestor_has_staff_lock(self.orphan))
 
 
+class InheritedSourcesTest(ModuleStoreTestCase):
+    """Tests for the inherited sources precomputed for all the xblocks of a course."""
+
+    def setUp(self):
+        super(InheritedSourcesTest, self).setUp()
+
+        date_one = datetime(1980, 1, 1, tzinfo=UTC)
+        date_two = datetime(2020, 1, 1, tzinfo=UTC)
+        self.course = CourseFactory.create(default_store=ModuleStoreEnum.Type.split, start=date_one)
+        self.chapter = ItemFactory.create(category='chapter', parent_location=self.course.location, start=date_one)
+        self.sequential = ItemFactory.create(
+            category='sequential', parent_location=self.chapter.location, start=date_two, visible_to_staff_only=True
+        )
+        self.vertical = ItemFactory.create(category='vertical', parent_location=self.sequential.location)
+        self.html = ItemFactory.create(category='html', parent_location=self.vertical.location)
+        self.other_chapter = ItemFactory.create(category='chapter', parent_location=self.course.location)
+
+    def _get_xblocks(self):
+        """Returns the xblocks of the course, read again from the modulestore."""
+        return [
+            self.store.get_item(xblock.location)
+            for xblock in (self.chapter, self.sequential, self.vertical, self.html, self.other_chapter)
+        ]
+
+    def _get_results(self, xblock):
+        """Returns the locations of the sources of the xblock, and whether it inherits a staff lock."""
+        release_date_source = utils.find_release_date_source(xblock)
+        staff_lock_source = utils.find_staff_lock_source(xblock)
+        return (
+            release_date_source.location,
+            staff_lock_source.location if staff_lock_source else None,
+            utils.ancestor_has_staff_lock(xblock),
+        )
+
+    def test_sources_match_ancestors(self):
+        """Tests that the precomputed sources are the ones found by walking up the course"""
+        for xblock in self._get_xblocks():
+            with patch('contentstore.utils._get_inherited_sources', return_value=None):
+                expected = self._get_results(xblock)
+            self.assertEqual(self._get_results(xblock), expected)
+
+    def test_sources_computed_once_per_version(self):
+        """Tests that the sources are only computed again once the course has changed"""
+        compute_inherited_sources = utils._compute_inherited_sources  # pylint: disable=protected-access
+        with patch('contentstore.utils._compute_inherited_sources', wraps=compute_inherited_sources) as mock_compute:
+            for xblock in self._get_xblocks():
+                self._get_results(xblock)
+            self.assertEqual(mock_compute.call_count, 1)
+
+            vertical = self.store.get_item(self.vertical.location)
+            vertical.visible_to_staff_only = True
+            self.store.update_item(vertical, ModuleStoreEnum.UserID.test)
+            html = self.store.get_item(self.html.location)
+            self.assertTrue(utils.ancestor_has_staff_lock(html))
+            self.assertEqual(mock_compute.call_count, 2)
+
+    def test_sources_computed_without_loading_xblocks(self):
+        """Tests that the sources are computed from the course structure, without loading its blocks as xblocks"""
+        xblock_from_json = CachingDescriptorSystem.xblock_from_json
+        with patch.object(
+            CachingDescriptorSystem, 'xblock_from_json', autospec=True, side_effect=xblock_from_json
+        ) as mock_xblock_from_json:
+            sources = utils._get_inherited_sources(self.course.id)  # pylint: disable=protected-access
+        self.assertEqual(len(sources), 6)
+        # only the course itself may be loaded
+        self.assertLessEqual(mock_xblock_from_json.call_count, 1)
+
+    def test_not_cached_while_edited_in_bulk_operation(self):
+        """Tests that the sources are not precomputed while the course is being edited in a bulk operation"""
+        with self.store.bulk_operations(self.course.id):
+            self.assertIsNotNone(utils._get_inherited_sources(self.course.id))  # pylint: disable=protected-access
+            vertical = self.store.get_item(self.vertical.location)
+            vertical.visible_to_staff_only = True
+            self.store.update_item(vertical, ModuleStoreEnum.UserID.test)
+            self.assertIsNone(utils._get_inherited_sources(self.course.id))  # pylint: disable=protected-access
+            html = self.store.get_item(self.html.location)
+            self.assertTrue(utils.ancestor_has_staff_lock(html))
+
+
 class GroupVisibilityTest(CourseTestCase):
     """
     Test content group access rules.
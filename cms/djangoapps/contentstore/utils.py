@@ -3,21 +3,25 @@ Common utility functions useful throughout the contentstore
 """
 
 import logging
+from collections import namedtuple
 from datetime import datetime
 
 from django.conf import settings
 from django.urls import reverse
 from django.utils.translation import ugettext as _
 from opaque_keys.edx.keys import CourseKey, UsageKey
+from opaque_keys.edx.locator import LibraryLocator
 from pytz import UTC
 from six import text_type
 
 from django_comment_common.models import assign_default_role
 from django_comment_common.utils import seed_permissions_roles
+from openedx.core.djangoapps.request_cache import get_cache
 from openedx.core.djangoapps.site_configuration.models import SiteConfiguration
 from student import auth
 from student.models import CourseEnrollment
 from student.roles import CourseInstructorRole, CourseStaffRole
+from xmodule.fields import Date
 from xmodule.modulestore import ModuleStoreEnum
 from xmodule.modulestore.django import modulestore
 from xmodule.modulestore.exceptions import ItemNotFoundError
@@ -210,6 +214,9 @@ def find_release_date_source(xblock):
     """
     Finds the ancestor of xblock that set its release date.
     """
+    sources = _get_inherited_sources(xblock.location.course_key)
+    if sources is not None and _source_key(xblock.location) in sources:
+        return _get_source_xblock(xblock, sources[_source_key(xblock.location)].release_date_source)
 
     # Stop searching at the section level
     if xblock.category == 'chapter':
@@ -233,6 +240,9 @@ def find_staff_lock_source(xblock):
     Returns the xblock responsible for setting this xblock's staff lock, or None if the xblock is not staff locked.
     If this xblock is explicitly locked, return it, otherwise find the ancestor which sets this xblock's staff lock.
     """
+    sources = _get_inherited_sources(xblock.location.course_key)
+    if sources is not None and _source_key(xblock.location) in sources:
+        return _get_source_xblock(xblock, sources[_source_key(xblock.location)].staff_lock_source)
 
     # Stop searching if this xblock has explicitly set its own staff lock
     if xblock.fields['visible_to_staff_only'].is_set_on(xblock):
@@ -258,6 +268,10 @@ def ancestor_has_staff_lock(xblock, parent_xblock=None):
     Can avoid mongo query by passing in parent_xblock.
     """
     if parent_xblock is None:
+        sources = _get_inherited_sources(xblock.location.course_key)
+        if sources is not None and _source_key(xblock.location) in sources:
+            return sources[_source_key(xblock.location)].ancestor_has_staff_lock
+
         parent_location = modulestore().get_parent_location(xblock.location,
                                                             revision=ModuleStoreEnum.RevisionOption.draft_preferred)
         if not parent_location:
@@ -266,6 +280,127 @@ def ancestor_has_staff_lock(xblock, parent_xblock=None):
     return parent_xblock.visible_to_staff_only
 
 
+# The blocks which set the release date and the staff lock of a block, and whether its parent is staff locked.
+InheritedSources = namedtuple('InheritedSources', 'release_date_source staff_lock_source ancestor_has_staff_lock')
+
+
+def _source_key(location):
+    """
+    Returns the key of a block in the dict of inherited sources of its course.
+    """
+    return location.block_type, location.block_id
+
+
+def _get_source_xblock(xblock, source_key):
+    """
+    Returns the xblock with the given key in the course of xblock.
+    """
+    if source_key is None:
+        return None
+    if source_key == _source_key(xblock.location):
+        return xblock
+    block_type, block_id = source_key
+    return modulestore().get_item(xblock.location.course_key.make_usage_key(block_type, block_id))
+
+
+def _get_inherited_sources(course_key):
+    """
+    Returns the InheritedSources of each block of the course, keyed by block type and id,
+    or None if the course is not versioned.
+
+    The sources are computed in a single top-down pass over the blocks of the course
+    structure, without loading them as xblocks, and cached in the request cache for the
+    version of the structure. Nothing is cached while the course is being edited in a bulk
+    operation, since its structure is then modified in place without getting a new version.
+    """
+    if isinstance(course_key, LibraryLocator):
+        return None
+
+    course = modulestore().get_course(course_key, depth=0)
+    course_version = getattr(course, 'course_version', None) if course is not None else None
+    if course_version is None or _is_edited_in_bulk_operation(course_key):
+        return None
+
+    cache = get_cache('contentstore.inherited_sources')
+    if course_version not in cache:
+        store = modulestore()._get_modulestore_for_courselike(course_key)  # pylint: disable=protected-access
+        cache[course_version] = _compute_inherited_sources(store.get_structure(course_key, course_version), course)
+    return cache[course_version]
+
+
+def _is_edited_in_bulk_operation(course_key):
+    """
+    Returns whether the course has been modified in the active bulk operation, if any.
+    """
+    store = modulestore()._get_modulestore_for_courselike(course_key)  # pylint: disable=protected-access
+    bulk_ops_record = store._get_bulk_ops_record(course_key)  # pylint: disable=protected-access
+    return bulk_ops_record.active and bool(getattr(bulk_ops_record, 'dirty_branches', None))
+
+
+def _get_block_setting(block_data, field_name, inherited_value):
+    """
+    Returns the value of the inheritable setting of the block in the course structure,
+    as its xblock would: its own value, else its template default, else the inherited one.
+    """
+    if field_name in block_data.fields:
+        return block_data.fields[field_name]
+    return block_data.defaults.get(field_name, inherited_value)
+
+
+def _compute_inherited_sources(structure, course):
+    """
+    Returns the InheritedSources of each block of the course structure, as
+    find_release_date_source, find_staff_lock_source and ancestor_has_staff_lock
+    would find them by walking up from each xblock.
+    """
+    course_key = _source_key(course.location)
+    sources = {
+        course_key: InheritedSources(
+            release_date_source=course_key,
+            staff_lock_source=course_key if course.fields['visible_to_staff_only'].is_set_on(course) else None,
+            ancestor_has_staff_lock=False,
+        )
+    }
+    # The start date and staff lock of each block whose children are left to visit.
+    settings = {course_key: (course.start, course.visible_to_staff_only)}
+    stack = [course_key]
+    while stack:
+        parent_key = stack.pop()
+        parent_sources = sources[parent_key]
+        parent_start, parent_staff_lock = settings.pop(parent_key)
+        for child in structure['blocks'][parent_key].fields.get('children', []):
+            child_key = (child[0], child[1])
+            child_data = structure['blocks'].get(child_key)
+            if child_key in sources or child_data is None:
+                continue
+
+            child_start = _get_block_setting(child_data, 'start', None)
+            child_start = parent_start if child_start is None else Date().from_json(child_start)
+            child_staff_lock = _get_block_setting(child_data, 'visible_to_staff_only', parent_staff_lock)
+
+            # Sections set their own release date, as do blocks released at another date than their parent.
+            if child_key[0] == 'chapter' or parent_start != child_start:
+                release_date_source = child_key
+            else:
+                release_date_source = parent_sources.release_date_source
+
+            if 'visible_to_staff_only' in child_data.fields:
+                staff_lock_source = child_key
+            elif child_key[0] == 'chapter':
+                staff_lock_source = None
+            else:
+                staff_lock_source = parent_sources.staff_lock_source
+
+            sources[child_key] = InheritedSources(
+                release_date_source=release_date_source,
+                staff_lock_source=staff_lock_source,
+                ancestor_has_staff_lock=parent_staff_lock,
+            )
+            settings[child_key] = (child_start, child_staff_lock)
+            stack.append(child_key)
+    return sources
+
+
 def reverse_url(handler_name, key_name=None, key_value=None, kwargs=None):
     """
     Creates the URL for the given handler.
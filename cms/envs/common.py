@@ -319,6 +319,14 @@ FEATURES = {
 
     # Set this to true to make API docs available at /api-docs/.
     'ENABLE_API_DOCS': False,
+
+    # Whether to serve waffle switches, flags and course overrides from a process-wide snapshot,
+    # invalidated through the shared cache, instead of looking them up in every request.
+    'ENABLE_WAFFLE_SNAPSHOT': False,
+
+    # Whether to answer bulk enrollment checks of actively enrolled users from a cached
+    # per-course index of active enrollments by mode, instead of querying their enrollments.
+    'ENABLE_ENROLLMENT_INDEX': False,
 }
 
 ENABLE_JASMINE = False
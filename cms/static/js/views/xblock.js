@@ -162,38 +162,7 @@ define(['jquery', 'underscore', 'common/js/components/utils/view_utils', 'js/vie
              * @returns {Promise} A promise representing the rendering process
              */
             addXBlockFragmentResources: function(resources) {
-                var self = this,
-                    applyResource,
-                    numResources,
-                    deferred;
-                numResources = resources.length;
-                deferred = $.Deferred();
-                applyResource = function(index) {
-                    var hash, resource, value, promise;
-                    if (index >= numResources) {
-                        deferred.resolve();
-                        return;
-                    }
-                    value = resources[index];
-                    hash = value[0];
-                    if (!window.loadedXBlockResources) {
-                        window.loadedXBlockResources = [];
-                    }
-                    if (_.indexOf(window.loadedXBlockResources, hash) < 0) {
-                        resource = value[1];
-                        promise = self.loadResource(resource);
-                        window.loadedXBlockResources.push(hash);
-                        promise.done(function() {
-                            applyResource(index + 1);
-                        }).fail(function() {
-                            deferred.reject();
-                        });
-                    } else {
-                        applyResource(index + 1);
-                    }
-                };
-                applyResource(0);
-                return deferred.promise();
+                return XBlock.addFragmentResources(resources, _.bind(this.loadResource, this));
             },
 
             /**
@@ -202,30 +171,7 @@ define(['jquery', 'underscore', 'common/js/components/utils/view_utils', 'js/vie
              * @returns {Promise} A promise representing the loading of the resource.
              */
             loadResource: function(resource) {
-                var $head = $('head'),
-                    mimetype = resource.mimetype,
-                    kind = resource.kind,
-                    placement = resource.placement,
-                    data = resource.data;
-                if (mimetype === 'text/css') {
-                    if (kind === 'text') {
-                        $head.append("<style type='text/css'>" + data + '</style>');
-                    } else if (kind === 'url') {
-                        $head.append("<link rel='stylesheet' href='" + data + "' type='text/css'>");
-                    }
-                } else if (mimetype === 'application/javascript') {
-                    if (kind === 'text') {
-                        $head.append('<script>' + data + '</script>');
-                    } else if (kind === 'url') {
-                        return ViewUtils.loadJavaScript(data);
-                    }
-                } else if (mimetype === 'text/html') {
-                    if (placement === 'head') {
-                        $head.append(data);
-                    }
-                }
-                // Return an already resolved promise for synchronous updates
-                return $.Deferred().resolve().promise();
+                return XBlock.loadResource(resource, ViewUtils.loadJavaScript);
             },
 
             fireNotificationActionEvent: function(event) {
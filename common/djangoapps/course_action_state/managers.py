@@ -128,6 +128,16 @@ class CourseRerunUIStateManager(CourseActionUIStateManager):
             display_name=display_name,
         )
 
+    def progressed(self, course_key, message):
+        """
+        To be called as an existing rerun for the given course progresses, with a message describing its progress.
+        """
+        self.update_state(
+            course_key=course_key,
+            new_state=self.State.IN_PROGRESS,
+            message=message,
+        )
+
     def succeeded(self, course_key):
         """
         To be called when an existing rerun for the given course has successfully completed.
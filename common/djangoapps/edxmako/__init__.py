@@ -13,7 +13,7 @@
 #   limitations under the License.
 LOOKUP = {}
 
-from .paths import add_lookup, lookup_template, clear_lookups, save_lookups
+from .paths import add_lookup, lookup_template, clear_lookups, reload_templates, save_lookups
 
 
 class Engines(object):
@@ -0,0 +1,3 @@
+"""
+Management commands for the edxmako Django application.
+"""
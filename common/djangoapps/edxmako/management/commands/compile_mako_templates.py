@@ -0,0 +1,70 @@
+"""
+Management command for precompiling Mako templates into the module cache.
+"""
+
+from __future__ import unicode_literals
+
+import logging
+
+from django.core.management import BaseCommand, CommandError
+from mako.exceptions import MakoException
+
+from edxmako import LOOKUP
+
+log = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Compile every Mako template of the configured lookups so that the generated modules are
+    written to MAKO_MODULE_DIR ahead of the first request, e.g. at deploy time.
+
+    Example:
+    ./manage.py lms compile_mako_templates
+    ./manage.py lms compile_mako_templates --namespace main --extensions .html .txt
+    """
+
+    help = 'Precompile Mako templates into the Mako module directory.'
+
+    requires_system_checks = False
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--namespace',
+            dest='namespaces',
+            type=str,
+            nargs='+',
+            default=None,
+            help="Template lookup namespaces to compile. Defaults to all configured namespaces.",
+        )
+        parser.add_argument(
+            '--extensions',
+            type=str,
+            nargs='+',
+            default=['.html', '.txt', '.xml'],
+            help="File extensions to treat as Mako templates.",
+        )
+
+    def handle(self, *args, **options):
+        namespaces = options['namespaces'] or sorted(LOOKUP)
+        unknown = set(namespaces) - set(LOOKUP)
+        if unknown:
+            raise CommandError('Unknown template namespace(s): {}'.format(', '.join(sorted(unknown))))
+
+        extensions = tuple(options['extensions'])
+        compiled = failed = 0
+        for namespace in namespaces:
+            lookup = LOOKUP[namespace]
+            for uri in lookup.iter_template_uris(extensions=extensions):
+                try:
+                    lookup.get_template(uri)
+                except (MakoException, SyntaxError, UnicodeError) as error:
+                    failed += 1
+                    log.warning('Could not compile template %s in namespace %s: %s', uri, namespace, error)
+                else:
+                    compiled += 1
+
+        self.stdout.write('Compiled {compiled} Mako templates ({failed} failed).'.format(
+            compiled=compiled,
+            failed=failed,
+        ))
@@ -13,7 +13,11 @@ from mako.lookup import TemplateLookup
 
 from openedx.core.djangoapps.request_cache.middleware import request_cached
 from openedx.core.djangoapps.theming.helpers import get_template as themed_template
-from openedx.core.djangoapps.theming.helpers import get_template_path_with_theme, strip_site_theme_templates_path
+from openedx.core.djangoapps.theming.helpers import (
+    clear_theme_lookup_caches,
+    get_template_path_with_theme,
+    strip_site_theme_templates_path
+)
 
 from . import LOOKUP
 
@@ -57,9 +61,32 @@ class DynamicTemplateLookup(TemplateLookup):
         self.template_args['module_directory'] = os.path.join(self.__original_module_directory, unique)
 
         # Also clear the internal caches. Ick.
+        self.clear_template_cache()
+
+    def clear_template_cache(self):
+        """
+        Forget all compiled templates so that they are looked up (and recompiled if changed) on next use.
+        """
         self._collection.clear()
         self._uri_cache.clear()
 
+    def iter_template_uris(self, extensions=('.html', '.txt', '.xml')):
+        """
+        Yield the URI of every template file found under this lookup's directories.
+
+        Templates shadowed by an earlier directory with the same URI are only yielded once.
+        """
+        seen = set()
+        for directory in self.directories:
+            for root, __, filenames in os.walk(directory):
+                for filename in filenames:
+                    if not filename.endswith(extensions):
+                        continue
+                    uri = os.path.relpath(os.path.join(root, filename), directory).replace(os.sep, '/')
+                    if uri not in seen:
+                        seen.add(uri)
+                        yield uri
+
     def adjust_uri(self, uri, calling_uri):
         """
         This method is called by mako when including a template in another template or when inheriting an existing mako
@@ -148,6 +175,17 @@ def add_lookup(namespace, directory, package=None, prepend=False):
     templates.add_directory(directory, prepend=prepend)
 
 
+def reload_templates():
+    """
+    Drop all process-wide template caches: compiled templates of every lookup and resolved theme paths.
+
+    Intended as a reload hook for development, after templates or themes have changed on disk.
+    """
+    clear_theme_lookup_caches()
+    for lookup in LOOKUP.values():
+        lookup.clear_template_cache()
+
+
 @request_cached
 def lookup_template(namespace, name):
     """
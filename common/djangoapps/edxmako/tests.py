@@ -1,7 +1,11 @@
+import os
+import shutil
+import tempfile
 import unittest
 
 import ddt
 from django.conf import settings
+from django.core.management import call_command
 from django.urls import reverse
 from django.http import HttpResponse
 from django.test import TestCase
@@ -9,7 +13,7 @@ from django.test.client import RequestFactory
 from django.test.utils import override_settings
 from mock import Mock, patch
 
-from edxmako import LOOKUP, add_lookup
+from edxmako import LOOKUP, add_lookup, reload_templates, save_lookups
 from edxmako.request_context import get_template_request_context
 from edxmako.shortcuts import is_any_marketing_link_set, is_marketing_link_set, marketing_link, render_to_string
 from openedx.core.djangoapps.request_cache.middleware import RequestCache
@@ -76,6 +80,49 @@ class AddLookupTests(TestCase):
         self.assertTrue(dirs[0].endswith('management'))
 
 
+class TemplateCacheTests(TestCase):
+    """
+    Test template discovery, precompilation and the template reload hook.
+    """
+    def setUp(self):
+        super(TemplateCacheTests, self).setUp()
+        self.template_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.template_dir)
+        os.mkdir(os.path.join(self.template_dir, 'nested'))
+        self._write('top.html', 'top')
+        self._write('nested/inner.txt', 'inner')
+        self._write('ignored.png', 'binary')
+
+        lookups = save_lookups()
+        lookups.__enter__()
+        self.addCleanup(lookups.__exit__, None, None, None)
+        add_lookup('cache_test', self.template_dir)
+
+    def _write(self, name, content):
+        with open(os.path.join(self.template_dir, name), 'w') as template_file:
+            template_file.write(content)
+
+    def test_iter_template_uris(self):
+        uris = sorted(LOOKUP['cache_test'].iter_template_uris())
+        self.assertEqual(uris, ['nested/inner.txt', 'top.html'])
+
+    @patch('edxmako.paths.clear_theme_lookup_caches')
+    def test_reload_templates(self, mock_clear_theme_lookup_caches):
+        lookup = LOOKUP['cache_test']
+        self.assertEqual(lookup.get_template('top.html').render(), 'top')
+        self.assertIn('top.html', lookup._collection)  # pylint: disable=protected-access
+
+        reload_templates()
+
+        self.assertNotIn('top.html', lookup._collection)  # pylint: disable=protected-access
+        self.assertTrue(mock_clear_theme_lookup_caches.called)
+
+    def test_compile_mako_templates(self):
+        call_command('compile_mako_templates', namespaces=['cache_test'])
+        collection = LOOKUP['cache_test']._collection  # pylint: disable=protected-access
+        self.assertEqual(sorted(collection), ['nested/inner.txt', 'top.html'])
+
+
 class MakoRequestContextTest(TestCase):
     """
     Test MakoMiddleware.
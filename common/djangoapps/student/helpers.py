@@ -440,7 +440,7 @@ class AccountValidationError(Exception):
         self.field = field
 
 
-def cert_info(user, course_overview):
+def cert_info(user, course_overview, cert_status=None):
     """
     Get the certificate info needed to render the dashboard section for the given
     student and course.
@@ -448,6 +448,8 @@ def cert_info(user, course_overview):
     Arguments:
         user (User): A user.
         course_overview (CourseOverview): A course.
+        cert_status (dict): Optional, the result of `certificate_status` for the
+            user's certificate in the course, if it has already been loaded.
 
     Returns:
         dict: A dictionary with keys:
@@ -459,11 +461,9 @@ def cert_info(user, course_overview):
             'grade': if status is not 'processing'
             'can_unenroll': if status allows for unenrollment
     """
-    return _cert_info(
-        user,
-        course_overview,
-        certificate_status_for_student(user, course_overview.id)
-    )
+    if cert_status is None:
+        cert_status = certificate_status_for_student(user, course_overview.id)
+    return _cert_info(user, course_overview, cert_status)
 
 
 def _cert_info(user, course_overview, cert_status):
@@ -15,6 +15,8 @@ import json
 import logging
 import six
 import uuid
+import zlib
+from array import array
 from collections import OrderedDict, defaultdict, namedtuple
 from datetime import datetime, timedelta
 from functools import total_ordering
@@ -1193,6 +1195,13 @@ class CourseEnrollment(models.Model):
 
     MODE_CACHE_NAMESPACE = u'CourseEnrollment.mode_and_active'
 
+    # cache key formats for the per-course index of active enrollments by mode, and for its
+    # version, which is changed whenever an enrollment in the course is saved or deleted
+    ENROLLMENT_INDEX_CACHE_KEY = u"enrollment_index.{}.{}"
+    ENROLLMENT_INDEX_VERSION_CACHE_KEY = u"enrollment_index.{}.version"
+    ENROLLMENT_INDEX_CACHE_NAMESPACE = u'CourseEnrollment.enrollment_index'
+    ENROLLMENT_INDEX_CACHE_TIMEOUT = 60 * 60
+
     class Meta(object):
         unique_together = (('user', 'course'),)
         ordering = ('user', 'course')
@@ -2032,9 +2041,21 @@ class CourseEnrollment(models.Model):
         # before populating the cache with another bulk set of data,
         # remove previously cached entries to keep memory usage low.
         clear_cache(cls.MODE_CACHE_NAMESPACE)
+        cache = cls._get_mode_active_request_cache()
+
+        if settings.FEATURES.get('ENABLE_ENROLLMENT_INDEX', False):
+            # Only the states of users without an active enrollment are read from the database.
+            index = cls.active_user_ids_by_mode(course_key)
+            inactive_users = []
+            for user in users:
+                enrollment_state = cls._get_active_enrollment_state(index, user.id)
+                if enrollment_state:
+                    cls._update_enrollment(cache, user.id, course_key, enrollment_state)
+                else:
+                    inactive_users.append(user)
+            users = inactive_users
 
         records = cls.objects.filter(user__in=users, course_id=course_key).select_related('user')
-        cache = cls._get_mode_active_request_cache()
         for record in records:
             enrollment_state = CourseEnrollmentState(record.mode, record.is_active)
             cls._update_enrollment(cache, record.user.id, course_key, enrollment_state)
@@ -2070,6 +2091,131 @@ class CourseEnrollment(models.Model):
         """
         cache[(user_id, course_key)] = enrollment_state
 
+    @classmethod
+    def enrollment_index_cache_key(cls, course_key, version):
+        """
+        Return the cache key of the given version of the active enrollment index for the course.
+        """
+        return cls.ENROLLMENT_INDEX_CACHE_KEY.format(text_type(course_key), version)
+
+    @classmethod
+    def enrollment_index_version_cache_key(cls, course_key):
+        """
+        Return the cache key of the current version of the active enrollment index for the course.
+        """
+        return cls.ENROLLMENT_INDEX_VERSION_CACHE_KEY.format(text_type(course_key))
+
+    @classmethod
+    def active_user_ids_by_mode(cls, course_key):
+        """
+        Return the ids of the users actively enrolled in the course, grouped by mode.
+
+        The index is cached in the request cache and, compressed, in the
+        shared cache, under a version which is changed whenever an enrollment
+        in the course is saved or deleted. An index built before the version
+        changed is stored under the previous version, so it is never used.
+
+        Returns:
+            dict: Mapping of mode slugs to frozensets of user ids.
+        """
+        request_cache = get_cache(cls.ENROLLMENT_INDEX_CACHE_NAMESPACE)
+        if course_key in request_cache:
+            return request_cache[course_key]
+
+        version_cache_key = cls.enrollment_index_version_cache_key(course_key)
+        version = cache.get(version_cache_key)
+        if version is None:
+            cache.add(version_cache_key, uuid.uuid4().hex, None)
+            version = cache.get(version_cache_key)
+
+        cache_key = cls.enrollment_index_cache_key(course_key, version)
+        packed_index = cache.get(cache_key) if version is not None else None
+        if packed_index is None:
+            user_ids_by_mode = defaultdict(list)
+            enrollments = cls.objects.filter(course_id=course_key, is_active=True).values_list('user_id', 'mode')
+            for user_id, mode in enrollments:
+                user_ids_by_mode[mode].append(user_id)
+            packed_index = {
+                mode: _pack_user_ids(user_ids)
+                for mode, user_ids in six.iteritems(user_ids_by_mode)
+            }
+            if version is not None:
+                cache.set(cache_key, packed_index, cls.ENROLLMENT_INDEX_CACHE_TIMEOUT)
+
+        index = {
+            mode: frozenset(_unpack_user_ids(packed_user_ids))
+            for mode, packed_user_ids in six.iteritems(packed_index)
+        }
+        request_cache[course_key] = index
+        return index
+
+    @classmethod
+    def filter_enrolled_user_ids(cls, user_ids, course_key, modes=None):
+        """
+        Return the subset of the given user ids that are actively enrolled in
+        the course, optionally restricted to the given modes, without
+        querying the enrollment table.
+
+        Arguments:
+            user_ids (iterable[int]): The ids of the users to check.
+            course_key (CourseKey): The course.
+            modes (iterable[str]): Optional list of mode slugs.
+
+        Returns:
+            set: The ids of the enrolled users.
+        """
+        index = cls.active_user_ids_by_mode(course_key)
+        if modes is None:
+            modes = index.keys()
+        enrolled_user_ids = set()
+        for mode in modes:
+            enrolled_user_ids.update(index.get(mode, frozenset()))
+        return enrolled_user_ids.intersection(user_ids)
+
+    @staticmethod
+    def _get_active_enrollment_state(index, user_id):
+        """
+        Returns the CourseEnrollmentState of the user from the given active
+        enrollment index, or None if the user isn't actively enrolled.
+        """
+        for mode, user_ids in six.iteritems(index):
+            if user_id in user_ids:
+                return CourseEnrollmentState(mode, True)
+        return None
+
+    @classmethod
+    def invalidate_enrollment_index(cls, course_key):
+        """
+        Mark the cached active enrollment index for the course as outdated.
+        """
+        cache.set(cls.enrollment_index_version_cache_key(course_key), uuid.uuid4().hex, None)
+        get_cache(cls.ENROLLMENT_INDEX_CACHE_NAMESPACE).pop(course_key, None)
+
+
+def _pack_user_ids(user_ids):
+    """
+    Encode the user ids as a zlib-compressed array of sorted deltas,
+    which keeps the index of large courses small enough for the shared cache.
+    """
+    deltas = array('L')
+    previous = 0
+    for user_id in sorted(user_ids):
+        deltas.append(user_id - previous)
+        previous = user_id
+    return zlib.compress(deltas.tostring())
+
+
+def _unpack_user_ids(packed_user_ids):
+    """
+    Decode user ids encoded by _pack_user_ids.
+    """
+    deltas = array('L')
+    deltas.fromstring(zlib.decompress(packed_user_ids))
+    user_id = 0
+    for delta in deltas:
+        user_id += delta
+        yield user_id
+
 
 @receiver(models.signals.post_save, sender=CourseEnrollment)
 @receiver(models.signals.post_delete, sender=CourseEnrollment)
@@ -2082,6 +2228,12 @@ def invalidate_enrollment_mode_cache(sender, instance, **kwargs):  # pylint: dis
     )
     cache.delete(cache_key)
 
+    # The index is invalidated again once the transaction commits, so that no
+    # process can cache an index built from the uncommitted enrollments.
+    course_key = instance.course_id
+    CourseEnrollment.invalidate_enrollment_index(course_key)
+    transaction.on_commit(lambda: CourseEnrollment.invalidate_enrollment_index(course_key))
+
 
 class ManualEnrollmentAudit(models.Model):
     """
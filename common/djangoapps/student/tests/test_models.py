@@ -6,17 +6,20 @@ import hashlib
 import ddt
 import factory
 import pytz
+from django.conf import settings
 from django.contrib.auth.models import AnonymousUser
 from django.core.cache import cache
 from django.db.models import signals
 from django.db.models.functions import Lower
 from django.test import TestCase
+from mock import patch
 
 from course_modes.models import CourseMode
 from course_modes.tests.factories import CourseModeFactory
 from courseware.models import DynamicUpgradeDeadlineConfiguration
 from opaque_keys.edx.keys import CourseKey
 from openedx.core.djangoapps.content.course_overviews.models import CourseOverview
+from openedx.core.djangoapps.request_cache import clear_cache, get_cache
 from openedx.core.djangoapps.schedules.models import Schedule
 from openedx.core.djangoapps.schedules.tests.factories import ScheduleFactory
 from openedx.core.djangolib.testing.utils import skip_unless_lms
@@ -26,7 +29,8 @@ from student.models import (
     PendingEmailChange,
     ManualEnrollmentAudit,
     ALLOWEDTOENROLL_TO_ENROLLED,
-    PendingNameChange
+    PendingNameChange,
+    _pack_user_ids
 )
 from student.tests.factories import CourseEnrollmentFactory, UserFactory
 from xmodule.modulestore.tests.django_utils import SharedModuleStoreTestCase
@@ -126,6 +130,82 @@ class CourseEnrollmentTests(SharedModuleStoreTestCase):
         )
         self.assertListEqual([self.user, self.user_2], all_enrolled_users)
 
+    def test_active_user_ids_by_mode(self):
+        CourseEnrollmentFactory.create(user=self.user, course_id=self.course.id, mode=CourseMode.VERIFIED)
+        CourseEnrollmentFactory.create(user=self.user_2, course_id=self.course.id, mode=CourseMode.AUDIT)
+        CourseEnrollmentFactory.create(user=UserFactory(), course_id=self.course.id, is_active=False)
+
+        with self.assertNumQueries(1):
+            index = CourseEnrollment.active_user_ids_by_mode(self.course.id)
+            self.assertEqual(index, CourseEnrollment.active_user_ids_by_mode(self.course.id))
+        self.assertEqual(index, {
+            CourseMode.VERIFIED: frozenset([self.user.id]),
+            CourseMode.AUDIT: frozenset([self.user_2.id]),
+        })
+
+    def test_filter_enrolled_user_ids(self):
+        CourseEnrollmentFactory.create(user=self.user, course_id=self.course.id, mode=CourseMode.VERIFIED)
+        enrollment = CourseEnrollmentFactory.create(user=self.user_2, course_id=self.course.id, mode=CourseMode.AUDIT)
+        user_ids = [self.user.id, self.user_2.id, UserFactory().id]
+
+        self.assertEqual(
+            CourseEnrollment.filter_enrolled_user_ids(user_ids, self.course.id),
+            {self.user.id, self.user_2.id},
+        )
+        self.assertEqual(
+            CourseEnrollment.filter_enrolled_user_ids(user_ids, self.course.id, modes=[CourseMode.VERIFIED]),
+            {self.user.id},
+        )
+
+        # Saving an enrollment invalidates the cached index.
+        enrollment.update_enrollment(is_active=False)
+        self.assertEqual(CourseEnrollment.filter_enrolled_user_ids(user_ids, self.course.id), {self.user.id})
+
+    @patch.dict(settings.FEATURES, {'ENABLE_ENROLLMENT_INDEX': True})
+    def test_enrollment_states_from_index(self):
+        CourseEnrollmentFactory.create(user=self.user, course_id=self.course.id, mode=CourseMode.VERIFIED)
+        CourseEnrollmentFactory.create(
+            user=self.user_2, course_id=self.course.id, mode=CourseMode.AUDIT, is_active=False,
+        )
+        CourseEnrollment.active_user_ids_by_mode(self.course.id)
+        clear_cache(CourseEnrollment.MODE_CACHE_NAMESPACE)
+
+        # Active enrollments are answered from the index, other ones from the database.
+        with self.assertNumQueries(1):
+            CourseEnrollment.bulk_fetch_enrollment_states([self.user, self.user_2], self.course.id)
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                CourseEnrollment.enrollment_mode_for_user(self.user, self.course.id), (CourseMode.VERIFIED, True),
+            )
+            self.assertEqual(
+                CourseEnrollment.enrollment_mode_for_user(self.user_2, self.course.id), (CourseMode.AUDIT, False),
+            )
+
+    @patch.dict(settings.FEATURES, {'ENABLE_ENROLLMENT_INDEX': True})
+    def test_single_enrollment_check_does_not_load_index(self):
+        CourseEnrollmentFactory.create(user=self.user, course_id=self.course.id)
+        clear_cache(CourseEnrollment.MODE_CACHE_NAMESPACE)
+        clear_cache(CourseEnrollment.ENROLLMENT_INDEX_CACHE_NAMESPACE)
+
+        with self.assertNumQueries(1):
+            self.assertTrue(CourseEnrollment.is_enrolled(self.user, self.course.id))
+        self.assertNotIn(self.course.id, get_cache(CourseEnrollment.ENROLLMENT_INDEX_CACHE_NAMESPACE))
+
+    def test_stale_enrollment_index_is_not_used(self):
+        enrollment = CourseEnrollmentFactory.create(user=self.user, course_id=self.course.id)
+        stale_index = CourseEnrollment.active_user_ids_by_mode(self.course.id)
+        stale_version = cache.get(CourseEnrollment.enrollment_index_version_cache_key(self.course.id))
+
+        enrollment.update_enrollment(is_active=False)
+        # An index read before the unenrollment, and written to the cache after it.
+        cache.set(
+            CourseEnrollment.enrollment_index_cache_key(self.course.id, stale_version),
+            {mode: _pack_user_ids(user_ids) for mode, user_ids in stale_index.iteritems()},
+        )
+        clear_cache(CourseEnrollment.ENROLLMENT_INDEX_CACHE_NAMESPACE)
+
+        self.assertEqual(CourseEnrollment.active_user_ids_by_mode(self.course.id), {})
+
     @skip_unless_lms
     # NOTE: We mute the post_save signal to prevent Schedules from being created for new enrollments
     @factory.django.mute_signals(signals.post_save)
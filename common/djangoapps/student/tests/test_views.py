@@ -18,6 +18,8 @@ from mock import patch
 from opaque_keys import InvalidKeyError
 
 from bulk_email.models import BulkEmailFlag
+from lms.djangoapps.certificates.models import CertificateStatuses
+from lms.djangoapps.certificates.tests.factories import GeneratedCertificateFactory
 from course_modes.models import CourseMode
 from edx_oauth2_provider.constants import AUTHORIZED_CLIENTS_SESSION_KEY
 from edx_oauth2_provider.tests.factories import (ClientFactory,
@@ -34,6 +36,7 @@ from student.helpers import DISABLE_UNENROLL_CERT_STATES
 from student.models import CourseEnrollment, UserProfile
 from student.signals import REFUND_ORDER
 from student.tests.factories import CourseEnrollmentFactory, UserFactory
+from student.views.dashboard import _get_cert_statuses
 from util.milestones_helpers import (get_course_milestones,
                                      remove_prerequisite_course,
                                      set_prerequisite_courses)
@@ -66,7 +69,7 @@ class TestStudentDashboardUnenrollments(SharedModuleStoreTestCase):
         self.cert_status = 'processing'
         self.client.login(username=self.user.username, password=PASSWORD)
 
-    def mock_cert(self, _user, _course_overview):
+    def mock_cert(self, _user, _course_overview, _cert_status=None):
         """ Return a preset certificate status. """
         return {
             'status': self.cert_status,
@@ -157,6 +160,34 @@ class TestStudentDashboardUnenrollments(SharedModuleStoreTestCase):
         self.assertEqual(response.status_code, 406)
 
 
+@unittest.skipUnless(settings.ROOT_URLCONF == 'lms.urls', 'Test only valid in lms')
+class TestDashboardBulkLoading(SharedModuleStoreTestCase):
+    """
+    Tests for the helpers that bulk-load per-enrollment dashboard data.
+    """
+    def setUp(self):
+        super(TestDashboardBulkLoading, self).setUp()
+        self.user = UserFactory()
+        self.enrollments = [
+            CourseEnrollmentFactory(course_id=CourseOverviewFactory.create().id, user=self.user)
+            for __ in range(3)
+        ]
+
+    def test_cert_statuses_loaded_in_bulk(self):
+        GeneratedCertificateFactory.create(
+            user=self.user,
+            course_id=self.enrollments[0].course_id,
+            status=CertificateStatuses.notpassing,
+        )
+        with self.assertNumQueries(1):
+            with patch('student.views.dashboard.cert_info', side_effect=lambda _user, _course, status: status):
+                cert_statuses = _get_cert_statuses(self.user, self.enrollments)
+
+        self.assertEqual(cert_statuses[self.enrollments[0].course_id]['status'], CertificateStatuses.notpassing)
+        for enrollment in self.enrollments[1:]:
+            self.assertEqual(cert_statuses[enrollment.course_id]['status'], CertificateStatuses.unavailable)
+
+
 @unittest.skipUnless(settings.ROOT_URLCONF == 'lms.urls', 'Test only valid in lms')
 class LogoutTests(TestCase):
     """ Tests for the logout functionality. """
@@ -26,6 +26,7 @@ from course_modes.models import CourseMode
 from courseware.access import has_access
 from edxmako.shortcuts import render_to_response, render_to_string
 from entitlements.models import CourseEntitlement
+from lms.djangoapps.certificates.models import GeneratedCertificate, certificate_status
 from lms.djangoapps.commerce.utils import EcommerceService  # pylint: disable=import-error
 from lms.djangoapps.verify_student.services import IDVerificationService
 from openedx.core.djangoapps import monitoring_utils
@@ -339,6 +340,59 @@ def is_course_blocked(request, redeemed_registration_codes, course_key):
     return blocked
 
 
+def _get_redeemed_registration_codes_by_course(user, course_ids):
+    """
+    Bulk-load the registration codes the user has redeemed in the given courses.
+
+    Arguments:
+        user (User): the user in question.
+        course_ids (list[CourseKey]): the courses to look up.
+
+    Returns:
+        dict: Mapping of course keys to the list of redeemed `CourseRegistrationCode`s,
+            with their invoice items and invoices already loaded.
+    """
+    registration_codes_by_course = defaultdict(list)
+    redeemed_registration_codes = CourseRegistrationCode.objects.filter(
+        course_id__in=course_ids,
+        registrationcoderedemption__redeemed_by=user
+    ).select_related('invoice_item__invoice')
+    for registration_code in redeemed_registration_codes:
+        registration_codes_by_course[registration_code.course_id].append(registration_code)
+    return registration_codes_by_course
+
+
+def _get_cert_statuses(user, course_enrollments):
+    """
+    Return the certificate info for each of the given enrollments.
+
+    The user's certificates are loaded with a single query rather than
+    one query per enrollment.
+
+    Arguments:
+        user (User): the user in question.
+        course_enrollments (list[CourseEnrollment]): the user's enrollments.
+
+    Returns:
+        dict: Mapping of course keys to the dictionaries returned by `cert_info`.
+    """
+    certificates_by_course = {
+        certificate.course_id: certificate
+        for certificate in GeneratedCertificate.objects.filter(
+            user=user,
+            course_id__in=[enrollment.course_id for enrollment in course_enrollments]
+        )
+    }
+    return {
+        enrollment.course_id: cert_info(
+            user,
+            enrollment.course_overview,
+            certificate_status(certificates_by_course.get(enrollment.course_id))
+        )
+        for enrollment in course_enrollments
+    }
+
+
 def get_verification_error_reasons_for_display(verification_error_codes):
     """
     Returns the display text for the given verification error codes.
@@ -703,10 +757,7 @@ def student_dashboard(request):
     # If a course is not included in this dictionary,
     # there is no verification messaging to display.
     verify_status_by_course = check_verify_status_by_course(user, course_enrollments)
-    cert_statuses = {
-        enrollment.course_id: cert_info(request.user, enrollment.course_overview)
-        for enrollment in course_enrollments
-    }
+    cert_statuses = _get_cert_statuses(user, course_enrollments)
 
     # only show email settings for Mongo course and when bulk email is turned on
     show_email_settings_for = frozenset(
@@ -724,14 +775,12 @@ def student_dashboard(request):
     statuses = ["approved", "denied", "pending", "must_reverify"]
     reverifications = reverification_info(statuses)
 
+    redeemed_registration_codes = _get_redeemed_registration_codes_by_course(user, enrolled_course_ids)
     block_courses = frozenset(
         enrollment.course_id for enrollment in course_enrollments
         if is_course_blocked(
             request,
-            CourseRegistrationCode.objects.filter(
-                course_id=enrollment.course_id,
-                registrationcoderedemption__redeemed_by=request.user
-            ),
+            redeemed_registration_codes.get(enrollment.course_id, []),
             enrollment.course_id
         )
     )
@@ -0,0 +1,194 @@
+"""
+Event tracker backend that buffers events in memory and sends them to
+another backend in batches from a background thread.
+
+Example configuration::
+
+  TRACKING_BACKENDS = {
+      'mongo': {
+          'ENGINE': 'track.backends.buffered.BufferedBackend',
+          'OPTIONS': {
+              'backend': {
+                  'ENGINE': 'track.backends.mongodb.MongoBackend',
+                  'OPTIONS': {...},
+              },
+              'max_queue_size': 10000,
+              'batch_size': 100,
+              'flush_interval': 1.0,
+              'overflow': 'drop',
+          }
+      }
+  }
+
+"""
+
+from __future__ import absolute_import
+
+import atexit
+import logging
+import os
+import threading
+import time
+
+from dogapi import dog_stats_api
+from django.db import close_old_connections
+from six.moves import queue
+
+from track.backends import BaseBackend
+
+log = logging.getLogger(__name__)
+
+# Overflow policies, applied when an event is sent while the queue is full.
+OVERFLOW_DROP = 'drop'  # discard the new event
+OVERFLOW_SEND = 'send'  # send the new event synchronously, bypassing the queue
+OVERFLOW_POLICIES = (OVERFLOW_DROP, OVERFLOW_SEND)
+
+# Seconds to wait, on top of the flush interval, for the background thread to send its last batch on close.
+CLOSE_TIMEOUT = 5
+
+
+class BufferedBackend(BaseBackend):
+    """
+    Event tracker backend wrapping another backend.
+
+    Events are put on a bounded queue and written to the wrapped backend
+    with `send_many` by a daemon thread, as soon as `batch_size` events
+    are available or `flush_interval` seconds after the first queued
+    event, whichever comes first. Pending events are flushed when the
+    process exits.
+
+    """
+    def __init__(self, backend, max_queue_size=10000, batch_size=100, flush_interval=1.0,
+                 overflow=OVERFLOW_DROP, **kwargs):
+        """
+        :Parameters:
+
+          - `backend`: configuration of the wrapped backend, a dict with
+            `ENGINE` and optionally `OPTIONS` keys as in TRACKING_BACKENDS
+          - `max_queue_size`: number of events buffered before the overflow
+            policy applies
+          - `batch_size`: maximum number of events sent in a single batch
+          - `flush_interval`: maximum number of seconds an event is buffered
+          - `overflow`: either 'drop' or 'send'
+
+        """
+        super(BufferedBackend, self).__init__(**kwargs)
+
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError('Invalid overflow policy %s' % overflow)
+
+        # Imported here since the tracker instantiates backends while its module is being loaded.
+        from track.tracker import _instantiate_backend_from_name
+        self.backend = _instantiate_backend_from_name(backend['ENGINE'], backend.get('OPTIONS', {}))
+
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.overflow = overflow
+        self.queue = queue.Queue(maxsize=max_queue_size)
+
+        self._worker = None
+        self._worker_pid = None
+        self._worker_lock = threading.Lock()
+        self._stopping = threading.Event()
+
+        atexit.register(self.close)
+
+    def send(self, event):
+        """Queue the event, applying the overflow policy if the queue is full."""
+        self._ensure_worker()
+        try:
+            self.queue.put_nowait(event)
+        except queue.Full:
+            if self.overflow == OVERFLOW_SEND:
+                dog_stats_api.increment('track.buffered.overflow_sent')
+                self.backend.send(event)
+            else:
+                dog_stats_api.increment('track.buffered.dropped')
+
+    def flush(self):
+        """Synchronously send all the events currently in the queue."""
+        while True:
+            batch = self._get_available(self.batch_size)
+            if not batch:
+                return
+            self._send_batch(batch)
+
+    def close(self):
+        """Stop the background thread and flush any pending events."""
+        self._stopping.set()
+        worker = self._worker
+        if worker is not None and worker.is_alive():
+            worker.join(self.flush_interval + CLOSE_TIMEOUT)
+        self.flush()
+
+    def _ensure_worker(self):
+        """
+        Start the background thread if it isn't running in this process.
+
+        The thread is started lazily, and restarted after a fork, so that
+        pre-forking servers get one worker per process.
+        """
+        if self._worker_pid == os.getpid() and self._worker.is_alive():
+            return
+        with self._worker_lock:
+            if self._worker_pid == os.getpid() and self._worker.is_alive():
+                return
+            self._stopping.clear()
+            self._worker = threading.Thread(target=self._run, name='track-buffered-backend')
+            self._worker.daemon = True
+            self._worker.start()
+            self._worker_pid = os.getpid()
+
+    def _run(self):
+        """Background thread loop: send batches until asked to stop."""
+        while not self._stopping.is_set():
+            batch = self._collect_batch()
+            if batch:
+                # The wrapped backend may use the database, and this thread runs outside of any
+                # request, so its connections are cleaned up around each batch as a request's would be.
+                close_old_connections()
+                try:
+                    self._send_batch(batch)
+                finally:
+                    close_old_connections()
+
+    def _collect_batch(self):
+        """
+        Wait for events and return them once `batch_size` of them are
+        available or `flush_interval` seconds after the first one arrived.
+        """
+        batch = []
+        deadline = None
+        while len(batch) < self.batch_size and not self._stopping.is_set():
+            timeout = self.flush_interval if deadline is None else deadline - time.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(self.queue.get(timeout=timeout))
+            except queue.Empty:
+                break
+            if deadline is None:
+                deadline = time.time() + self.flush_interval
+            batch.extend(self._get_available(self.batch_size - len(batch)))
+        return batch
+
+    def _get_available(self, limit):
+        """Return up to `limit` events from the queue without blocking."""
+        events = []
+        while len(events) < limit:
+            try:
+                events.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        return events
+
+    def _send_batch(self, batch):
+        """Send a batch to the wrapped backend, reporting queue metrics."""
+        dog_stats_api.gauge('track.buffered.queue_depth', self.queue.qsize())
+        dog_stats_api.histogram('track.buffered.batch_size', len(batch))
+        try:
+            self.backend.send_many(batch)
+        except Exception:  # pylint: disable=broad-except
+            # Never let a backend error kill the worker thread; the batch is lost.
+            dog_stats_api.increment('track.buffered.dropped', len(batch))
+            log.exception('Error sending %d buffered tracking events', len(batch))
@@ -96,3 +96,13 @@ class MongoBackend(BaseBackend):
             # during the next event.
             msg = 'Error inserting to MongoDB event tracker backend'
             log.exception(msg)
+
+    def send_many(self, events):
+        """Insert a batch of events in to the Mongo collection with a single bulk insert"""
+        if not events:
+            return
+        try:
+            self.collection.insert(events, manipulate=False, continue_on_error=True)
+        except (PyMongoError, BSONError):
+            msg = 'Error bulk inserting %d events to MongoDB event tracker backend'
+            log.exception(msg, len(events))
@@ -0,0 +1,96 @@
+"""Tests for the buffered event tracker backend."""
+from __future__ import absolute_import
+
+import time
+
+from django.test import TestCase
+from mock import patch
+
+from track.backends import BaseBackend
+from track.backends.buffered import BufferedBackend
+
+
+class RecordingBackend(BaseBackend):
+    """Backend keeping the events and batches it receives."""
+    def __init__(self, **kwargs):
+        super(RecordingBackend, self).__init__(**kwargs)
+        self.events = []
+        self.batches = []
+
+    def send(self, event):
+        self.events.append(event)
+
+    def send_many(self, events):
+        self.batches.append(list(events))
+
+
+class TestBufferedBackend(TestCase):
+    """Tests sending events through BufferedBackend to a RecordingBackend."""
+    def _create_backend(self, **options):
+        backend = BufferedBackend(
+            backend={'ENGINE': 'track.backends.tests.test_buffered.RecordingBackend'},
+            **options
+        )
+        self.addCleanup(backend.close)
+        return backend
+
+    def test_events_are_sent_in_batches(self):
+        backend = self._create_backend(batch_size=2, flush_interval=0.01)
+        events = [{'test': index} for index in range(5)]
+        for event in events:
+            backend.send(event)
+        backend.close()
+
+        batches = backend.backend.batches
+        self.assertTrue(all(len(batch) <= 2 for batch in batches))
+        self.assertEqual(sorted(sum(batches, []), key=lambda event: event['test']), events)
+        self.assertEqual(backend.backend.events, [])
+
+    @patch('track.backends.buffered.close_old_connections')
+    def test_worker_closes_old_connections(self, mock_close_old_connections):
+        backend = self._create_backend(flush_interval=0.01)
+        backend.send({'test': 1})
+        for _ in range(100):
+            if backend.backend.batches:
+                break
+            time.sleep(0.01)
+        backend.close()
+
+        self.assertEqual(backend.backend.batches, [[{'test': 1}]])
+        self.assertEqual(mock_close_old_connections.call_count, 2)
+
+    @patch('track.backends.buffered.dog_stats_api')
+    @patch.object(BufferedBackend, '_ensure_worker')
+    def test_overflow_drop(self, _mock_ensure_worker, mock_dog_stats_api):
+        backend = self._create_backend(max_queue_size=2, batch_size=10)
+        for index in range(3):
+            backend.send({'test': index})
+
+        mock_dog_stats_api.increment.assert_called_once_with('track.buffered.dropped')
+        backend.flush()
+        self.assertEqual(backend.backend.batches, [[{'test': 0}, {'test': 1}]])
+        self.assertEqual(backend.backend.events, [])
+
+    @patch.object(BufferedBackend, '_ensure_worker')
+    def test_overflow_send(self, _mock_ensure_worker):
+        backend = self._create_backend(max_queue_size=2, batch_size=10, overflow='send')
+        for index in range(3):
+            backend.send({'test': index})
+
+        self.assertEqual(backend.backend.events, [{'test': 2}])
+        backend.flush()
+        self.assertEqual(backend.backend.batches, [[{'test': 0}, {'test': 1}]])
+
+    def test_invalid_overflow(self):
+        with self.assertRaises(ValueError):
+            self._create_backend(overflow='block')
+
+    @patch.object(BufferedBackend, '_ensure_worker')
+    def test_backend_error_is_logged(self, _mock_ensure_worker):
+        backend = self._create_backend()
+        backend.send({'test': 1})
+        with patch.object(RecordingBackend, 'send_many', side_effect=Exception):
+            with patch('track.backends.buffered.log') as mock_log:
+                backend.flush()
+        self.assertTrue(mock_log.exception.called)
+        self.assertTrue(backend.queue.empty())
@@ -380,9 +380,12 @@ class ContentStore(object):
         """
         raise NotImplementedError
 
-    def copy_all_course_assets(self, source_course_key, dest_course_key):
+    def copy_all_course_assets(self, source_course_key, dest_course_key, progress_callback=None):
         """
         Copy all the course assets from source_course_key to dest_course_key
+
+        If given, progress_callback is called with the number of assets copied so far and
+        the total number of assets to copy, as the copy progresses.
         """
         raise NotImplementedError
 
@@ -1,16 +1,20 @@
 """
 MongoDB/GridFS-level code for the contentstore.
 """
+import datetime
 import os
 import json
+import re
 import pymongo
 import gridfs
 from gridfs.errors import NoFile
 from fs.osfs import OSFS
 from bson.son import SON
+from pytz import UTC
 
 from mongodb_proxy import autoretry_read
 from opaque_keys.edx.keys import AssetKey
+from opaque_keys.edx.locator import AssetLocator
 from xmodule.contentstore.content import XASSET_LOCATION_TAG
 from xmodule.exceptions import NotFoundError
 from xmodule.modulestore.django import ASSET_IGNORE_REGEX
@@ -18,6 +22,12 @@ from xmodule.util.misc import escape_invalid_characters
 from xmodule.mongo_utils import connect_to_mongodb, create_collection_index
 from .content import StaticContent, ContentStore, StaticContentStream
 
+# Maximum number of GridFS file or chunk documents inserted at once when copying assets.
+ASSET_COPY_BATCH_SIZE = 32
+
+# Maximum number of assets updated at once when storing their lowercase displayname.
+ASSET_DISPLAYNAME_BATCH_SIZE = 1000
+
 
 class MongoContentStore(ContentStore):
     """
@@ -89,7 +99,9 @@ class MongoContentStore(ContentStore):
 
         thumbnail_location = content.thumbnail_location.to_deprecated_list_repr() if content.thumbnail_location else None
         with self.fs.new_file(_id=content_id, filename=unicode(content.location), content_type=content.content_type,
-                              displayname=content.name, content_son=content_son,
+                              displayname=content.name,
+                              displayname_insensitive=insensitive_displayname(content.name),
+                              content_son=content_son,
                               thumbnail_location=thumbnail_location,
                               import_path=content.import_path,
                               # getattr b/c caching may mean some pickled instances don't have attr
@@ -247,65 +259,35 @@ class MongoContentStore(ContentStore):
             contentType: The mimetype string of the asset
             md5: An md5 hash of the asset content
         '''
-        # TODO: Using an aggregate() instead of a find() here is a hack to get around the fact that Mongo 3.2 does not
-        # support sorting case-insensitively.
-        # If a sort on displayname is requested, the aggregation pipeline creates a new field:
-        # `insensitive_displayname`, a lowercase version of `displayname` that is sorted on instead.
-        # Mongo 3.4 does not require this hack. When upgraded, change this aggregation back to a find and specifiy
-        # a collation based on user's language locale instead.
-        # See: https://openedx.atlassian.net/browse/EDUCATOR-2221
-        pipeline_stages = []
         query = query_for_course(course_key, 'asset' if not get_thumbnails else 'thumbnail')
         if filter_params:
             query.update(filter_params)
-        pipeline_stages.append({'$match': query})
 
+        # The total is counted separately, so that only the requested page of assets is ever read. It is
+        # not cached: assets are saved, deleted and relocked by many processes (uploads, imports, reruns,
+        # the asset trashcan), and a stale total would page past the assets which are really there.
+        count = self.fs_files.find(query).count()
+        if count == 0 or (maxresults > 0 and start >= count):
+            return [], count
+
+        cursor = self.fs_files.find(query)
         if sort:
-            sort = dict(sort)
-            if 'displayname' in sort:
-                pipeline_stages.append({
-                    '$project': {
-                        'contentType': 1,
-                        'locked': 1,
-                        'chunkSize': 1,
-                        'content_son': 1,
-                        'displayname': 1,
-                        'filename': 1,
-                        'length': 1,
-                        'import_path': 1,
-                        'uploadDate': 1,
-                        'thumbnail_location': 1,
-                        'md5': 1,
-                        'insensitive_displayname': {
-                            '$toLower': '$displayname'
-                        }
-                    }
-                })
-                sort = {'insensitive_displayname': sort['displayname']}
-            pipeline_stages.append({'$sort': sort})
-
-        # This is another hack to get the total query result count, but only the Nth page of actual documents
-        # See: https://stackoverflow.com/a/39784851/6620612
-        pipeline_stages.append({'$group': {'_id': None, 'count': {'$sum': 1}, 'results': {'$push': '$$ROOT'}}})
+            # Mongo 3.2 does not support sorting case-insensitively, so displayname sorts use the
+            # lowercase copy of the displayname stored alongside it, which is indexed like displayname.
+            # Assets saved before it was stored get it from the backfill_asset_displaynames command.
+            # Mongo 3.4 does not require this. When upgraded, sort on displayname with a collation
+            # based on user's language locale instead.
+            # See: https://openedx.atlassian.net/browse/EDUCATOR-2221
+            sort = [
+                ('displayname_insensitive' if field == 'displayname' else field, direction)
+                for field, direction in (sort.items() if isinstance(sort, dict) else sort)
+            ]
+            cursor = cursor.sort(sort)
+        if start > 0:
+            cursor = cursor.skip(start)
         if maxresults > 0:
-            pipeline_stages.append({
-                '$project': {
-                    'count': 1,
-                    'results': {
-                        '$slice': ['$results', start, maxresults]
-                    }
-                }
-            })
-
-        items = self.fs_files.aggregate(pipeline_stages)
-        if items['result']:
-            result = items['result'][0]
-            count = result['count']
-            assets = list(result['results'])
-        else:
-            # no results
-            count = 0
-            assets = []
+            cursor = cursor.limit(maxresults)
+        assets = list(cursor)
 
         # We're constructing the asset key immediately after retrieval from the database so that
         # callers are insulated from knowing how our identifiers are stored.
@@ -314,6 +296,41 @@ class MongoContentStore(ContentStore):
             asset['asset_key'] = course_key.make_asset_key(asset_id['category'], asset_id['name'])
         return assets, count
 
+    def add_missing_insensitive_displaynames(self):
+        """
+        Stores the lowercase displayname of all the assets which were saved without one, so that they are
+        sorted by displayname with the others. The assets are updated by _id in unordered bulk updates,
+        each of at most ASSET_DISPLAYNAME_BATCH_SIZE assets of a single course.
+
+        Returns the number of assets updated.
+        """
+        missing_query = {'displayname_insensitive': {'$exists': False}}
+
+        def store_insensitive_displaynames(assets):
+            """
+            Stores the lowercase displayname of the given assets, and returns the number of them updated.
+            """
+            bulk = self.fs_files.initialize_unordered_bulk_op()
+            for asset in assets:
+                # Assets without a displayname are stored as such, so that they aren't looked up again.
+                bulk.find(dict(missing_query, _id=asset['_id'])).update_one(
+                    {'$set': {'displayname_insensitive': insensitive_displayname(asset.get('displayname')) or None}}
+                )
+            return bulk.execute()['nMatched']
+
+        updated = 0
+        batch, batch_course = [], None
+        for asset in self.fs_files.find(missing_query, {'_id': True, 'displayname': True}):
+            asset_course = asset_course_key(self.make_id_son(asset))
+            if batch and (asset_course != batch_course or len(batch) >= ASSET_DISPLAYNAME_BATCH_SIZE):
+                updated += store_insensitive_displaynames(batch)
+                batch = []
+            batch.append(asset)
+            batch_course = asset_course
+        if batch:
+            updated += store_insensitive_displaynames(batch)
+        return updated
+
     def set_attr(self, asset_key, attr, value=True):
         """
         Add/set the given attr on the asset at the given location. Does not allow overwriting gridFS built in
@@ -352,6 +369,8 @@ class MongoContentStore(ContentStore):
         for attr in attr_dict.iterkeys():
             if attr in ['_id', 'md5', 'uploadDate', 'length']:
                 raise AttributeError("{} is a protected attribute.".format(attr))
+        if 'displayname' in attr_dict:
+            attr_dict = dict(attr_dict, displayname_insensitive=insensitive_displayname(attr_dict['displayname']))
         asset_db_key, __ = self.asset_db_key(location)
         # catch upsert error and raise NotFoundError if asset doesn't exist
         result = self.fs_files.update({'_id': asset_db_key}, {"$set": attr_dict}, upsert=False)
@@ -375,21 +394,39 @@ class MongoContentStore(ContentStore):
             raise NotFoundError(asset_db_key)
         return item
 
-    def copy_all_course_assets(self, source_course_key, dest_course_key):
+    def copy_all_course_assets(self, source_course_key, dest_course_key, progress_callback=None):
         """
         See :meth:`.ContentStore.copy_all_course_assets`
 
-        This implementation fairly expensively copies all of the data
+        This implementation copies the GridFS file and chunk documents of the assets as they are,
+        in batches, rather than reading each file and writing it back through GridFS.
         """
         source_query = query_for_course(source_course_key)
-        # it'd be great to figure out how to do all of this on the db server and not pull the bits over
+        total = self.fs_files.find(source_query).count()
+        copied = 0
+        files = []
+        chunks = []
+
+        def flush():
+            """
+            Inserts the pending chunks, then the files they belong to, so that no file is visible before its content.
+            """
+            if chunks:
+                self.chunks.insert(chunks)
+                del chunks[:]
+            if files:
+                self.fs_files.insert(files)
+                del files[:]
+            if progress_callback is not None:
+                progress_callback(copied, total)
+
         for asset in self.fs_files.find(source_query):
-            asset_key = self.make_id_son(asset)
-            # don't convert from string until fs access
-            source_content = self.fs.get(asset_key)
-            if isinstance(asset_key, basestring):
-                asset_key = AssetKey.from_string(asset_key)
-                __, asset_key = self.asset_db_key(asset_key)
+            # the chunks refer to the file _id as it is stored, in the field order of the store
+            source_id = self.make_id_son(asset)
+            if isinstance(source_id, basestring):
+                __, asset_key = self.asset_db_key(AssetKey.from_string(source_id))
+            else:
+                asset_key = SON(source_id)
             asset_key['org'] = dest_course_key.org
             asset_key['course'] = dest_course_key.course
             if getattr(dest_course_key, 'deprecated', False):  # remove the run if exists
@@ -402,17 +439,35 @@ class MongoContentStore(ContentStore):
                     dest_course_key.make_asset_key(asset_key['category'], asset_key['name']).for_branch(None)
                 )
 
-            self.fs.put(
-                source_content.read(),
-                _id=asset_id, filename=asset['filename'], content_type=asset['contentType'],
-                displayname=asset['displayname'], content_son=asset_key,
+            for chunk in self.chunks.find({'files_id': source_id}, {'_id': False}):
+                chunk['files_id'] = asset_id
+                chunks.append(chunk)
+                if len(chunks) >= ASSET_COPY_BATCH_SIZE:
+                    self.chunks.insert(chunks)
+                    del chunks[:]
+
+            files.append({
+                '_id': asset_id,
+                'filename': asset['filename'],
+                'contentType': asset['contentType'],
+                'displayname': asset['displayname'],
+                'displayname_insensitive': insensitive_displayname(asset['displayname']),
+                'content_son': asset_key,
                 # thumbnail is not technically correct but will be functionally correct as the code
                 # only looks at the name which is not course relative.
-                thumbnail_location=asset['thumbnail_location'],
-                import_path=asset['import_path'],
+                'thumbnail_location': asset['thumbnail_location'],
+                'import_path': asset['import_path'],
                 # getattr b/c caching may mean some pickled instances don't have attr
-                locked=asset.get('locked', False)
-            )
+                'locked': asset.get('locked', False),
+                'chunkSize': asset['chunkSize'],
+                'length': asset['length'],
+                'md5': asset.get('md5'),
+                'uploadDate': datetime.datetime.now(UTC),
+            })
+            copied += 1
+            if len(files) >= ASSET_COPY_BATCH_SIZE:
+                flush()
+        flush()
 
     def delete_all_course_assets(self, course_key):
         """
@@ -426,6 +481,9 @@ class MongoContentStore(ContentStore):
             asset_key = self.make_id_son(asset)
             self.fs.delete(asset_key)
 
+        # Chunks copied by an interrupted copy_all_course_assets may have no file document.
+        self.chunks.remove(chunks_query_for_course(course_key))
+
     # codifying the original order which pymongo used for the dicts coming out of location_to_dict
     # stability of order is more important than sanity of order as any changes to order make things
     # unfindable
@@ -557,6 +615,59 @@ class MongoContentStore(ContentStore):
             sparse=True,
             background=True
         )
+        create_collection_index(
+            self.fs_files,
+            [
+                ('_id.org', pymongo.ASCENDING),
+                ('_id.course', pymongo.ASCENDING),
+                ('displayname_insensitive', pymongo.ASCENDING)
+            ],
+            sparse=True,
+            background=True
+        )
+        create_collection_index(
+            self.fs_files,
+            [
+                ('content_son.org', pymongo.ASCENDING),
+                ('content_son.course', pymongo.ASCENDING),
+                ('displayname_insensitive', pymongo.ASCENDING)
+            ],
+            sparse=True,
+            background=True
+        )
+
+
+def insensitive_displayname(displayname):
+    """
+    Returns the lowercase version of the displayname which is stored to sort assets case-insensitively.
+    """
+    return displayname.lower() if displayname else displayname
+
+
+def asset_course_key(asset_id):
+    """
+    Returns a key identifying the course of the asset with the given _id, as made by make_id_son.
+    """
+    if isinstance(asset_id, basestring):
+        return AssetKey.from_string(asset_id).course_key
+    return asset_id['org'], asset_id['course'], asset_id.get('run')
+
+
+def chunks_query_for_course(course_key):
+    """
+    Construct a query for all the GridFS chunks of the assets of the course, by the
+    files_id they refer to, which is the _id of the asset's file document.
+    """
+    if getattr(course_key, 'deprecated', False):
+        return SON([
+            ('files_id.{}'.format(field[len('_id.'):]), value)
+            for field, value in query_for_course(course_key).iteritems()
+        ])
+    # non deprecated asset ids are strings, which all start with the course's part of the key
+    course_prefix = u'{}:{}+{}+{}+'.format(
+        AssetLocator.CANONICAL_NAMESPACE, course_key.org, course_key.course, course_key.run
+    )
+    return {'files_id': {'$regex': u'^{}'.format(re.escape(course_prefix))}}
 
 
 def query_for_course(course_key, category=None):
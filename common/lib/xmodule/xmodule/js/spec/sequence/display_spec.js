@@ -121,5 +121,25 @@
                 });
             });
         });
+
+        describe('Lazy units', function() {
+            it('initializes the blocks of a lazily loaded unit with its own request token', function() {
+                var placeholder = $('<div class="seq-lazy-unit" data-view-url="/xblock/unit"></div>'),
+                    tab = $('<div></div>');
+                spyOn($, 'getJSON').and.returnValue($.Deferred().resolve({
+                    html: '<div class="xblock xblock-student_view" data-request-token="lazy-token"></div>',
+                    resources: []
+                }).promise());
+                this.sequence.content_container.html(placeholder);
+
+                this.sequence.loadLazyUnit(placeholder, tab);
+
+                expect($.getJSON).toHaveBeenCalledWith('/xblock/unit');
+                expect(local.XBlock.initializeBlocks).toHaveBeenCalledWith(
+                    this.sequence.content_container, 'lazy-token'
+                );
+                expect(tab.text()).toContain('lazy-token');
+            });
+        });
     });
 }).call(this);
@@ -38,6 +38,9 @@
             this.displayTabTooltip = function(event) {
                 return Sequence.prototype.displayTabTooltip.apply(self, [event]);
             };
+            this.loadLazyUnit = function(placeholder, tab) {
+                return Sequence.prototype.loadLazyUnit.apply(self, [placeholder, tab]);
+            };
             this.arrowKeys = {
                 LEFT: 37,
                 UP: 38,
@@ -225,7 +228,7 @@
         };
 
         Sequence.prototype.render = function(newPosition) {
-            var bookmarked, currentTab, modxFullUrl, sequenceLinks,
+            var bookmarked, currentTab, lazyUnit, modxFullUrl, sequenceLinks,
                 self = this;
             if (this.position !== newPosition) {
                 if (this.position) {
@@ -264,7 +267,14 @@
                             .data('attempts-used', latestResponse.attempts_used);
                     });
                 }
-                XBlock.initializeBlocks(this.content_container, this.requestToken);
+                this.initializeUnitBlocks();
+
+                // Units other than the initially active one may be rendered lazily,
+                // in which case they are fetched the first time they are shown.
+                lazyUnit = this.content_container.find('.seq-lazy-unit');
+                if (lazyUnit.length) {
+                    this.loadLazyUnit(lazyUnit, currentTab);
+                }
 
                 // For embedded circuit simulator exercises in 6.002x
                 if (window.hasOwnProperty('update_schematics')) {
@@ -281,6 +291,30 @@
             }
         };
 
+        Sequence.prototype.loadLazyUnit = function(placeholder, tab) {
+            var self = this;
+            $.getJSON(placeholder.data('view-url')).done(function(data) {
+                XBlock.addFragmentResources(data.resources).done(function() {
+                    // Keep the rendered unit so it is not fetched again.
+                    tab.text(data.html);
+                    // Only display it if the learner has not navigated away meanwhile.
+                    if ($.contains(self.content_container[0], placeholder[0])) {
+                        self.content_container.html(data.html);
+                        self.initializeUnitBlocks();
+                        self.hookUpContentStateChangeEvent();
+                        self.content_container.find('a.seqnav').click(self.goto);
+                    }
+                });
+            });
+        };
+
+        Sequence.prototype.initializeUnitBlocks = function() {
+            // Lazily loaded units are rendered by their own xblock_view request,
+            // so their blocks carry that request's token rather than the sequence's.
+            var requestToken = this.content_container.find('.xblock').first().data('request-token');
+            XBlock.initializeBlocks(this.content_container, requestToken || this.requestToken);
+        };
+
         Sequence.prototype.goto = function(event) {
             var alertTemplate, alertText, isBottomNav, newPosition, widgetPlacement;
             event.preventDefault();
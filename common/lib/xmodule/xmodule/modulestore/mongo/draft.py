@@ -171,7 +171,7 @@ class DraftModuleStore(MongoModuleStore):
 
         self._emit_course_deleted_signal(course_key)
 
-    def clone_course(self, source_course_id, dest_course_id, user_id, fields=None, **kwargs):
+    def clone_course(self, source_course_id, dest_course_id, user_id, fields=None, copy_assets=True, **kwargs):
         """
         Only called if cloning within this store or if env doesn't set up mixed.
         * copy the courseware
@@ -195,7 +195,9 @@ class DraftModuleStore(MongoModuleStore):
                 )
 
             # clone the assets
-            super(DraftModuleStore, self).clone_course(source_course_id, dest_course_id, user_id, fields)
+            super(DraftModuleStore, self).clone_course(
+                source_course_id, dest_course_id, user_id, fields, copy_assets=copy_assets
+            )
 
             # get the whole old course
             new_course = self.get_course(dest_course_id)
@@ -29,7 +29,72 @@ def path_to_location(modulestore, usage_key, full_path=False):
     If the section is a sequential or vertical, position will be the children index
     of this location under that sequence.
     '''
+    def get_child_locations(section_location):
+        '''Return the locations of the children of the given section.'''
+        section_desc = modulestore.get_item(section_location)
+        # this calls get_children rather than just children b/c old mongo includes private children
+        # in children but not in get_children
+        return [c.location for c in section_desc.get_children()]
 
+    with modulestore.bulk_operations(usage_key.course_key):
+        if not modulestore.has_item(usage_key):
+            raise ItemNotFoundError(usage_key)
+
+        # get_parent_location raises ItemNotFoundError if location isn't found
+        path = _find_path_to_course(usage_key, modulestore.get_parent_location)
+        if path is None:
+            raise NoPathToItem(usage_key)
+
+        if full_path:
+            return path
+
+        return _location_from_path(path, get_child_locations)
+
+
+def path_to_location_in_structure(block_structure, usage_key, full_path=False):
+    '''
+    Same as path_to_location, but computed in memory from a collected block
+    structure of the course, using its parent and children relations instead
+    of modulestore lookups.
+
+    Args:
+        block_structure: a block structure containing usage_key, supporting
+            `in`, get_parents and get_children.
+        usage_key: :class:`UsageKey` the id of the location to which to generate the path
+        full_path: :class:`Bool` if True, return the full path to location. Default is False.
+
+    Raises
+        ItemNotFoundError if the location isn't in the block structure.
+        NoPathToItem if the location isn't accessible via a chapter/section
+            path in the course.
+    '''
+    if usage_key not in block_structure:
+        raise ItemNotFoundError(usage_key)
+
+    def get_parent_location(location):
+        '''Return the first parent of the given location, or None.'''
+        parents = block_structure.get_parents(location)
+        return parents[0] if parents else None
+
+    path = _find_path_to_course(usage_key, get_parent_location)
+    if path is None:
+        raise NoPathToItem(usage_key)
+
+    if full_path:
+        return path
+
+    return _location_from_path(path, block_structure.get_children)
+
+
+def _find_path_to_course(usage_key, get_parent_location):
+    '''Find a path up the location graph to a node with the
+    specified category.
+
+    If no path exists, return None.
+
+    If a path exists, return it as a tuple with root location first, and
+    the target location last.
+    '''
     def flatten(xs):
         '''Convert lisp-style (a, (b, (c, ()))) list into a python list.
         Not a general flatten function. '''
@@ -39,80 +104,64 @@ def path_to_location(modulestore, usage_key, full_path=False):
             xs = xs[1]
         return p
 
-    def find_path_to_course():
-        '''Find a path up the location graph to a node with the
-        specified category.
-
-        If no path exists, return None.
-
-        If a path exists, return it as a tuple with root location first, and
-        the target location last.
-        '''
-        # Standard DFS
-
-        # To keep track of where we came from, the work queue has
-        # tuples (location, path-so-far).  To avoid lots of
-        # copying, the path-so-far is stored as a lisp-style
-        # list--nested hd::tl tuples, and flattened at the end.
-        queue = [(usage_key, ())]
-        while len(queue) > 0:
-            (next_usage, path) = queue.pop()  # Takes from the end
-
-            # get_parent_location raises ItemNotFoundError if location isn't found
-            parent = modulestore.get_parent_location(next_usage)
-
-            # print 'Processing loc={0}, path={1}'.format(next_usage, path)
-            if next_usage.block_type == "course":
-                # Found it!
-                path = (next_usage, path)
-                return flatten(path)
-            elif parent is None:
-                # Orphaned item.
-                return None
-
-            # otherwise, add parent locations at the end
-            newpath = (next_usage, path)
-            queue.append((parent, newpath))
+    # Standard DFS
 
-    with modulestore.bulk_operations(usage_key.course_key):
-        if not modulestore.has_item(usage_key):
-            raise ItemNotFoundError(usage_key)
+    # To keep track of where we came from, the work queue has
+    # tuples (location, path-so-far).  To avoid lots of
+    # copying, the path-so-far is stored as a lisp-style
+    # list--nested hd::tl tuples, and flattened at the end.
+    queue = [(usage_key, ())]
+    while len(queue) > 0:
+        (next_usage, path) = queue.pop()  # Takes from the end
 
-        path = find_path_to_course()
-        if path is None:
-            raise NoPathToItem(usage_key)
+        parent = get_parent_location(next_usage)
+
+        # print 'Processing loc={0}, path={1}'.format(next_usage, path)
+        if next_usage.block_type == "course":
+            # Found it!
+            path = (next_usage, path)
+            return flatten(path)
+        elif parent is None:
+            # Orphaned item.
+            return None
+
+        # otherwise, add parent locations at the end
+        newpath = (next_usage, path)
+        queue.append((parent, newpath))
 
-        if full_path:
-            return path
 
-        n = len(path)
-        course_id = path[0].course_key
-        # pull out the location names
-        chapter = path[1].block_id if n > 1 else None
-        section = path[2].block_id if n > 2 else None
-        vertical = path[3].block_id if n > 3 else None
-        # Figure out the position
-        position = None
-
-        # This block of code will find the position of a module within a nested tree
-        # of modules. If a problem is on tab 2 of a sequence that's on tab 3 of a
-        # sequence, the resulting position is 3_2. However, no positional modules
-        # (e.g. sequential and videosequence) currently deal with this form of
-        # representing nested positions. This needs to happen before jumping to a
-        # module nested in more than one positional module will work.
-        if n > 3:
-            position_list = []
-            for path_index in range(2, n - 1):
-                category = path[path_index].block_type
-                if category == 'sequential' or category == 'videosequence':
-                    section_desc = modulestore.get_item(path[path_index])
-                    # this calls get_children rather than just children b/c old mongo includes private children
-                    # in children but not in get_children
-                    child_locs = [c.location for c in section_desc.get_children()]
-                    # positions are 1-indexed, and should be strings to be consistent with
-                    # url parsing.
-                    position_list.append(str(child_locs.index(path[path_index + 1]) + 1))
-            position = "_".join(position_list)
+def _location_from_path(path, get_child_locations):
+    '''
+    Return the (course_id, chapter, section, vertical, position, location)
+    tuple of path_to_location for the given path from the course down to a
+    location. get_child_locations returns the ordered child locations of a
+    sequence.
+    '''
+    n = len(path)
+    course_id = path[0].course_key
+    # pull out the location names
+    chapter = path[1].block_id if n > 1 else None
+    section = path[2].block_id if n > 2 else None
+    vertical = path[3].block_id if n > 3 else None
+    # Figure out the position
+    position = None
+
+    # This block of code will find the position of a module within a nested tree
+    # of modules. If a problem is on tab 2 of a sequence that's on tab 3 of a
+    # sequence, the resulting position is 3_2. However, no positional modules
+    # (e.g. sequential and videosequence) currently deal with this form of
+    # representing nested positions. This needs to happen before jumping to a
+    # module nested in more than one positional module will work.
+    if n > 3:
+        position_list = []
+        for path_index in range(2, n - 1):
+            category = path[path_index].block_type
+            if category == 'sequential' or category == 'videosequence':
+                child_locs = get_child_locations(path[path_index])
+                # positions are 1-indexed, and should be strings to be consistent with
+                # url parsing.
+                position_list.append(str(child_locs.index(path[path_index + 1]) + 1))
+        position = "_".join(position_list)
 
     return (course_id, chapter, section, vertical, position, path[-1])
 
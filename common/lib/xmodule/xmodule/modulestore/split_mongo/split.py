@@ -1879,7 +1879,7 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
         # don't need to update the index b/c create_item did it for this version
         return xblock
 
-    def clone_course(self, source_course_id, dest_course_id, user_id, fields=None, **kwargs):
+    def clone_course(self, source_course_id, dest_course_id, user_id, fields=None, copy_assets=True, **kwargs):
         """
         See :meth: `.ModuleStoreWrite.clone_course` for documentation.
 
@@ -1901,7 +1901,9 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
                 **kwargs
             )
             # don't copy assets until we create the course in case something's awry
-            super(SplitMongoModuleStore, self).clone_course(source_course_id, dest_course_id, user_id, fields, **kwargs)
+            super(SplitMongoModuleStore, self).clone_course(
+                source_course_id, dest_course_id, user_id, fields, copy_assets=copy_assets, **kwargs
+            )
             return new_course
 
     DEFAULT_ROOT_COURSE_BLOCK_ID = 'course'
@@ -2486,7 +2488,8 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
 
         If any of the blocks specified already exist as children of the destination block, they
         will be updated rather than duplicated or replaced. If they have Scope.settings field values
-        overriding inherited default values, those overrides will be preserved.
+        overriding inherited default values, those overrides will be preserved. Blocks whose source
+        block has not changed since they were last copied are left as they are.
 
         IMPORTANT: This method does not preserve block_id - in other words, every block that is
         copied will be assigned a new block_id. This is because we assume that the same source block
@@ -2520,11 +2523,18 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
             if index_entry is None:
                 raise ItemNotFoundError(destination_course)
             dest_structure = self._lookup_course(destination_course).structure
+            block_key = BlockKey(dest_usage.block_type, dest_usage.block_id)
+            if self._template_copies_unchanged(source_structures, source_keys, dest_structure, block_key):
+                # Nothing changed since the blocks were last copied, so neither the structure
+                # nor the destination block gets a new version.
+                return [
+                    destination_course.make_usage_key(*k)
+                    for k in dest_structure['blocks'][block_key].fields['children']
+                ]
             old_dest_structure_version = dest_structure['_id']
             dest_structure = self.version_structure(destination_course, dest_structure, user_id)
 
             # Set of all descendent block IDs of dest_usage that are to be replaced:
-            block_key = BlockKey(dest_usage.block_type, dest_usage.block_id)
             orig_descendants = set(self.descendants(dest_structure['blocks'], block_key, depth=None, descendent_map={}))
             # The descendants() method used above adds the block itself, which we don't consider a descendant.
             orig_descendants.remove(block_key)
@@ -2567,7 +2577,6 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
 
         for usage_key in source_keys:
             src_course_key = usage_key.course_key
-            hashable_source_id = src_course_key.for_version(None)
             block_key = BlockKey(usage_key.block_type, usage_key.block_id)
             source_structure = source_structures[src_course_key]
 
@@ -2575,59 +2584,29 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
                 raise ItemNotFoundError(usage_key)
             source_block_info = source_structure['blocks'][block_key]
 
-            # Compute a new block ID. This new block ID must be consistent when this
-            # method is called with the same (source_key, dest_structure) pair
-            unique_data = "{}:{}:{}".format(
-                unicode(hashable_source_id).encode("utf-8"),
-                block_key.id,
-                new_parent_block_key.id,
-            )
-            new_block_id = hashlib.sha1(unique_data).hexdigest()[:20]
-            new_block_key = BlockKey(block_key.type, new_block_id)
-
-            # Now clone block_key to new_block_key:
-            new_block_info = copy.deepcopy(source_block_info)
-            # Note that new_block_info now points to the same definition ID entry as source_block_info did
-            existing_block_info = dest_structure['blocks'].get(new_block_key, BlockData())
-            # Inherit the Scope.settings values from 'fields' to 'defaults'
-            new_block_info.defaults = new_block_info.fields
-
-            # <workaround>
-            # CAPA modules store their 'markdown' value (an alternate representation of their content)
-            # in Scope.settings rather than Scope.content :-/
-            # markdown is a field that really should not be overridable - it fundamentally changes the content.
-            # capa modules also use a custom editor that always saves their markdown field to the metadata,
-            # even if it hasn't changed, which breaks our override system.
-            # So until capa modules are fixed, we special-case them and remove their markdown fields,
-            # forcing the inherited version to use XML only.
-            if usage_key.block_type == 'problem' and 'markdown' in new_block_info.defaults:
-                del new_block_info.defaults['markdown']
-            # </workaround>
-
-            # Preserve any existing overrides
-            new_block_info.fields = existing_block_info.fields
-
-            if 'children' in new_block_info.defaults:
-                del new_block_info.defaults['children']  # Will be set later
-
-            new_block_info.edit_info = existing_block_info.edit_info
-            new_block_info.edit_info.previous_version = new_block_info.edit_info.update_version
-            new_block_info.edit_info.update_version = dest_structure['_id']
-            # Note we do not set 'source_version' - it's only used for copying identical blocks
-            # from draft to published as part of publishing workflow.
-            # Setting it to the source_block_info structure version here breaks split_draft's has_changes() method.
-            new_block_info.edit_info.edited_by = user_id
-            new_block_info.edit_info.edited_on = datetime.datetime.now(UTC)
-            new_block_info.edit_info.original_usage = unicode(usage_key.replace(branch=None, version_guid=None))
-            new_block_info.edit_info.original_usage_version = source_block_info.edit_info.update_version
-            dest_structure['blocks'][new_block_key] = new_block_info
+            new_block_key = self._template_copy_block_key(usage_key, new_parent_block_key)
+            existing_block_info = dest_structure['blocks'].get(new_block_key)
+            if self._template_copy_unchanged(usage_key, source_block_info, existing_block_info):
+                # The source block hasn't changed since it was last copied, so its copy, which shares its
+                # definition, is kept as it is. Only its children are brought up to date below.
+                new_block_info = existing_block_info
+                refreshed = False
+            else:
+                new_block_info = self._copy_template_block(
+                    source_block_info, usage_key, existing_block_info or BlockData(), dest_structure, user_id
+                )
+                dest_structure['blocks'][new_block_key] = new_block_info
+                refreshed = True
 
             children = source_block_info.fields.get('children')
             if children:
+                previous_children = new_block_info.fields.get('children')
                 children = [src_course_key.make_usage_key(child.type, child.id) for child in children]
                 new_blocks |= self._copy_from_template(
                     source_structures, children, dest_structure, new_block_key, user_id, head_validation
                 )
+                if not refreshed and new_block_info.fields['children'] != previous_children:
+                    self.version_block(new_block_info, user_id, dest_structure['_id'])
 
             new_blocks.add(new_block_key)
             # And add new_block_key to the list of new_parent_block_key's new children:
@@ -2638,6 +2617,102 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
 
         return new_blocks
 
+    @staticmethod
+    def _template_copy_block_key(usage_key, new_parent_block_key):
+        """
+        Returns the BlockKey of the copy of the source block made by copy_from_template() under the given parent.
+        """
+        # Compute a new block ID. This new block ID must be consistent when this
+        # method is called with the same (source_key, dest_structure) pair
+        unique_data = "{}:{}:{}".format(
+            unicode(usage_key.course_key.for_version(None)).encode("utf-8"),
+            usage_key.block_id,
+            new_parent_block_key.id,
+        )
+        new_block_id = hashlib.sha1(unique_data).hexdigest()[:20]
+        return BlockKey(usage_key.block_type, new_block_id)
+
+    @staticmethod
+    def _template_copy_unchanged(usage_key, source_block_info, existing_block_info):
+        """
+        Returns whether the existing copy of the source block is from the current version of the source block.
+        """
+        original_usage = unicode(usage_key.replace(branch=None, version_guid=None))
+        return (
+            existing_block_info is not None and
+            existing_block_info.edit_info.original_usage == original_usage and
+            existing_block_info.edit_info.original_usage_version == source_block_info.edit_info.update_version
+        )
+
+    def _template_copies_unchanged(self, source_structures, source_keys, dest_structure, parent_block_key):
+        """
+        Returns whether copy_from_template() would leave the copies of the source blocks, and of their
+        descendants, under the given parent as they are.
+        """
+        expected_children = []
+        for usage_key in source_keys:
+            source_block_info = source_structures[usage_key.course_key]['blocks'].get(
+                BlockKey(usage_key.block_type, usage_key.block_id)
+            )
+            if source_block_info is None:
+                return False
+            new_block_key = self._template_copy_block_key(usage_key, parent_block_key)
+            if not self._template_copy_unchanged(
+                    usage_key, source_block_info, dest_structure['blocks'].get(new_block_key)
+            ):
+                return False
+            children = source_block_info.fields.get('children')
+            if children and not self._template_copies_unchanged(
+                    source_structures,
+                    [usage_key.course_key.make_usage_key(child.type, child.id) for child in children],
+                    dest_structure,
+                    new_block_key,
+            ):
+                return False
+            expected_children.append(new_block_key)
+        return dest_structure['blocks'][parent_block_key].fields.get('children', []) == expected_children
+
+    def _copy_template_block(self, source_block_info, usage_key, existing_block_info, dest_structure, user_id):
+        """
+        Returns a copy of the source block for copy_from_template(), sharing its definition, with the
+        Scope.settings overrides and edit info of the existing copy.
+        """
+        # Now clone block_key to new_block_key:
+        new_block_info = copy.deepcopy(source_block_info)
+        # Note that new_block_info now points to the same definition ID entry as source_block_info did
+        # Inherit the Scope.settings values from 'fields' to 'defaults'
+        new_block_info.defaults = new_block_info.fields
+
+        # <workaround>
+        # CAPA modules store their 'markdown' value (an alternate representation of their content)
+        # in Scope.settings rather than Scope.content :-/
+        # markdown is a field that really should not be overridable - it fundamentally changes the content.
+        # capa modules also use a custom editor that always saves their markdown field to the metadata,
+        # even if it hasn't changed, which breaks our override system.
+        # So until capa modules are fixed, we special-case them and remove their markdown fields,
+        # forcing the inherited version to use XML only.
+        if usage_key.block_type == 'problem' and 'markdown' in new_block_info.defaults:
+            del new_block_info.defaults['markdown']
+        # </workaround>
+
+        # Preserve any existing overrides
+        new_block_info.fields = existing_block_info.fields
+
+        if 'children' in new_block_info.defaults:
+            del new_block_info.defaults['children']  # Will be set later
+
+        new_block_info.edit_info = existing_block_info.edit_info
+        new_block_info.edit_info.previous_version = new_block_info.edit_info.update_version
+        new_block_info.edit_info.update_version = dest_structure['_id']
+        # Note we do not set 'source_version' - it's only used for copying identical blocks
+        # from draft to published as part of publishing workflow.
+        # Setting it to the source_block_info structure version here breaks split_draft's has_changes() method.
+        new_block_info.edit_info.edited_by = user_id
+        new_block_info.edit_info.edited_on = datetime.datetime.now(UTC)
+        new_block_info.edit_info.original_usage = unicode(usage_key.replace(branch=None, version_guid=None))
+        new_block_info.edit_info.original_usage_version = source_block_info.edit_info.update_version
+        return new_block_info
+
     def delete_item(self, usage_locator, user_id, force=False):
         """
         Delete the block or tree rooted at block (if delete_children) and any references w/in the course to the block
@@ -341,6 +341,12 @@ class DraftVersioningModuleStore(SplitMongoModuleStore, ModuleStoreDraftAndPubli
 
         draft_course = get_course(ModuleStoreEnum.BranchName.draft)
         published_course = get_course(ModuleStoreEnum.BranchName.published)
+        block_key = BlockKey.from_usage_key(xblock.location)
+
+        changed_blocks = self._get_cached_changed_blocks(xblock.location.course_key, draft_course, published_course)
+        if changed_blocks is not None:
+            # A block missing from the draft structure counts as changed, as in the subtree walk
+            return block_key not in draft_course['blocks'] or block_key in changed_blocks
 
         def has_changes_subtree(block_key):
             draft_block = get_block(draft_course, block_key)
@@ -362,7 +368,69 @@ class DraftVersioningModuleStore(SplitMongoModuleStore, ModuleStoreDraftAndPubli
 
             return False
 
-        return has_changes_subtree(BlockKey.from_usage_key(xblock.location))
+        return has_changes_subtree(block_key)
+
+    def _get_cached_changed_blocks(self, course_key, draft_course, published_course):
+        """
+        Returns the set of keys of the blocks which have unpublished changes, in
+        themselves or in any of their descendants, for the given draft and
+        published structures of the course.
+
+        The set is computed once per pair of structure versions and kept in the
+        request cache. Returns None if there is no request cache, or if either
+        structure is being edited in an active bulk operation, since such a
+        structure is modified in place without getting a new version.
+        """
+        if self.request_cache is None:
+            return None
+
+        bulk_write_record = self._get_bulk_ops_record(course_key)
+        if bulk_write_record.active and bulk_write_record.dirty_branches:
+            return None
+
+        cache = self.request_cache.data.setdefault('changed_blocks_cache', {})
+        cache_key = (draft_course['_id'], published_course['_id'])
+        if cache_key not in cache:
+            cache[cache_key] = self._compute_changed_blocks(draft_course, published_course)
+        return cache[cache_key]
+
+    def _compute_changed_blocks(self, draft_course, published_course):
+        """
+        Returns the set of keys of the draft blocks which differ from their
+        published version, or have a descendant which does, in a single
+        bottom-up pass over the draft structure.
+
+        Children missing from the draft structure count as changed.
+        """
+        has_changes = {}
+        for root_key in draft_course['blocks']:
+            if root_key in has_changes:
+                continue
+            # Iterative post-order traversal, so that each block is decided after its children.
+            stack = [(root_key, False)]
+            while stack:
+                block_key, children_visited = stack.pop()
+                if not children_visited and block_key in has_changes:
+                    continue
+                draft_block = self._get_block_from_structure(draft_course, block_key)
+                if draft_block is None:  # temporary fix for bad pointers TNL-1141
+                    has_changes[block_key] = True
+                    continue
+                children = draft_block.fields.get('children', [])
+                if not children_visited:
+                    # Marks the block while its descendants are visited, which also breaks any cycle.
+                    has_changes[block_key] = None
+                    stack.append((block_key, True))
+                    stack.extend((child_key, False) for child_key in children if child_key not in has_changes)
+                    continue
+
+                published_block = self._get_block_from_structure(published_course, block_key)
+                has_changes[block_key] = (
+                    published_block is None or
+                    self._get_version(draft_block) != self._get_version(published_block) or
+                    any(has_changes[child_key] for child_key in children)
+                )
+        return {block_key for block_key, changed in has_changes.iteritems() if changed}
 
     def publish(self, location, user_id, blacklist=None, **kwargs):
         """
@@ -12,10 +12,12 @@ import shutil
 from opaque_keys.edx.locator import CourseLocator, AssetLocator
 from opaque_keys.edx.keys import AssetKey
 from xmodule.tests import DATA_DIR
-from xmodule.contentstore.mongo import MongoContentStore
+from xmodule.contentstore.mongo import MongoContentStore, chunks_query_for_course, query_for_course
 from xmodule.contentstore.content import StaticContent
 from xmodule.exceptions import NotFoundError
 import ddt
+from mock import patch
+import pymongo
 from xmodule.modulestore.tests.mongo_connection import MONGO_PORT_NUM, MONGO_HOST
 
 log = logging.getLogger(__name__)
@@ -166,6 +168,68 @@ class TestContentstore(unittest.TestCase):
         self.assertEqual(count, 0)
         self.assertEqual(course_assets, [])
 
+    @ddt.data(True, False)
+    def test_get_all_content_sorted_by_displayname(self, deprecated):
+        """
+        Test paging through the assets of a course sorted case-insensitively by displayname
+        """
+        self.set_up_assets(deprecated)
+        asset_key = self.course1_key.make_asset_key('asset', 'picture1.jpg')
+        self.contentstore.set_attr(asset_key, 'displayname', 'Picture1.jpg')
+
+        sort = [('displayname', pymongo.DESCENDING)]
+        displaynames = []
+        for start in range(len(self.course1_files)):
+            assets, count = self.contentstore.get_all_content_for_course(self.course1_key, start, 1, sort=sort)
+            self.assertEqual(count, len(self.course1_files))
+            displaynames.extend(asset['displayname'] for asset in assets)
+        self.assertEqual(displaynames, ['picture2.jpg', 'Picture1.jpg', 'contains.sh'])
+
+        assets, count = self.contentstore.get_all_content_for_course(self.course1_key, 5, 1, sort=sort)
+        self.assertEqual(count, len(self.course1_files))
+        self.assertEqual(assets, [])
+
+    @ddt.data(True, False)
+    def test_add_missing_insensitive_displaynames(self, deprecated):
+        """
+        Test storing the lowercase displayname of assets saved before it was stored
+        """
+        self.set_up_assets(deprecated)
+        asset_key = self.course1_key.make_asset_key('asset', 'picture1.jpg')
+        self.contentstore.set_attr(asset_key, 'displayname', 'Picture1.jpg')
+        self.contentstore.fs_files.update({}, {'$unset': {'displayname_insensitive': True}}, multi=True)
+        asset_id, __ = self.contentstore.asset_db_key(self.course1_key.make_asset_key('asset', 'contains.sh'))
+        self.contentstore.fs_files.update({'_id': asset_id}, {'$set': {'displayname': None}})
+
+        self.assertEqual(
+            self.contentstore.add_missing_insensitive_displaynames(), self.contentstore.fs_files.find().count()
+        )
+        self.assertEqual(self.contentstore.get_attr(asset_key, 'displayname_insensitive'), 'picture1.jpg')
+        self.assertIsNone(self.contentstore.fs_files.find_one({'_id': asset_id})['displayname_insensitive'])
+        # nothing is left to store, including for the asset without a displayname
+        self.assertEqual(self.contentstore.add_missing_insensitive_displaynames(), 0)
+
+        sort = [('displayname', pymongo.ASCENDING)]
+        assets, __ = self.contentstore.get_all_content_for_course(self.course1_key, sort=sort)
+        self.assertEqual([asset['displayname'] for asset in assets], [None, 'Picture1.jpg', 'picture2.jpg'])
+
+    @ddt.data(True, False)
+    @patch('xmodule.contentstore.mongo.ASSET_DISPLAYNAME_BATCH_SIZE', 2)
+    def test_add_missing_insensitive_displaynames_batches(self, deprecated):
+        """
+        Test storing the lowercase displayname of the assets of several courses in several batches
+        """
+        self.set_up_assets(deprecated)
+        self.contentstore.fs_files.update({}, {'$unset': {'displayname_insensitive': True}}, multi=True)
+
+        self.assertEqual(
+            self.contentstore.add_missing_insensitive_displaynames(), self.contentstore.fs_files.find().count()
+        )
+        for course_key, files in ((self.course1_key, self.course1_files), (self.course2_key, self.course2_files)):
+            for filename in files:
+                asset_key = course_key.make_asset_key('asset', filename)
+                self.assertEqual(self.contentstore.get_attr(asset_key, 'displayname_insensitive'), filename.lower())
+
     @ddt.data(True, False)
     def test_attrs(self, deprecated):
         """
@@ -185,18 +249,40 @@ class TestContentstore(unittest.TestCase):
         """
         self.set_up_assets(deprecated)
         dest_course = CourseLocator('test', 'destination', 'copy')
-        self.contentstore.copy_all_course_assets(self.course1_key, dest_course)
+        progress = []
+        self.contentstore.copy_all_course_assets(
+            self.course1_key, dest_course, progress_callback=lambda copied, total: progress.append((copied, total))
+        )
+        self.assertEqual(progress[-1], (len(self.course1_files), len(self.course1_files)))
         for filename in self.course1_files:
             asset_key = self.course1_key.make_asset_key('asset', filename)
             dest_key = dest_course.make_asset_key('asset', filename)
             source = self.contentstore.find(asset_key)
             copied = self.contentstore.find(dest_key)
-            for propname in ['name', 'content_type', 'length', 'locked']:
+            for propname in ['name', 'content_type', 'length', 'locked', 'content_digest', 'data']:
                 self.assertEqual(getattr(source, propname), getattr(copied, propname))
 
         __, count = self.contentstore.get_all_content_for_course(dest_course)
         self.assertEqual(count, len(self.course1_files))
 
+    def test_copy_assets_deprecated_id(self):
+        """
+        copy_all_course_assets copies the chunks of assets stored with a deprecated-style id including the run
+        """
+        self.set_up_assets(False)
+        asset_id, asset_son = self.contentstore.asset_db_key(self.course1_key.make_asset_key('asset', 'picture1.jpg'))
+        asset = self.contentstore.fs_files.find_one({'_id': asset_id})
+        self.contentstore.fs_files.remove({'_id': asset_id})
+        asset['_id'] = asset_son
+        self.contentstore.fs_files.insert(asset)
+        self.contentstore.chunks.update({'files_id': asset_id}, {'$set': {'files_id': asset_son}}, multi=True)
+
+        dest_course = CourseLocator('test', 'destination', 'copy')
+        self.contentstore.copy_all_course_assets(self.course1_key, dest_course)
+        copied = self.contentstore.find(dest_course.make_asset_key('asset', 'picture1.jpg'))
+        with open("{}/static/picture1.jpg".format(DATA_DIR), "rb") as f:
+            self.assertEqual(copied.data, f.read())
+
     @ddt.data(True, False)
     def test_delete_assets(self, deprecated):
         """
@@ -209,3 +295,17 @@ class TestContentstore(unittest.TestCase):
         # ensure it didn't remove any from other course
         __, count = self.contentstore.get_all_content_for_course(self.course2_key)
         self.assertEqual(count, len(self.course2_files))
+
+    @ddt.data(True, False)
+    def test_delete_assets_orphan_chunks(self, deprecated):
+        """
+        delete_all_course_assets removes chunks without a file, as left by an interrupted copy
+        """
+        self.set_up_assets(deprecated)
+        self.contentstore.fs_files.remove(query_for_course(self.course1_key))
+        self.assertNotEqual(self.contentstore.chunks.find(chunks_query_for_course(self.course1_key)).count(), 0)
+
+        self.contentstore.delete_all_course_assets(self.course1_key)
+        self.assertEqual(self.contentstore.chunks.find(chunks_query_for_course(self.course1_key)).count(), 0)
+        # ensure it didn't remove any from other course
+        self.assertNotEqual(self.contentstore.chunks.find(chunks_query_for_course(self.course2_key)).count(), 0)
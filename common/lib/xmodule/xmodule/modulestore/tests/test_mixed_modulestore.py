@@ -911,6 +911,61 @@ class TestMixedModuleStore(CommonMixedModuleStoreSetup):
             # Check the parent for changes should return True and not throw an exception
             self.assertTrue(self.store.has_changes(parent))
 
+    def test_has_changes_with_request_cache(self):
+        """
+        Tests that the blocks with changes are computed once per draft and published
+        versions of a split course when there is a request cache.
+        """
+        locations = self.setup_has_changes(ModuleStoreEnum.Type.split)
+        # pylint: disable=protected-access
+        split_store = self.store._get_modulestore_by_type(ModuleStoreEnum.Type.split)
+
+        with patch.object(split_store, 'request_cache', Mock(data={})):
+            with patch.object(
+                split_store, '_compute_changed_blocks', wraps=split_store._compute_changed_blocks
+            ) as mock_compute:
+                for key in locations:
+                    self.assertFalse(self._has_changes(locations[key]))
+                self.assertEqual(mock_compute.call_count, 1)
+
+                # Changing a block creates a new draft version of the course
+                child = self.store.get_item(locations['child'])
+                child.display_name = 'Changed Display Name'
+                self.store.update_item(child, self.user_id)
+
+                self.assertTrue(self._has_changes(locations['grandparent']))
+                self.assertTrue(self._has_changes(locations['parent']))
+                self.assertTrue(self._has_changes(locations['child']))
+                self.assertFalse(self._has_changes(locations['parent_sibling']))
+                self.assertEqual(mock_compute.call_count, 2)
+
+                # The draft structure is changed in place within a bulk operation, so it isn't cached
+                with self.store.bulk_operations(self.course.id):
+                    child_sibling = self.store.get_item(locations['child_sibling'])
+                    child_sibling.display_name = 'Changed Display Name'
+                    self.store.update_item(child_sibling, self.user_id)
+                    self.assertTrue(self._has_changes(locations['child_sibling']))
+                    self.store.publish(locations['parent'], self.user_id)
+                    self.assertFalse(self._has_changes(locations['child_sibling']))
+                self.assertEqual(mock_compute.call_count, 2)
+
+    def test_has_changes_deleted_in_draft_with_request_cache(self):
+        """
+        Tests that a block only present in the published version of a split course
+        has changes when there is a request cache.
+        """
+        locations = self.setup_has_changes(ModuleStoreEnum.Type.split)
+        # pylint: disable=protected-access
+        split_store = self.store._get_modulestore_by_type(ModuleStoreEnum.Type.split)
+
+        self.store.delete_item(locations['child'], self.user_id)
+        published_child = self.store.get_item(
+            locations['child'], revision=ModuleStoreEnum.RevisionOption.published_only
+        )
+        with patch.object(split_store, 'request_cache', Mock(data={})):
+            self.assertTrue(self.store.has_changes(published_child))
+            self.assertTrue(self._has_changes(locations['parent']))
+
     # Draft
     #   Find: find parents (definition.children query), get parent, get course (fill in run?),
     #         find parents of the parent (course), get inheritance items,
@@ -86,6 +86,45 @@ class TestSplitCopyTemplate(MixedSplitTestCase):
         with self.assertRaises(ItemNotFoundError):
             self.store.get_item(extra_block.location)
 
+    def test_copy_from_template_unchanged_blocks(self):
+        """
+        Test that only the blocks whose source changed since they were last copied are copied again.
+        """
+        source_library = LibraryFactory.create(modulestore=self.store)
+        vertical_block = self.make_block("vertical", source_library)
+        problem_block = self.make_block("problem", vertical_block, display_name="Original")
+        course = CourseFactory.create(modulestore=self.store)
+
+        def copy_library():
+            """ Copies the vertical of the latest version of the library into the course. """
+            library = self.store.get_library(
+                source_library.location.library_key, remove_version=False, remove_branch=False
+            )
+            return self.store.copy_from_template(library.children, dest_key=course.location, user_id=self.user_id)
+
+        vertical_key = copy_library()[0]
+        problem_key = self.store.get_item(vertical_key).children[0]
+        vertical_version = self.store.get_item(vertical_key).update_version
+        problem_version = self.store.get_item(problem_key).update_version
+        course_version = self.store.get_course(course.id).course_version
+        course_block_version = self.store.get_item(course.location).update_version
+
+        # Nothing changed in the library:
+        self.assertEqual(copy_library(), [vertical_key])
+        self.assertEqual(self.store.get_item(vertical_key).update_version, vertical_version)
+        self.assertEqual(self.store.get_item(problem_key).update_version, problem_version)
+        self.assertEqual(self.store.get_course(course.id).course_version, course_version)
+        self.assertEqual(self.store.get_item(course.location).update_version, course_block_version)
+
+        # Only the problem changed in the library:
+        problem_block.display_name = "Changed"
+        self.store.update_item(problem_block, self.user_id)
+        copy_library()
+        self.assertEqual(self.store.get_item(vertical_key).update_version, vertical_version)
+        problem_block_course = self.store.get_item(problem_key)
+        self.assertNotEqual(problem_block_course.update_version, problem_version)
+        self.assertEqual(problem_block_course.display_name, "Changed")
+
     def test_copy_from_template_publish(self):
         """
         Test that copy_from_template's "defaults" data is not lost
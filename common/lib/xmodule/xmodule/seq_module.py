@@ -3,6 +3,7 @@ xModule implementation of a learning sequence
 """
 
 # pylint: disable=abstract-method
+import cgi
 import collections
 import json
 import logging
@@ -427,9 +428,20 @@ class SequenceModule(SequenceFields, ProctoringFields, XModule):
         Updates the given fragment with rendered student views of the given
         display_items.  Returns a list of dict objects with information about
         the given display_items.
+
+        If the context contains `lazy_unit_urls`, a mapping of item usage ids
+        to the URLs of their rendered student views, only the item at the
+        current position is rendered.  The other items are returned as
+        placeholders that the client fetches when the learner navigates to them.
         """
         is_user_authenticated = self.is_user_authenticated(context)
         bookmarks_service = self.runtime.service(self, 'bookmarks')
+        lazy_unit_urls = context.get('lazy_unit_urls') or {}
+        bookmarked_usage_ids = set()
+        if is_user_authenticated:
+            bookmarked_usage_ids = {
+                bookmark['usage_id'] for bookmark in bookmarks_service.bookmarks(course_key=self.location.course_key)
+            }
         completion_service = self.runtime.service(self, 'completion')
         context['username'] = self.runtime.service(self, 'user').get_current_user().opt_attrs.get(
             'edx-platform.username')
@@ -438,7 +450,7 @@ class SequenceModule(SequenceFields, ProctoringFields, XModule):
             self.display_name_with_default
         ]
         contents = []
-        for item in display_items:
+        for index, item in enumerate(display_items, start=1):
             # NOTE (CCB): This seems like a hack, but I don't see a better method of determining the type/category.
             item_type = item.get_icon_class()
             usage_id = item.scope_ids.usage_id
@@ -455,16 +467,23 @@ class SequenceModule(SequenceFields, ProctoringFields, XModule):
 
             if is_user_authenticated:
                 show_bookmark_button = True
-                is_bookmarked = bookmarks_service.is_bookmarked(usage_key=usage_id)
+                is_bookmarked = text_type(usage_id) in bookmarked_usage_ids
 
             context['show_bookmark_button'] = show_bookmark_button
             context['bookmarked'] = is_bookmarked
 
-            rendered_item = item.render(STUDENT_VIEW, context)
-            fragment.add_fragment_resources(rendered_item)
+            lazy_unit_url = lazy_unit_urls.get(text_type(usage_id))
+            if lazy_unit_url and index != self.position:
+                content = u'<div class="seq-lazy-unit" data-view-url="{}"></div>'.format(
+                    cgi.escape(lazy_unit_url, quote=True)
+                )
+            else:
+                rendered_item = item.render(STUDENT_VIEW, context)
+                fragment.add_fragment_resources(rendered_item)
+                content = rendered_item.content
 
             iteminfo = {
-                'content': rendered_item.content,
+                'content': content,
                 'page_title': getattr(item, 'tooltip_title', ''),
                 'type': item_type,
                 'id': text_type(usage_id),
@@ -75,7 +75,9 @@ class SequenceBlockTestCase(XModuleXmlImportTest):
 
         self._set_up_module_system(block)
 
-        block.xmodule_runtime._services['bookmarks'] = Mock()  # pylint: disable=protected-access
+        block.xmodule_runtime._services['bookmarks'] = Mock(  # pylint: disable=protected-access
+            bookmarks=Mock(return_value=[])
+        )
         block.xmodule_runtime._services['completion'] = Mock(  # pylint: disable=protected-access
             return_value=Mock(vertical_is_complete=Mock(return_value=True))
         )
@@ -138,6 +140,26 @@ class SequenceBlockTestCase(XModuleXmlImportTest):
         html = self._get_rendered_student_view(self.sequence_3_1, requested_child='last')
         self._assert_view_at_position(html, expected_position=3)
 
+    def test_lazy_unit_rendering(self):
+        lazy_unit_urls = {
+            unicode(child): u'/xblock/{}/view/student_view'.format(child)
+            for child in self.sequence_3_1.children
+        }
+        html = self._get_rendered_student_view(self.sequence_3_1, extra_context={'lazy_unit_urls': lazy_unit_urls})
+        self._assert_view_at_position(html, expected_position=1)
+        self.assertEqual(html.count('seq-lazy-unit'), 2)
+        self.assertNotIn(lazy_unit_urls[unicode(self.sequence_3_1.children[0])], html)
+        for child in self.sequence_3_1.children[1:]:
+            self.assertIn(lazy_unit_urls[unicode(child)], html)
+
+    def test_bookmarks_fetched_once(self):
+        bookmarks_service = self.sequence_3_1.xmodule_runtime._services['bookmarks']  # pylint: disable=protected-access
+        bookmarks_service.bookmarks.return_value = [{'usage_id': unicode(self.sequence_3_1.children[1])}]
+        html = self._get_rendered_student_view(self.sequence_3_1)
+        bookmarks_service.bookmarks.assert_called_once_with(course_key=self.sequence_3_1.location.course_key)
+        self.assertFalse(bookmarks_service.is_bookmarked.called)
+        self.assertIn("'bookmarked': True", html)
+
     def test_tooltip(self):
         html = self._get_rendered_student_view(self.sequence_3_1, requested_child=None)
         for child in self.sequence_3_1.children:
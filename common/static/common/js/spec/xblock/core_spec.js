@@ -107,5 +107,46 @@
                 expect(XBlock.initializeBlock).toHaveBeenCalledWith(this.vZNode, 'req-token-z');
             });
         });
+        describe('addFragmentResources', function() {
+            beforeEach(function() {
+                window.loadedXBlockResources = void 0;
+                this.loadResource = jasmine.createSpy().and.returnValue($.Deferred().resolve().promise());
+                this.resources = [
+                    ['hash-css', {mimetype: 'text/css', kind: 'url', data: 'css-url'}],
+                    ['hash-js', {mimetype: 'application/javascript', kind: 'url', data: 'js-url'}]
+                ];
+            });
+
+            afterEach(function() {
+                window.loadedXBlockResources = void 0;
+            });
+
+            it('loads the resources which are not loaded yet', function() {
+                var done = jasmine.createSpy();
+                XBlock.addFragmentResources(this.resources, this.loadResource).done(done);
+                expect(this.loadResource.calls.count()).toBe(2);
+                expect(this.loadResource).toHaveBeenCalledWith(this.resources[0][1]);
+                expect(this.loadResource).toHaveBeenCalledWith(this.resources[1][1]);
+                expect(done).toHaveBeenCalled();
+
+                XBlock.addFragmentResources(this.resources, this.loadResource);
+                expect(this.loadResource.calls.count()).toBe(2);
+            });
+
+            it('skips the resources recorded as loaded with the page', function() {
+                XBlock.recordLoadedResources(['hash-js']);
+                XBlock.addFragmentResources(this.resources, this.loadResource);
+                expect(this.loadResource.calls.count()).toBe(1);
+                expect(this.loadResource).toHaveBeenCalledWith(this.resources[0][1]);
+            });
+
+            it('stops loading the resources when one fails to load', function() {
+                var fail = jasmine.createSpy();
+                this.loadResource.and.returnValue($.Deferred().reject().promise());
+                XBlock.addFragmentResources(this.resources, this.loadResource).fail(fail);
+                expect(this.loadResource.calls.count()).toBe(1);
+                expect(fail).toHaveBeenCalled();
+            });
+        });
     });
 }).call(this);
@@ -145,6 +145,98 @@
                 xblocks = xblocks.concat(asides);
             }
             return xblocks;
+        },
+
+        /**
+         * Records the hashes of XBlock fragment resources which are already on the page,
+         * e.g. those rendered with it, so that they are not loaded again.
+         * @param hashes The hashes of the resources
+         */
+        recordLoadedResources: function(hashes) {
+            if (!window.loadedXBlockResources) {
+                window.loadedXBlockResources = [];
+            }
+            $.each(hashes, function(index, hash) {
+                if ($.inArray(hash, window.loadedXBlockResources) < 0) {
+                    window.loadedXBlockResources.push(hash);
+                }
+            });
+        },
+
+        /**
+         * Dynamically loads all of an XBlock fragment's dependent resources which are not on
+         * the page yet, one after the other. This is an asynchronous process so a promise is returned.
+         * @param resources The [hash, resource] pairs of the resources to be rendered
+         * @param loadResource The function loading a resource (defaults to XBlock.loadResource)
+         * @returns {Promise} A promise representing the rendering process
+         */
+        addFragmentResources: function(resources, loadResource) {
+            var numResources = resources.length,
+                deferred = $.Deferred(),
+                applyResource;
+            loadResource = loadResource || XBlock.loadResource;
+            applyResource = function(index) {
+                var hash, value, promise;
+                if (index >= numResources) {
+                    deferred.resolve();
+                    return;
+                }
+                value = resources[index];
+                hash = value[0];
+                if (!window.loadedXBlockResources) {
+                    window.loadedXBlockResources = [];
+                }
+                if ($.inArray(hash, window.loadedXBlockResources) < 0) {
+                    promise = loadResource(value[1]);
+                    window.loadedXBlockResources.push(hash);
+                    promise.done(function() {
+                        applyResource(index + 1);
+                    }).fail(function() {
+                        deferred.reject();
+                    });
+                } else {
+                    applyResource(index + 1);
+                }
+            };
+            applyResource(0);
+            return deferred.promise();
+        },
+
+        /**
+         * Loads the specified resource into the page.
+         * @param resource The resource to be loaded.
+         * @param loadJavaScript The function loading a JavaScript URL and returning a promise
+         *     (defaults to fetching and running it as a script)
+         * @returns {Promise} A promise representing the loading of the resource.
+         */
+        loadResource: function(resource, loadJavaScript) {
+            var $head = $('head'),
+                mimetype = resource.mimetype,
+                kind = resource.kind,
+                placement = resource.placement,
+                data = resource.data;
+            if (mimetype === 'text/css') {
+                if (kind === 'text') {
+                    $head.append("<style type='text/css'>" + data + '</style>');
+                } else if (kind === 'url') {
+                    $head.append("<link rel='stylesheet' href='" + data + "' type='text/css'>");
+                }
+            } else if (mimetype === 'application/javascript') {
+                if (kind === 'text') {
+                    $head.append('<script>' + data + '</script>');
+                } else if (kind === 'url') {
+                    if (loadJavaScript) {
+                        return loadJavaScript(data);
+                    }
+                    return $.ajax({url: data, dataType: 'script', cache: true});
+                }
+            } else if (mimetype === 'text/html') {
+                if (placement === 'head') {
+                    $head.append(data);
+                }
+            }
+            // Return an already resolved promise for synchronous updates
+            return $.Deferred().resolve().promise();
         }
     };
 
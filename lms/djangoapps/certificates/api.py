@@ -179,6 +179,55 @@ def generate_user_certificates(student, course_key, course=None, insecure=False,
     return cert.status
 
 
+def generate_certificates_for_students(students, course_key, course=None, insecure=False, generation_mode='batch'):
+    """
+    Generate certificates for a group of students in a course, as
+    generate_user_certificates does for each of them, fetching the data
+    needed to decide the status of their certificates in bulk.
+
+    Args:
+        students (list of User)
+        course_key (CourseKey)
+
+    Keyword Arguments:
+        course (Course): Optionally provide the course object; if not provided
+            it will be loaded.
+        insecure - (Boolean)
+        generation_mode - who has requested certificate generation.
+
+    Returns:
+        list of the certificate status of each student, None if no
+        certificate could be requested for the student.
+    """
+    xqueue = XQueueCertInterface()
+    if insecure:
+        xqueue.use_https = False
+
+    if not course:
+        course = modulestore().get_course(course_key, depth=0)
+
+    generate_pdf = not has_any_active_web_certificate(course)
+
+    students = list(students)
+    certs = xqueue.add_certs(students, course_key, course=course, generate_pdf=generate_pdf)
+
+    statuses = []
+    for student, cert in zip(students, certs):
+        if cert is None:
+            statuses.append(None)
+            continue
+        if CertificateStatuses.is_passing_status(cert.status):
+            emit_certificate_event('created', student, course_key, course, {
+                'user_id': student.id,
+                'course_id': unicode(course_key),
+                'certificate_id': cert.verify_uuid,
+                'enrollment_mode': cert.mode,
+                'generation_mode': generation_mode
+            })
+        statuses.append(cert.status)
+    return statuses
+
+
 def regenerate_user_certificates(student, course_key, course=None,
                                  forced_grade=None, template_file=None, insecure=False):
     """
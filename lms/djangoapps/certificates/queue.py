@@ -17,10 +17,12 @@ from lms.djangoapps.certificates.models import (
     CertificateWhitelist,
     ExampleCertificate,
     GeneratedCertificate,
+    certificate_status,
     certificate_status_for_student
 )
 from course_modes.models import CourseMode
 from lms.djangoapps.grades.course_grade_factory import CourseGradeFactory
+from lms.djangoapps.grades.models import PersistentCourseGrade
 from lms.djangoapps.verify_student.services import IDVerificationService
 from student.models import CourseEnrollment, UserProfile
 from xmodule.modulestore.django import modulestore
@@ -46,6 +48,32 @@ class XQueueAddToQueueError(Exception):
         )
 
 
+class _CertificateBulkContext(object):
+    """
+    The data add_cert needs about a group of students in a course, each
+    fetched with a single query for all the students.
+    """
+    def __init__(self, students, course_id):
+        self.certificates = {
+            certificate.user_id: certificate
+            for certificate in GeneratedCertificate.objects.filter(user__in=students, course_id=course_id)
+        }
+        self.profiles = {
+            profile.user_id: profile
+            for profile in UserProfile.objects.filter(user__in=students)
+        }
+        self.whitelisted_user_ids = set(
+            CertificateWhitelist.objects.filter(
+                user__in=students, course_id=course_id, whitelist=True
+            ).values_list('user_id', flat=True)
+        )
+        self.verified_user_ids = {
+            verification.user.id for verification in IDVerificationService.get_verified_users(students)
+        }
+        CourseEnrollment.bulk_fetch_enrollment_states(students, course_id)
+        PersistentCourseGrade.prefetch(course_id, students)
+
+
 class XQueueCertInterface(object):
     """
     XQueueCertificateInterface provides an
@@ -65,6 +93,9 @@ class XQueueCertInterface(object):
                    view which will save the certificate
                    download URL.
 
+       add_certs:  Add new certificates for a group of students
+                   in a course, as add_cert does for each of them.
+
        regen_cert: Regenerate an existing certificate.
                    For a user that already has a certificate
                    this will delete the existing one and
@@ -102,6 +133,7 @@ class XQueueCertInterface(object):
         self.whitelist = CertificateWhitelist.objects.all()
         self.restricted = UserProfile.objects.filter(allow_certificate=False)
         self.use_https = True
+        self._bulk_context = None
 
     def regen_cert(self, student, course_id, course=None, forced_grade=None, template_file=None, generate_pdf=True):
         """(Re-)Make certificate for a particular student in a particular course
@@ -179,6 +211,29 @@ class XQueueCertInterface(object):
 
         raise NotImplementedError
 
+    def add_certs(self, students, course_id, course=None, forced_grade=None, generate_pdf=True):
+        """
+        Request new certificates for a group of students in a course.
+
+        This is equivalent to calling add_cert for each student, except that
+        the existing certificates, profiles, whitelist entries, ID verifications,
+        enrollments and grades of the students are fetched at once.
+
+        Returns the list of the certificate returned by add_cert for each student.
+        """
+        if course is None:
+            course = modulestore().get_course(course_id, depth=0)
+
+        students = list(students)
+        self._bulk_context = _CertificateBulkContext(students, course_id)
+        try:
+            return [
+                self.add_cert(student, course_id, course=course, forced_grade=forced_grade, generate_pdf=generate_pdf)
+                for student in students
+            ]
+        finally:
+            self._bulk_context = None
+
     # pylint: disable=too-many-statements
     def add_cert(self, student, course_id, course=None, forced_grade=None, template_file=None, generate_pdf=True):
         """
@@ -237,7 +292,7 @@ class XQueueCertInterface(object):
             status.unverified,
         ]
 
-        cert_status = certificate_status_for_student(student, course_id)['status']
+        cert_status = self._certificate_status(student, course_id)
         cert = None
 
         if cert_status not in valid_statuses:
@@ -260,18 +315,18 @@ class XQueueCertInterface(object):
         if course is None:
             course = modulestore().get_course(course_id, depth=0)
 
-        profile = UserProfile.objects.get(user=student)
+        profile = self._profile(student)
         profile_name = profile.name
 
         # Needed for access control in grading.
         self.request.user = student
         self.request.session = {}
 
-        is_whitelisted = self.whitelist.filter(user=student, course_id=course_id, whitelist=True).exists()
+        is_whitelisted = self._is_whitelisted(student, course_id)
         course_grade = CourseGradeFactory().read(student, course)
         enrollment_mode, __ = CourseEnrollment.enrollment_mode_for_user(student, course_id)
         mode_is_verified = enrollment_mode in GeneratedCertificate.VERIFIED_CERTS_MODES
-        user_is_verified = IDVerificationService.user_is_verified(student)
+        user_is_verified = self._user_is_verified(student)
         cert_mode = enrollment_mode
         is_eligible_for_certificate = is_whitelisted or CourseMode.is_eligible_for_certificate(enrollment_mode)
         unverified = False
@@ -310,7 +365,7 @@ class XQueueCertInterface(object):
             generate_pdf
         )
 
-        cert, created = GeneratedCertificate.objects.get_or_create(user=student, course_id=course_id)
+        cert = self._certificate(student, course_id)
 
         cert.mode = cert_mode
         cert.user = student
@@ -385,7 +440,7 @@ class XQueueCertInterface(object):
         # Check to see whether the student is on the the embargoed
         # country restricted list. If so, they should not receive a
         # certificate -- set their status to restricted and log it.
-        if self.restricted.filter(user=student).exists():
+        if not profile.allow_certificate:
             cert.status = status.restricted
             cert.save()
 
@@ -419,6 +474,47 @@ class XQueueCertInterface(object):
         # Finally, generate the certificate and send it off.
         return self._generate_cert(cert, course, student, grade_contents, template_pdf, generate_pdf)
 
+    def _certificate_status(self, student, course_id):
+        """
+        Returns the status of the certificate of the student in the course.
+        """
+        if self._bulk_context is None:
+            return certificate_status_for_student(student, course_id)['status']
+        return certificate_status(self._bulk_context.certificates.get(student.id))['status']
+
+    def _certificate(self, student, course_id):
+        """
+        Returns the certificate of the student in the course, creating it if needed.
+        """
+        if self._bulk_context is not None and student.id in self._bulk_context.certificates:
+            return self._bulk_context.certificates[student.id]
+        cert, __ = GeneratedCertificate.objects.get_or_create(user=student, course_id=course_id)
+        return cert
+
+    def _profile(self, student):
+        """
+        Returns the profile of the student.
+        """
+        if self._bulk_context is None or student.id not in self._bulk_context.profiles:
+            return UserProfile.objects.get(user=student)
+        return self._bulk_context.profiles[student.id]
+
+    def _is_whitelisted(self, student, course_id):
+        """
+        Returns whether the student is whitelisted for a certificate in the course.
+        """
+        if self._bulk_context is None:
+            return self.whitelist.filter(user=student, course_id=course_id, whitelist=True).exists()
+        return student.id in self._bulk_context.whitelisted_user_ids
+
+    def _user_is_verified(self, student):
+        """
+        Returns whether the identity of the student is verified.
+        """
+        if self._bulk_context is None:
+            return IDVerificationService.user_is_verified(student)
+        return student.id in self._bulk_context.verified_user_ids
+
     def _generate_cert(self, cert, course, student, grade_contents, template_pdf, generate_pdf):
         """
         Generate a certificate for the student. If `generate_pdf` is True,
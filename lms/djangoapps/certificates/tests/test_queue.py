@@ -126,6 +126,46 @@ class XQueueCertInterfaceAddCertificateTest(ModuleStoreTestCase):
         self.assertIsNotNone(certificate)
         self.assertEqual(certificate.mode, 'audit')
 
+    def test_add_certs(self):
+        """Test that add_certs generates certificates like add_cert for each student."""
+        CourseEnrollmentFactory(user=self.user_2, course_id=self.course.id, is_active=True, mode='verified')
+        unverified_user = UserFactory.create()
+        CourseEnrollmentFactory(user=unverified_user, course_id=self.course.id, is_active=True, mode='verified')
+        whitelisted_user = UserFactory.create()
+        CourseEnrollmentFactory(user=whitelisted_user, course_id=self.course.id, is_active=True, mode='audit')
+        CertificateWhitelistFactory(course_id=self.course.id, user=whitelisted_user)
+        restricted_user = UserFactory.create()
+        CourseEnrollmentFactory(user=restricted_user, course_id=self.course.id, is_active=True, mode='honor')
+        restricted_user.profile.allow_certificate = False
+        restricted_user.profile.save()
+        GeneratedCertificateFactory(
+            user=self.user,
+            course_id=self.course.id,
+            status=CertificateStatuses.notpassing,
+        )
+        students = [self.user, self.user_2, unverified_user, whitelisted_user, restricted_user]
+
+        with mock_passing_grade():
+            with patch.object(XQueueInterface, 'send_to_queue') as mock_send:
+                mock_send.return_value = (0, None)
+                certs = self.xqueue.add_certs(students, self.course.id)
+
+        self.assertEqual(
+            [(cert.user, cert.status, cert.mode) for cert in certs],
+            [
+                (self.user, CertificateStatuses.generating, 'honor'),
+                (self.user_2, CertificateStatuses.generating, 'verified'),
+                (unverified_user, CertificateStatuses.unverified, 'verified'),
+                (whitelisted_user, CertificateStatuses.generating, 'audit'),
+                (restricted_user, CertificateStatuses.restricted, 'honor'),
+            ]
+        )
+        self.assertEqual(mock_send.call_count, 3)
+        self.assertEqual(
+            GeneratedCertificate.objects.get(user=self.user, course_id=self.course.id).status,
+            CertificateStatuses.generating
+        )
+
     def add_cert_to_queue(self, mode):
         """
         Dry method for course enrollment and adding request to
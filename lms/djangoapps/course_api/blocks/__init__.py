@@ -1,3 +1,14 @@
 """
 Course API Blocks
 """
+from openedx.core.djangoapps.waffle_utils import WaffleSwitch, WaffleSwitchNamespace
+
+WAFFLE_SWITCH_NAMESPACE = WaffleSwitchNamespace(name='course_blocks_api')
+
+# Serve dict-formatted Blocks API responses as a streaming JSON response.
+#
+# Only requests rendered as JSON are streamed. The streamed response bypasses DRF's
+# rendering and exception handling: the status code is sent before the blocks are
+# serialized, so an error raised while streaming ends the response with a 200 status
+# and truncated JSON, rather than an error response.
+STREAM_BLOCKS_RESPONSE = WaffleSwitch(WAFFLE_SWITCH_NAMESPACE, 'stream_response')
@@ -6,7 +6,7 @@ import lms.djangoapps.course_blocks.api as course_blocks_api
 from lms.djangoapps.course_blocks.transformers.hidden_content import HiddenContentTransformer
 from openedx.core.djangoapps.content.block_structure.transformers import BlockStructureTransformers
 
-from .serializers import BlockDictSerializer, BlockSerializer
+from .serializers import BlockDictSerializer, BlockSerializer, stream_block_dict
 from .transformers.blocks_api import BlocksAPITransformer
 from .transformers.block_completion import BlockCompletionTransformer
 from .transformers.milestones import MilestonesAndSpecialExamsTransformer
@@ -23,6 +23,8 @@ def get_blocks(
         student_view_data=None,
         return_type='dict',
         block_types_filter=None,
+        stream=False,
+        collected_block_structure=None,
 ):
     """
     Return a serialized representation of the course blocks.
@@ -49,35 +51,24 @@ def get_blocks(
             the format for returning the blocks.
         block_types_filter (list): Optional list of block type names used to filter
             the final result of returned blocks.
+        stream (bool): If True and return_type is 'dict', return a generator
+            of JSON chunks instead of the serialized data.
+        collected_block_structure (BlockStructureBlockData): Optional
+            collected block structure of the course, if already available.
     """
-    # create ordered list of transformers, adding BlocksAPITransformer at end.
-    transformers = BlockStructureTransformers()
-    if requested_fields is None:
-        requested_fields = []
-    include_completion = 'completion' in requested_fields
-    include_special_exams = 'special_exam_info' in requested_fields
-    include_gated_sections = 'show_gated_sections' in requested_fields
-
-    if user is not None:
-        transformers += course_blocks_api.get_course_block_access_transformers()
-        transformers += [MilestonesAndSpecialExamsTransformer(
-            include_special_exams=include_special_exams,
-            include_gated_sections=include_gated_sections)]
-        transformers += [HiddenContentTransformer()]
-    transformers += [
-        BlocksAPITransformer(
-            block_counts,
-            student_view_data,
-            depth,
-            nav_depth
-        )
-    ]
-
-    if include_completion:
-        transformers += [BlockCompletionTransformer()]
+    transformers = get_blocks_transformers(
+        user,
+        requested_fields=requested_fields,
+        block_counts=block_counts,
+        student_view_data=student_view_data,
+        depth=depth,
+        nav_depth=nav_depth,
+    )
 
     # transform
-    blocks = course_blocks_api.get_course_blocks(user, usage_key, transformers)
+    blocks = course_blocks_api.get_course_blocks(
+        user, usage_key, transformers, collected_block_structure=collected_block_structure
+    )
 
     # filter blocks by types
     if block_types_filter:
@@ -97,9 +88,52 @@ def get_blocks(
     }
 
     if return_type == 'dict':
+        if stream:
+            return stream_block_dict(blocks, serializer_context)
         serializer = BlockDictSerializer(blocks, context=serializer_context, many=False)
     else:
         serializer = BlockSerializer(blocks, context=serializer_context, many=True)
 
     # return serialized data
     return serializer.data
+
+
+def get_blocks_transformers(
+        user,
+        requested_fields=None,
+        block_counts=None,
+        student_view_data=None,
+        depth=None,
+        nav_depth=None,
+):
+    """
+    Return the collection of transformers applied by get_blocks for the
+    given arguments, described in get_blocks.
+    """
+    # create ordered list of transformers, adding BlocksAPITransformer at end.
+    transformers = BlockStructureTransformers()
+    if requested_fields is None:
+        requested_fields = []
+    include_completion = 'completion' in requested_fields
+    include_special_exams = 'special_exam_info' in requested_fields
+    include_gated_sections = 'show_gated_sections' in requested_fields
+
+    if user is not None:
+        transformers += course_blocks_api.get_course_block_access_transformers()
+        transformers += [MilestonesAndSpecialExamsTransformer(
+            include_special_exams=include_special_exams,
+            include_gated_sections=include_gated_sections)]
+        transformers += [HiddenContentTransformer()]
+    transformers += [
+        BlocksAPITransformer(
+            block_counts,
+            student_view_data,
+            depth,
+            nav_depth
+        )
+    ]
+
+    if include_completion:
+        transformers += [BlockCompletionTransformer()]
+
+    return transformers
@@ -4,6 +4,7 @@ Serializers for Course Blocks related return objects.
 from django.conf import settings
 from rest_framework import serializers
 from rest_framework.reverse import reverse
+from rest_framework.utils.encoders import JSONEncoder
 
 from .transformers import SUPPORTED_FIELDS
 
@@ -12,6 +13,24 @@ class BlockSerializer(serializers.Serializer):  # pylint: disable=abstract-metho
     """
     Serializer for single course block
     """
+    def __init__(self, *args, **kwargs):
+        super(BlockSerializer, self).__init__(*args, **kwargs)
+        self._requested_supported_fields = None
+
+    @property
+    def requested_supported_fields(self):
+        """
+        The SUPPORTED_FIELDS entries that were requested, computed once per
+        serializer rather than once per block.
+        """
+        if self._requested_supported_fields is None:
+            requested_fields = self.context['requested_fields']
+            self._requested_supported_fields = [
+                supported_field for supported_field in SUPPORTED_FIELDS
+                if supported_field.requested_field_name in requested_fields
+            ]
+        return self._requested_supported_fields
+
     def _get_field(self, block_key, transformer, field_name, default):
         """
         Get the field value requested.  The field may be an XBlock field, a
@@ -58,17 +77,16 @@ class BlockSerializer(serializers.Serializer):  # pylint: disable=abstract-metho
             )
 
         # add additional requested fields that are supported by the various transformers
-        for supported_field in SUPPORTED_FIELDS:
-            if supported_field.requested_field_name in self.context['requested_fields']:
-                field_value = self._get_field(
-                    block_key,
-                    supported_field.transformer,
-                    supported_field.block_field_name,
-                    supported_field.default_value,
-                )
-                if field_value is not None:
-                    # only return fields that have data
-                    data[supported_field.serializer_field_name] = field_value
+        for supported_field in self.requested_supported_fields:
+            field_value = self._get_field(
+                block_key,
+                supported_field.transformer,
+                supported_field.block_field_name,
+                supported_field.default_value,
+            )
+            if field_value is not None:
+                # only return fields that have data
+                data[supported_field.serializer_field_name] = field_value
 
         if 'children' in self.context['requested_fields']:
             children = self.context['block_structure'].get_children(block_key)
@@ -90,7 +108,33 @@ class BlockDictSerializer(serializers.Serializer):  # pylint: disable=abstract-m
         """
         Serialize to a dictionary of blocks keyed by the block's usage_key.
         """
+        block_serializer = BlockSerializer(context=self.context)
         return {
-            unicode(block_key): BlockSerializer(block_key, context=self.context).data
+            unicode(block_key): block_serializer.to_representation(block_key)
             for block_key in structure
         }
+
+
+def stream_block_dict(structure, context):
+    """
+    Generate the JSON of BlockDictSerializer for the given structure
+    incrementally, one block at a time, so the representation of the entire
+    course never needs to be held in memory.
+
+    Arguments:
+        structure (BlockStructureBlockData): The transformed course blocks.
+        context (dict): The same context that BlockDictSerializer expects.
+    """
+    encoder = JSONEncoder()
+    block_serializer = BlockSerializer(context=context)
+
+    yield '{{"root": {}, "blocks": {{'.format(encoder.encode(unicode(structure.root_block_usage_key)))
+    separator = ''
+    for block_key in structure:
+        yield '{}{}: {}'.format(
+            separator,
+            encoder.encode(unicode(block_key)),
+            encoder.encode(block_serializer.to_representation(block_key)),
+        )
+        separator = ', '
+    yield '}}'
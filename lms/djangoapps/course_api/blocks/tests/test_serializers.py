@@ -1,7 +1,11 @@
 """
 Tests for Course Blocks serializers
 """
+import json
+
+from django.test import RequestFactory
 from mock import MagicMock
+from rest_framework.utils.encoders import JSONEncoder
 
 from lms.djangoapps.course_blocks.api import get_course_block_access_transformers, get_course_blocks
 from openedx.core.djangoapps.content.block_structure.transformers import BlockStructureTransformers
@@ -11,7 +15,7 @@ from xmodule.modulestore import ModuleStoreEnum
 from xmodule.modulestore.tests.django_utils import SharedModuleStoreTestCase
 from xmodule.modulestore.tests.factories import ToyCourseFactory
 
-from ..serializers import BlockDictSerializer, BlockSerializer
+from ..serializers import BlockDictSerializer, BlockSerializer, stream_block_dict
 from ..transformers.blocks_api import BlocksAPITransformer
 from .helpers import deserialize_usage_key
 
@@ -237,3 +241,10 @@ class TestBlockDictSerializer(TestBlockSerializerBase):
             self.assert_extended_block(serialized_block)
             self.assert_staff_fields(serialized_block)
         self.assertEquals(len(serializer.data['blocks']), 29)
+
+    def test_stream_matches_serializer(self):
+        self.serializer_context['request'] = RequestFactory().get('/')
+        self.add_additional_requested_fields()
+        serialized = json.loads(JSONEncoder().encode(self.create_serializer().data))
+        streamed = json.loads(''.join(stream_block_dict(self.block_structure, self.serializer_context)))
+        self.assertEquals(streamed, serialized)
@@ -1,19 +1,24 @@
 """
 Tests for Blocks Views
 """
+import json
 from datetime import datetime
 from string import join
 from urllib import urlencode
 from urlparse import urlunparse
 
 from django.urls import reverse
+from mock import patch
 from opaque_keys.edx.locator import CourseLocator
+from rest_framework.renderers import BrowsableAPIRenderer, JSONRenderer
 
 from student.models import CourseEnrollment
 from student.tests.factories import AdminFactory, CourseEnrollmentFactory, UserFactory
 from xmodule.modulestore.tests.django_utils import SharedModuleStoreTestCase
 from xmodule.modulestore.tests.factories import ToyCourseFactory
 
+from .. import STREAM_BLOCKS_RESPONSE
+from ..views import BlocksView
 from .helpers import deserialize_usage_key
 
 
@@ -189,6 +194,21 @@ class TestBlocksView(SharedModuleStoreTestCase):
             self.assertEquals(block_data['type'], block_key.block_type)
             self.assertEquals(block_data['display_name'], self.store.get_item(block_key).display_name or '')
 
+    def test_streaming_response(self):
+        with STREAM_BLOCKS_RESPONSE.override(active=True):
+            response = self.verify_response()
+        self.assertTrue(response.streaming)
+        data = json.loads(''.join(response.streaming_content))
+        self.assertEquals(data['root'], unicode(self.course_usage_key))
+        self.assertSetEqual(set(data['blocks'].iterkeys()), self.non_orphaned_block_usage_keys)
+
+    @patch.object(BlocksView, 'renderer_classes', [JSONRenderer, BrowsableAPIRenderer])
+    def test_streaming_response_json_only(self):
+        with STREAM_BLOCKS_RESPONSE.override(active=True):
+            response = self.client.get(self.url, self.query_params, HTTP_ACCEPT='text/html')
+        self.assertEquals(response.status_code, 200)
+        self.assertFalse(response.streaming)
+
     def test_return_type_param(self):
         response = self.verify_response(params={'return_type': 'list'})
         self.verify_response_block_list(response)
@@ -55,6 +55,15 @@ class BlocksAPITransformer(BlockStructureTransformer):
 
         # TODO support olx_data by calling export_to_xml(?)
 
+    def transform_signature(self, usage_info, block_structure):
+        # The result only depends on the requested options.
+        return (
+            tuple(self.block_types_to_count or ()),
+            tuple(self.requested_student_view_data or ()),
+            self.depth,
+            self.nav_depth,
+        )
+
     def transform(self, usage_info, block_structure):
         """
         Mutates block_structure based on the given usage_info.
@@ -54,6 +54,31 @@ class MilestonesAndSpecialExamsTransformer(BlockStructureTransformer):
         block_structure.request_xblock_fields('is_timed_exam')
         block_structure.request_xblock_fields('entrance_exam_id')
 
+    def transform_signature(self, usage_info, block_structure):
+        """
+        Returns a signature only when no block is gated or annotated
+        based on the user's own milestones and special exam attempts.
+        """
+        if self.include_special_exams and any(
+                self.is_special_exam(block_key, block_structure)
+                for block_key in block_structure.topological_traversal()
+        ):
+            return None
+
+        if usage_info.has_staff_access:
+            return ('staff',)
+
+        course_key = block_structure.root_block_usage_key.course_key
+        if not self.include_gated_sections and milestones_helpers.get_course_content_milestones(
+                unicode(course_key), None, 'requires', usage_info.user.id
+        ):
+            return None
+
+        if milestones_helpers.get_required_content(course_key, usage_info.user):
+            return None
+
+        return ()
+
     def transform(self, usage_info, block_structure):
         """
         Modify block structure according to the behavior of milestones and special exams.
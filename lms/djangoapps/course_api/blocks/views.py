@@ -2,7 +2,7 @@
 CourseBlocks API views
 """
 from django.core.exceptions import ValidationError
-from django.http import Http404
+from django.http import Http404, StreamingHttpResponse
 from opaque_keys import InvalidKeyError
 from opaque_keys.edx.keys import CourseKey
 from rest_framework.generics import ListAPIView
@@ -13,6 +13,7 @@ from openedx.core.lib.api.view_utils import DeveloperErrorViewMixin, view_auth_c
 from xmodule.modulestore.django import modulestore
 from xmodule.modulestore.exceptions import ItemNotFoundError
 
+from . import STREAM_BLOCKS_RESPONSE
 from .api import get_blocks
 from .forms import BlockListGetForm
 
@@ -200,24 +201,33 @@ class BlocksView(DeveloperErrorViewMixin, ListAPIView):
         if not params.is_valid():
             raise ValidationError(params.errors)
 
+        # Streamed responses are written as JSON by get_blocks, bypassing the negotiated renderer.
+        stream = (
+            params.cleaned_data['return_type'] == 'dict' and
+            request.accepted_renderer.format == 'json' and
+            STREAM_BLOCKS_RESPONSE.is_enabled()
+        )
         try:
-            return Response(
-                get_blocks(
-                    request,
-                    params.cleaned_data['usage_key'],
-                    params.cleaned_data['user'],
-                    params.cleaned_data['depth'],
-                    params.cleaned_data.get('nav_depth'),
-                    params.cleaned_data['requested_fields'],
-                    params.cleaned_data.get('block_counts', []),
-                    params.cleaned_data.get('student_view_data', []),
-                    params.cleaned_data['return_type'],
-                    params.cleaned_data.get('block_types_filter', None),
-                )
+            blocks = get_blocks(
+                request,
+                params.cleaned_data['usage_key'],
+                params.cleaned_data['user'],
+                params.cleaned_data['depth'],
+                params.cleaned_data.get('nav_depth'),
+                params.cleaned_data['requested_fields'],
+                params.cleaned_data.get('block_counts', []),
+                params.cleaned_data.get('student_view_data', []),
+                params.cleaned_data['return_type'],
+                params.cleaned_data.get('block_types_filter', None),
+                stream=stream,
             )
         except ItemNotFoundError as exception:
             raise Http404("Block not found: {}".format(text_type(exception)))
 
+        if stream:
+            return StreamingHttpResponse(blocks, content_type='application/json')
+        return Response(blocks)
+
 
 @view_auth_classes()
 class BlocksInCourseView(BlocksView):
@@ -1,6 +1,7 @@
 """
 Visibility Transformer implementation.
 """
+from bisect import bisect_right
 from datetime import datetime
 
 from pytz import utc
@@ -29,10 +30,11 @@ class HiddenContentTransformer(FilteringTransformerMixin, BlockStructureTransfor
 
     Staff users are exempted from hidden content rules.
     """
-    WRITE_VERSION = 2
+    WRITE_VERSION = 3
     READ_VERSION = 2
     MERGED_DUE_DATE = 'merged_due_date'
     MERGED_HIDE_AFTER_DUE = 'merged_hide_after_due'
+    HIDE_AFTER_DUE_DATES = 'hide_after_due_dates'
 
     @classmethod
     def name(cls):
@@ -88,6 +90,32 @@ class HiddenContentTransformer(FilteringTransformerMixin, BlockStructureTransfor
 
         block_structure.request_xblock_fields(u'self_paced', u'end')
 
+        # The distinct merged due dates of the blocks hidden after their
+        # due date, in order.
+        block_structure.set_transformer_data(cls, cls.HIDE_AFTER_DUE_DATES, sorted({
+            cls._get_merged_due_date(block_structure, block_key)
+            for block_key in block_structure.topological_traversal()
+            if cls._get_merged_hide_after_due(block_structure, block_key)
+        }))
+
+    def transform_block_filters_signature(self, usage_info, block_structure):
+        """
+        Returns the number of due dates that have passed, as the same
+        blocks are hidden from all non-staff users until the next one.
+        """
+        if usage_info.has_staff_access:
+            return ('staff',)
+
+        root_block = block_structure[block_structure.root_block_usage_key]
+        if root_block.self_paced:
+            # All the blocks are hidden after the course end.
+            return ('self_paced', SequenceModule.verify_current_content_visibility(root_block.end, True))
+
+        due_dates = block_structure.get_transformer_data(self, self.HIDE_AFTER_DUE_DATES)
+        if due_dates is None:
+            return None
+        return bisect_right(due_dates, datetime.now(utc))
+
     def transform_block_filters(self, usage_info, block_structure):
         # Users with staff access bypass the Visibility check.
         if usage_info.has_staff_access:
@@ -73,6 +73,17 @@ class OverrideDataTransformer(BlockStructureTransformer):
         # collect basic xblock fields
         block_structure.request_xblock_fields(*REQUESTED_FIELDS)
 
+    def transform_signature(self, usage_info, block_structure):
+        """
+        Returns a signature only when there is no override data to load.
+        """
+        if StudentFieldOverride.objects.filter(
+            course_id=usage_info.course_key,
+            field__in=REQUESTED_FIELDS,
+        ).exists():
+            return None
+        return ()
+
     def transform(self, usage_info, block_structure):
         """
         loads override data into blocks
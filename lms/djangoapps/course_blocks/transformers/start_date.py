@@ -1,11 +1,18 @@
 """
 Start Date Transformer implementation.
 """
-from lms.djangoapps.courseware.access_utils import check_start_date
+from bisect import bisect_left
+from datetime import datetime
+
+from django.conf import settings
+from pytz import UTC
+
+from lms.djangoapps.courseware.access_utils import check_start_date, in_preview_mode
 from openedx.core.djangoapps.content.block_structure.transformer import (
     BlockStructureTransformer,
     FilteringTransformerMixin
 )
+from student.roles import CourseBetaTesterRole
 from xmodule.course_metadata_utils import DEFAULT_START_DATE
 
 from .utils import collect_merged_date_field
@@ -27,9 +34,10 @@ class StartDateTransformer(FilteringTransformerMixin, BlockStructureTransformer)
 
     Staff users are exempted from visibility rules.
     """
-    WRITE_VERSION = 1
+    WRITE_VERSION = 2
     READ_VERSION = 1
     MERGED_START_DATE = 'merged_start_date'
+    START_DATES = 'start_dates'
 
     @classmethod
     def name(cls):
@@ -67,6 +75,31 @@ class StartDateTransformer(FilteringTransformerMixin, BlockStructureTransformer)
             func_merge_ancestors=max,
         )
 
+        # The distinct merged start dates, in order.
+        block_structure.set_transformer_data(cls, cls.START_DATES, sorted({
+            cls._get_merged_start_date(block_structure, block_key)
+            for block_key in block_structure.topological_traversal()
+        }))
+
+    def transform_block_filters_signature(self, usage_info, block_structure):
+        """
+        Returns the number of start dates that have passed, as blocks
+        starting on the same side of the current time are removed for
+        all non-staff users who aren't beta testers.
+        """
+        if usage_info.has_staff_access:
+            return ('staff',)
+
+        start_dates = block_structure.get_transformer_data(self, self.START_DATES)
+        if start_dates is None or settings.FEATURES['DISABLE_START_DATES'] or in_preview_mode():
+            return None
+
+        num_started = bisect_left(start_dates, datetime.now(UTC))
+        if num_started < len(start_dates) and CourseBetaTesterRole(usage_info.course_key).has_user(usage_info.user):
+            # Beta testers may see content before its start date.
+            return None
+        return num_started
+
     def transform_block_filters(self, usage_info, block_structure):
         # Users with staff access bypass the Start Date check.
         if usage_info.has_staff_access:
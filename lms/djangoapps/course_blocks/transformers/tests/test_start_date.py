@@ -9,9 +9,11 @@ from mock import patch
 from nose.plugins.attrib import attr
 
 from courseware.tests.factories import BetaTesterFactory
+from openedx.core.djangoapps.content.block_structure.api import get_block_structure_manager
 
+from ...usage_info import CourseUsageInfo
 from ..start_date import DEFAULT_START_DATE, StartDateTransformer
-from .helpers import BlockParentsMapTestCase, update_block
+from .helpers import BlockParentsMapTestCase, publish_course, update_block
 
 
 @attr(shard=3)
@@ -121,3 +123,25 @@ class StartDateTransformerTestCase(BlockParentsMapTestCase):
             blocks_with_differing_student_access,
             self.transformers,
         )
+
+    @patch.dict('django.conf.settings.FEATURES', {'DISABLE_START_DATES': False})
+    def test_filters_signature(self):
+        for idx, start_date_type in ((0, self.StartDateType.released), (1, self.StartDateType.future)):
+            block = self.get_block(idx)
+            block.start = self.StartDateType.start(start_date_type)
+            update_block(block)
+        publish_course(self.course)
+
+        block_structure = get_block_structure_manager(self.course.id).get_collected()
+        transformer = StartDateTransformer()
+
+        def get_signature(user):
+            """
+            Returns the filters signature of the transformer for the given user.
+            """
+            return transformer.transform_block_filters_signature(CourseUsageInfo(self.course.id, user), block_structure)
+
+        # Only the start date of the course has passed.
+        self.assertEqual(get_signature(self.student), 1)
+        self.assertEqual(get_signature(self.staff), ('staff',))
+        self.assertIsNone(get_signature(self.beta_user))
@@ -70,6 +70,23 @@ class UserPartitionTransformer(FilteringTransformerMixin, BlockStructureTransfor
             merged_group_access = _MergedGroupAccess(user_partitions, xblock, merged_parent_access_list)
             block_structure.set_transformer_block_field(block_key, cls, 'merged_group_access', merged_group_access)
 
+    def transform_block_filters_signature(self, usage_info, block_structure):
+        """
+        Returns the groups of the user in each partition, as these
+        determine the blocks removed for non-staff users.
+        """
+        if usage_info.has_staff_access:
+            return ('staff',)
+
+        user_partitions = block_structure.get_transformer_data(self, 'user_partitions')
+        if not user_partitions:
+            return ()
+
+        user_groups = _get_user_partition_groups(usage_info.course_key, user_partitions, usage_info.user)
+        return tuple(sorted(
+            (partition_id, group.id) for partition_id, group in user_groups.iteritems()
+        ))
+
     def transform_block_filters(self, usage_info, block_structure):
         user = usage_info.user
         result_list = SplitTestTransformer().transform_block_filters(usage_info, block_structure)
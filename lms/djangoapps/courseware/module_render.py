@@ -1132,7 +1132,9 @@ def xblock_view(request, course_id, usage_id, view_name):
         instance, _ = get_module_by_usage_id(request, course_id, usage_id, course=course)
 
         try:
-            fragment = instance.render(view_name, context=request.GET)
+            # The context of the view is a plain dict of the query parameters. Sequences load
+            # their units lazily without any, as the units look up their bookmark state themselves.
+            fragment = instance.render(view_name, context=request.GET.dict())
         except NoSuchViewError:
             log.exception("Attempt to render missing view on %s: %s", instance, view_name)
             raise Http404
@@ -54,6 +54,11 @@ from lms.djangoapps.grades.config.waffle import waffle as grades_waffle
 from lms.djangoapps.grades.config.waffle import ASSUME_ZERO_GRADE_IF_ABSENT
 from openedx.core.djangoapps.catalog.tests.factories import CourseFactory as CatalogCourseFactory
 from openedx.core.djangoapps.catalog.tests.factories import CourseRunFactory, ProgramFactory
+from openedx.core.djangoapps.content.block_structure.api import (
+    clear_course_from_cache,
+    get_block_structure_manager,
+    get_course_in_cache,
+)
 from openedx.core.djangoapps.content.course_overviews.models import CourseOverview
 from openedx.core.djangoapps.crawlers.models import CrawlersConfig
 from openedx.core.djangoapps.credit.api import set_credit_requirements
@@ -186,6 +191,71 @@ class TestJumpTo(ModuleStoreTestCase):
         response = self.client.get(jumpto_url)
         self.assertRedirects(response, expected, status_code=302, target_status_code=302)
 
+    def _create_jumpto_course(self):
+        """
+        Creates a split course with a unit in each of two sections, and returns
+        the course, its chapter, both sections, the unit of the second section,
+        and an html block in the unit of the first section.
+        """
+        course = CourseFactory.create(default_store=ModuleStoreEnum.Type.split)
+        chapter = ItemFactory.create(category='chapter', parent_location=course.location)
+        section = ItemFactory.create(category='sequential', parent_location=chapter.location)
+        other_section = ItemFactory.create(category='sequential', parent_location=chapter.location)
+        vertical = ItemFactory.create(category='vertical', parent_location=section.location)
+        other_vertical = ItemFactory.create(category='vertical', parent_location=other_section.location)
+        module = ItemFactory.create(category='html', parent_location=vertical.location)
+        return course, chapter, section, other_section, other_vertical, module
+
+    def _jumpto_expected_url(self, course, chapter, section, module):
+        """
+        Returns the url which jumping to the module in the first unit of the section redirects to.
+        """
+        return '/courses/{course_id}/courseware/{chapter_id}/{section_id}/1?{activate_block_id}'.format(
+            course_id=unicode(course.id),
+            chapter_id=chapter.url_name,
+            section_id=section.url_name,
+            activate_block_id=urlencode({'activate_block_id': unicode(module.location)})
+        )
+
+    def test_jumpto_uses_block_structure(self):
+        course, chapter, section, __, __, module = self._create_jumpto_course()
+        get_course_in_cache(course.id)
+
+        with patch('courseware.url_helpers.path_to_location') as mock_path_to_location:
+            self.assertEqual(
+                get_redirect_url(course.id, module.location),
+                self._jumpto_expected_url(course, chapter, section, module),
+            )
+        self.assertFalse(mock_path_to_location.called)
+
+    def test_jumpto_does_not_collect_block_structure(self):
+        course, chapter, section, __, __, module = self._create_jumpto_course()
+        clear_course_from_cache(course.id)
+
+        self.assertEqual(
+            get_redirect_url(course.id, module.location),
+            self._jumpto_expected_url(course, chapter, section, module),
+        )
+        self.assertIsNone(get_block_structure_manager(course.id).get_collected_if_cached())
+
+    def test_jumpto_block_moved_since_block_structure_collected(self):
+        course, chapter, __, other_section, other_vertical, module = self._create_jumpto_course()
+        get_course_in_cache(course.id)
+
+        with self.store.branch_setting(ModuleStoreEnum.Branch.draft_preferred, course.id):
+            vertical = self.store.get_item(self.store.get_parent_location(module.location))
+            other_vertical = self.store.get_item(other_vertical.location)
+            vertical.children.remove(module.location)
+            other_vertical.children.append(module.location)
+            self.store.update_item(vertical, ModuleStoreEnum.UserID.test)
+            self.store.update_item(other_vertical, ModuleStoreEnum.UserID.test)
+            self.store.publish(course.location, ModuleStoreEnum.UserID.test)
+
+        self.assertEqual(
+            get_redirect_url(course.id, module.location),
+            self._jumpto_expected_url(course, chapter, other_section, module),
+        )
+
     def test_jumpto_id_invalid_location(self):
         location = BlockUsageLocator(CourseLocator('edX', 'toy', 'NoSuchPlace', deprecated=True),
                                      None, None, deprecated=True)
@@ -5,8 +5,9 @@ from urllib import urlencode
 
 from django.urls import reverse
 
+from openedx.core.djangoapps.content.block_structure.api import get_block_structure_manager
 from xmodule.modulestore.django import modulestore
-from xmodule.modulestore.search import navigation_index, path_to_location
+from xmodule.modulestore.search import navigation_index, path_to_location, path_to_location_in_structure
 
 
 def get_redirect_url(course_key, usage_key):
@@ -26,7 +27,7 @@ def get_redirect_url(course_key, usage_key):
     (
         course_key, chapter, section, vertical_unused,
         position, final_target_id
-    ) = path_to_location(modulestore(), usage_key)
+    ) = _path_to_location(course_key, usage_key)
 
     # choose the appropriate view (and provide the necessary args) based on the
     # args provided by the redirect.
@@ -50,3 +51,21 @@ def get_redirect_url(course_key, usage_key):
         )
     redirect_url += "?{}".format(urlencode({'activate_block_id': unicode(final_target_id)}))
     return redirect_url
+
+
+def _path_to_location(course_key, usage_key):
+    """
+    Returns the path_to_location of the given usage_key, computed from the
+    course's collected block structure when it is already cached for the
+    current version of the course and contains the block. Otherwise, falls
+    back to walking the modulestore, rather than collecting the whole course
+    or using parents which may have changed since the structure was collected,
+    e.g. when a block was moved.
+    """
+    block_structure = get_block_structure_manager(course_key).get_collected_if_cached()
+    if block_structure is not None and usage_key in block_structure:
+        course_version = block_structure.get_xblock_field(block_structure.root_block_usage_key, 'course_version')
+        current_course = modulestore().get_course(course_key)
+        if course_version is not None and course_version == getattr(current_course, 'course_version', None):
+            return path_to_location_in_structure(block_structure, usage_key)
+    return path_to_location(modulestore(), usage_key)
@@ -54,13 +54,17 @@ from ..entrance_exams import (
 )
 from ..masquerade import setup_masquerade
 from ..model_data import FieldDataCache
-from ..module_render import get_module_for_descriptor, toc_for_course
+from ..module_render import get_module_for_descriptor, hash_resource, toc_for_course
 
 log = logging.getLogger("edx.courseware.views.index")
 
 TEMPLATE_IMPORTS = {'urllib': urllib}
 CONTENT_DEPTH = 2
 
+# Waffle flag to only render the active unit of a sequence server-side, with the
+# remaining units fetched through the xblock_view endpoint on navigation.
+LAZY_UNIT_RENDERING_FLAG = CourseWaffleFlag(WaffleFlagNamespace(name='courseware'), 'lazy_unit_rendering')
+
 
 class CoursewareIndex(View):
     """
@@ -72,6 +76,14 @@ class CoursewareIndex(View):
         waffle_flag = CourseWaffleFlag(WaffleFlagNamespace(name='seo'), 'enable_anonymous_courseware_access')
         return waffle_flag.is_enabled(self.course_key)
 
+    @cached_property
+    def enable_lazy_unit_rendering(self):
+        return (
+            settings.FEATURES.get('ENABLE_XBLOCK_VIEW_ENDPOINT', False) and
+            self.request.user.is_authenticated and
+            LAZY_UNIT_RENDERING_FLAG.is_enabled(self.course_key)
+        )
+
     @method_decorator(ensure_csrf_cookie)
     @method_decorator(cache_control(no_cache=True, no_store=True, must_revalidate=True))
     @method_decorator(ensure_valid_course_key)
@@ -371,6 +383,7 @@ class CoursewareIndex(View):
             'section': self.section,
             'init': '',
             'fragment': Fragment(),
+            'loaded_xblock_resources': [],
             'staff_access': self.is_staff,
             'masquerade': self.masquerade,
             'supports_preview_menu': True,
@@ -436,6 +449,11 @@ class CoursewareIndex(View):
                 table_of_contents['next_of_active_section'],
             )
             courseware_context['fragment'] = self.section.render(STUDENT_VIEW, section_context)
+            if 'lazy_unit_urls' in section_context:
+                # Lazily loaded units skip the resources which were rendered with the page.
+                courseware_context['loaded_xblock_resources'] = [
+                    hash_resource(resource) for resource in courseware_context['fragment'].resources
+                ]
             if self.section.position and self.section.has_children:
                 self._add_sequence_title_to_context(courseware_context)
 
@@ -499,6 +517,18 @@ class CoursewareIndex(View):
             section_context['next_url'] = _compute_section_url(next_of_active_section, 'first')
         # sections can hide data that masquerading staff should see when debugging issues with specific students
         section_context['specific_masquerade'] = self._is_masquerading_as_specific_student()
+        if self.enable_lazy_unit_rendering and not self._is_masquerading_as_student():
+            section_context['lazy_unit_urls'] = {
+                unicode(child_usage_key): reverse(
+                    'xblock_view',
+                    kwargs={
+                        'course_id': unicode(self.course_key),
+                        'usage_id': unicode(child_usage_key),
+                        'view_name': STUDENT_VIEW,
+                    },
+                )
+                for child_usage_key in self.section.children
+            }
         return section_context
 
 
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+from opaque_keys.edx.django.models import CourseKeyField, UsageKeyField
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('grades', '0013_persistentsubsectiongradeoverride'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PendingGradeUpdate',
+            fields=[
+                ('id', models.AutoField(verbose_name='ID', serialize=False, auto_created=True, primary_key=True)),
+                ('user_id', models.IntegerField()),
+                ('course_id', CourseKeyField(max_length=255)),
+                ('usage_key', UsageKeyField(max_length=255)),
+                ('task_kwargs', models.TextField()),
+                ('event_count', models.PositiveIntegerField(default=1)),
+                ('created', models.DateTimeField(auto_now_add=True)),
+                ('modified', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.AlterUniqueTogether(
+            name='pendinggradeupdate',
+            unique_together=set([('user_id', 'course_id', 'usage_key')]),
+        ),
+    ]
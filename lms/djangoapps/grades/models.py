@@ -14,7 +14,7 @@ from base64 import b64encode
 from collections import namedtuple
 from hashlib import sha1
 
-from django.db import models
+from django.db import models, transaction
 from django.utils.timezone import now
 from lazy import lazy
 from model_utils.models import TimeStampedModel
@@ -633,6 +633,79 @@ class PersistentSubsectionGradeOverride(models.Model):
             pass
 
 
+class PendingGradeUpdate(models.Model):
+    """
+    A django model tracking score changes awaiting the recalculation of
+    the subsection grades they affect.
+
+    Score changes of a user on the same block are merged into a single
+    entry until the recalculation task for the user's course processes it.
+    """
+    class Meta(object):
+        app_label = "grades"
+        unique_together = [
+            # * Score changes are merged using all three columns,
+            # * The recalculation task pulls all pending updates for a given (user_id, course_id)
+            ('user_id', 'course_id', 'usage_key'),
+        ]
+
+    user_id = models.IntegerField(blank=False)
+    course_id = CourseKeyField(blank=False, max_length=255)
+    usage_key = UsageKeyField(blank=False, max_length=255)
+
+    # JSON-serialized kwargs of the recalculate_subsection_grade task for the latest score change
+    task_kwargs = models.TextField(blank=False)
+
+    # Number of score changes merged into this entry
+    event_count = models.PositiveIntegerField(default=1)
+
+    created = models.DateTimeField(auto_now_add=True)
+    modified = models.DateTimeField(auto_now=True)
+
+    def __unicode__(self):
+        return u"PendingGradeUpdate user: {}, usage key: {}, events: {}".format(
+            self.user_id, self.usage_key, self.event_count,
+        )
+
+    @property
+    def kwargs(self):
+        """
+        Returns the recalculate_subsection_grade task kwargs of this entry.
+        """
+        return json.loads(self.task_kwargs)
+
+    @classmethod
+    def add(cls, task_kwargs):
+        """
+        Records the score change described by the given recalculate_subsection_grade
+        task kwargs, merging it into the pending entry for the same user and block.
+        """
+        with transaction.atomic():
+            pending, created = cls.objects.select_for_update().get_or_create(
+                user_id=task_kwargs['user_id'],
+                course_id=CourseKey.from_string(task_kwargs['course_id']),
+                usage_key=UsageKey.from_string(task_kwargs['usage_id']),
+                defaults={'task_kwargs': json.dumps(task_kwargs)},
+            )
+            if not created:
+                pending.task_kwargs = json.dumps(cls._merge_task_kwargs(pending.kwargs, task_kwargs))
+                pending.event_count += 1
+                pending.save()
+        return pending
+
+    @staticmethod
+    def _merge_task_kwargs(previous_kwargs, task_kwargs):
+        """
+        Returns the task kwargs covering both the previous and the new score change.
+
+        The latest score change describes the current state of the score, except
+        that the grade may only be lowered if any of the merged changes allows it.
+        """
+        merged_kwargs = dict(task_kwargs)
+        merged_kwargs['only_if_higher'] = previous_kwargs.get('only_if_higher') and task_kwargs.get('only_if_higher')
+        return merged_kwargs
+
+
 def prefetch(user, course_key):
     PersistentSubsectionGradeOverride.prefetch(user.id, course_key)
     VisibleBlocks.bulk_read(user.id, course_key)
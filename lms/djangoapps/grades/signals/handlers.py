@@ -1,6 +1,8 @@
 """
 Grades related signals.
 """
+import threading
+from collections import defaultdict
 from contextlib import contextmanager
 from logging import getLogger
 
@@ -24,17 +26,23 @@ from .signals import (
     SUBSECTION_OVERRIDE_CHANGED,
 )
 from .. import events
+from ..config.waffle import COALESCE_SUBSECTION_GRADE_UPDATES, waffle
 from ..constants import ScoreDatabaseTableEnum
 from ..course_grade_factory import CourseGradeFactory
 from ..scores import weighted_score
 from ..tasks import (
     RECALCULATE_GRADE_DELAY_SECONDS,
+    enqueue_bulk_subsection_updates,
+    enqueue_pending_subsection_update,
     recalculate_subsection_grade_v3,
     recalculate_course_and_subsection_grades_for_user
 )
 
 log = getLogger(__name__)
 
+# Subsection updates collected by the innermost active deferred_subsection_updates.
+_deferred_updates = threading.local()  # pylint: disable=invalid-name
+
 
 @receiver(score_set)
 def submissions_score_set_handler(sender, **kwargs):  # pylint: disable=unused-argument
@@ -129,6 +137,30 @@ def disconnect_submissions_signal_receiver(signal):
         signal.connect(handler)
 
 
+@contextmanager
+def deferred_subsection_updates():
+    """
+    Context manager collecting the subsection updates triggered by score
+    changes within it, instead of enqueueing a task for each of them, and
+    enqueueing them in bulk when it exits.
+
+    It must be used outside of any transaction, so that the score changes
+    are committed when the bulk updates are enqueued.
+    """
+    if getattr(_deferred_updates, 'by_course', None) is not None:
+        # Already deferred by an enclosing context manager.
+        yield
+        return
+
+    _deferred_updates.by_course = defaultdict(list)
+    try:
+        yield
+    finally:
+        updates_by_course, _deferred_updates.by_course = _deferred_updates.by_course, None
+        for course_id, updates in updates_by_course.iteritems():
+            enqueue_bulk_subsection_updates(course_id, updates)
+
+
 @receiver(SCORE_PUBLISHED)
 def score_published_handler(sender, block, user, raw_earned, raw_possible, only_if_higher, **kwargs):  # pylint: disable=unused-argument
     """
@@ -211,23 +243,34 @@ def enqueue_subsection_update(sender, **kwargs):  # pylint: disable=unused-argum
     """
     Handles the PROBLEM_WEIGHTED_SCORE_CHANGED or SUBSECTION_OVERRIDE_CHANGED signals by
     enqueueing a subsection update operation to occur asynchronously.
+
+    Within deferred_subsection_updates, the update is enqueued in bulk when it exits.
+    Otherwise, when the COALESCE_SUBSECTION_GRADE_UPDATES switch is enabled, score changes
+    of a user in a course are recorded and processed together by a single task.
     """
     events.grade_updated(**kwargs)
-    recalculate_subsection_grade_v3.apply_async(
-        kwargs=dict(
-            user_id=kwargs['user_id'],
-            anonymous_user_id=kwargs.get('anonymous_user_id'),
-            course_id=kwargs['course_id'],
-            usage_id=kwargs['usage_id'],
-            only_if_higher=kwargs.get('only_if_higher'),
-            expected_modified_time=to_timestamp(kwargs['modified']),
-            score_deleted=kwargs.get('score_deleted', False),
-            event_transaction_id=unicode(get_event_transaction_id()),
-            event_transaction_type=unicode(get_event_transaction_type()),
-            score_db_table=kwargs['score_db_table'],
-        ),
-        countdown=RECALCULATE_GRADE_DELAY_SECONDS,
+    task_kwargs = dict(
+        user_id=kwargs['user_id'],
+        anonymous_user_id=kwargs.get('anonymous_user_id'),
+        course_id=kwargs['course_id'],
+        usage_id=kwargs['usage_id'],
+        only_if_higher=kwargs.get('only_if_higher'),
+        expected_modified_time=to_timestamp(kwargs['modified']),
+        score_deleted=kwargs.get('score_deleted', False),
+        event_transaction_id=unicode(get_event_transaction_id()),
+        event_transaction_type=unicode(get_event_transaction_type()),
+        score_db_table=kwargs['score_db_table'],
     )
+    deferred_updates = getattr(_deferred_updates, 'by_course', None)
+    if deferred_updates is not None:
+        deferred_updates[task_kwargs['course_id']].append(task_kwargs)
+    elif waffle().is_enabled(COALESCE_SUBSECTION_GRADE_UPDATES):
+        enqueue_pending_subsection_update(task_kwargs)
+    else:
+        recalculate_subsection_grade_v3.apply_async(
+            kwargs=task_kwargs,
+            countdown=RECALCULATE_GRADE_DELAY_SECONDS,
+        )
 
 
 @receiver(SUBSECTION_SCORE_CHANGED)
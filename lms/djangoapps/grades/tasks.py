@@ -2,6 +2,8 @@
 This module contains tasks for asynchronous execution of grade updates.
 """
 
+from collections import OrderedDict, defaultdict
+from functools import partial
 from logging import getLogger
 
 import six
@@ -10,7 +12,9 @@ from celery_utils.persist_on_failure import LoggedPersistOnFailureTask
 from courseware.model_data import get_score
 from django.conf import settings
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
+from django.db import transaction
 from django.db.utils import DatabaseError
 from lms.djangoapps.course_blocks.api import get_course_blocks
 from lms.djangoapps.grades.config.models import ComputeGradesSetting
@@ -27,6 +31,7 @@ from .config.waffle import DISABLE_REGRADE_ON_POLICY_CHANGE, waffle
 from .constants import ScoreDatabaseTableEnum
 from .course_grade_factory import CourseGradeFactory
 from .exceptions import DatabaseNotReadyError
+from .models import PendingGradeUpdate
 from .services import GradesService
 from .signals.signals import SUBSECTION_SCORE_CHANGED
 from .subsection_grade_factory import SubsectionGradeFactory
@@ -41,6 +46,9 @@ KNOWN_RETRY_ERRORS = (  # Errors we expect occasionally, should be resolved on r
     DatabaseNotReadyError,
 )
 RECALCULATE_GRADE_DELAY_SECONDS = 2  # to prevent excessive _has_db_updated failures. See TNL-6424.
+PENDING_GRADE_UPDATES_DELAY_SECONDS = 10  # window within which score changes of a user in a course are coalesced
+PENDING_GRADE_UPDATES_MARKER_TIMEOUT_SECONDS = 600  # lifetime of the scheduling marker if its task never starts
+BULK_GRADE_UPDATES_PER_TASK = 100  # score changes handled by each recalculate_subsection_grades_for_users task
 RETRY_DELAY_SECONDS = 40
 SUBSECTION_GRADE_TIMEOUT_SECONDS = 300
 
@@ -227,6 +235,202 @@ def _recalculate_subsection_grade(self, **kwargs):
         raise self.retry(kwargs=kwargs, exc=exc)
 
 
+def enqueue_pending_subsection_update(task_kwargs):
+    """
+    Records the score change described by the given recalculate_subsection_grade
+    task kwargs and, once the current transaction commits, schedules the
+    recalculation of the pending subsection grades of the user in the course,
+    unless a recalculation is already scheduled to run after that commit.
+    """
+    PendingGradeUpdate.add(task_kwargs)
+    transaction.on_commit(
+        partial(_schedule_pending_subsection_grades, task_kwargs['user_id'], task_kwargs['course_id'])
+    )
+
+
+def _schedule_pending_subsection_grades(user_id, course_id):
+    """
+    Schedules recalculate_pending_subsection_grades for the user in the course
+    if it isn't already scheduled.
+
+    The marker stored in the cache is deleted by the scheduled task before it
+    reads the pending score changes, so score changes committed while it exists
+    are picked up by that task, and later ones schedule another task.
+    """
+    cache_key = _pending_subsection_grades_cache_key(user_id, course_id)
+    if cache.add(cache_key, True, PENDING_GRADE_UPDATES_MARKER_TIMEOUT_SECONDS):
+        recalculate_pending_subsection_grades.apply_async(
+            kwargs=dict(user_id=user_id, course_id=course_id),
+            countdown=PENDING_GRADE_UPDATES_DELAY_SECONDS,
+        )
+
+
+def _pending_subsection_grades_cache_key(user_id, course_id):
+    """
+    Returns the cache key of the marker of a scheduled recalculate_pending_subsection_grades task.
+    """
+    return u'grades.tasks.pending_subsection_grades.{}.{}'.format(user_id, course_id)
+
+
+@task(
+    bind=True,
+    base=LoggedPersistOnFailureTask,
+    time_limit=SUBSECTION_GRADE_TIMEOUT_SECONDS,
+    max_retries=2,
+    default_retry_delay=RETRY_DELAY_SECONDS,
+    routing_key=settings.RECALCULATE_GRADES_ROUTING_KEY
+)
+def recalculate_pending_subsection_grades(self, **kwargs):
+    """
+    Updates, once each, the saved subsection grades affected by the pending
+    score changes of a user in a course.
+
+    Score changes whose database update isn't visible yet are left pending
+    and the task is retried. Score changes still pending when the task ends,
+    including once it runs out of retries, are left to a newly scheduled task.
+
+    Keyword Arguments:
+        user_id (int): id of applicable User object
+        course_id (string): identifying the course
+    """
+    try:
+        course_key = CourseLocator.from_string(kwargs['course_id'])
+        set_custom_metrics_for_course_key(course_key)
+
+        # Score changes committed from now on schedule another task, as this one may not see them.
+        cache.delete(_pending_subsection_grades_cache_key(kwargs['user_id'], kwargs['course_id']))
+
+        ready_updates, num_not_ready = [], 0
+        for pending_update in PendingGradeUpdate.objects.filter(user_id=kwargs['user_id'], course_id=course_key):
+            task_kwargs = pending_update.kwargs
+            scored_block_usage_key = UsageKey.from_string(task_kwargs['usage_id']).replace(course_key=course_key)
+            if _has_db_updated_with_new_score(self, scored_block_usage_key, **task_kwargs):
+                ready_updates.append((pending_update, scored_block_usage_key, task_kwargs))
+            else:
+                num_not_ready += 1
+
+        set_custom_metric('num_pending_grade_updates', len(ready_updates))
+        set_custom_metric('num_coalesced_score_changes', sum(update.event_count for update, _, _ in ready_updates))
+
+        if ready_updates:
+            # Correlate model-level grading events with the latest score change.
+            latest_kwargs = max(ready_updates, key=lambda ready_update: ready_update[0].modified)[2]
+            set_event_transaction_id(latest_kwargs.get('event_transaction_id'))
+            set_event_transaction_type(latest_kwargs.get('event_transaction_type'))
+
+            _update_subsection_grades_for_scored_blocks(
+                course_key,
+                {
+                    scored_block_usage_key: (task_kwargs['only_if_higher'], task_kwargs['score_deleted'])
+                    for _, scored_block_usage_key, task_kwargs in ready_updates
+                },
+                kwargs['user_id'],
+            )
+
+            for pending_update, _, _ in ready_updates:
+                # Score changes merged in the meantime keep the entry pending.
+                PendingGradeUpdate.objects.filter(
+                    id=pending_update.id,
+                    event_count=pending_update.event_count,
+                ).delete()
+
+        if num_not_ready:
+            raise DatabaseNotReadyError
+
+        # Score changes merged while the grades were updated are still pending.
+        if PendingGradeUpdate.objects.filter(user_id=kwargs['user_id'], course_id=course_key).exists():
+            _schedule_pending_subsection_grades(kwargs['user_id'], kwargs['course_id'])
+    except Exception as exc:
+        if not isinstance(exc, KNOWN_RETRY_ERRORS):
+            log.info("tnl-6244 grades unexpected failure: {}. task id: {}. kwargs={}".format(
+                repr(exc),
+                self.request.id,
+                kwargs,
+            ))
+        if self.request.retries >= self.max_retries:
+            # The pending score changes are left to a new task rather than lost.
+            _schedule_pending_subsection_grades(kwargs['user_id'], kwargs['course_id'])
+        raise self.retry(kwargs=kwargs, exc=exc)
+
+
+def enqueue_bulk_subsection_updates(course_id, updates):
+    """
+    Schedules the recalculation of the subsection grades affected by the given
+    score changes in the course, in batches of BULK_GRADE_UPDATES_PER_TASK.
+
+    Arguments:
+        course_id (string): identifying the course
+        updates (list): recalculate_subsection_grade task kwargs of each score
+            change, whose database update must already be committed.
+    """
+    for offset in six.moves.range(0, len(updates), BULK_GRADE_UPDATES_PER_TASK):
+        recalculate_subsection_grades_for_users.apply_async(
+            kwargs=dict(
+                course_id=course_id,
+                updates=updates[offset:offset + BULK_GRADE_UPDATES_PER_TASK],
+            ),
+        )
+
+
+@task(
+    bind=True,
+    base=LoggedPersistOnFailureTask,
+    time_limit=COURSE_GRADE_TIMEOUT_SECONDS,
+    max_retries=2,
+    default_retry_delay=RETRY_DELAY_SECONDS,
+    routing_key=settings.POLICY_CHANGE_GRADES_ROUTING_KEY
+)
+def recalculate_subsection_grades_for_users(self, **kwargs):
+    """
+    Updates the saved subsection grades affected by a batch of committed score
+    changes of many users in a course, updating each subsection of a user once.
+
+    Users whose update fails are retried, without updating the others again.
+
+    Keyword Arguments:
+        course_id (string): identifying the course
+        updates (list): recalculate_subsection_grade task kwargs of each score change
+    """
+    course_key = CourseLocator.from_string(kwargs['course_id'])
+    set_custom_metrics_for_course_key(course_key)
+
+    updates_by_user = OrderedDict()
+    for update in kwargs['updates']:
+        updates_by_user.setdefault(update['user_id'], []).append(update)
+
+    set_custom_metric('num_score_changes', len(kwargs['updates']))
+    set_custom_metric('num_users', len(updates_by_user))
+
+    failed_updates, last_exception = [], None
+    with modulestore().bulk_operations(course_key):
+        for user_id, user_updates in updates_by_user.iteritems():
+            scored_blocks = defaultdict(lambda: (True, False))
+            for update in user_updates:
+                scored_block_usage_key = UsageKey.from_string(update['usage_id']).replace(course_key=course_key)
+                # The latest score change describes the current state of the score, except
+                # that the grade may only be lowered if any of the changes allows it.
+                scored_blocks[scored_block_usage_key] = (
+                    scored_blocks[scored_block_usage_key][0] and update['only_if_higher'],
+                    update['score_deleted'],
+                )
+            try:
+                set_event_transaction_id(user_updates[-1].get('event_transaction_id'))
+                set_event_transaction_type(user_updates[-1].get('event_transaction_type'))
+                _update_subsection_grades_for_scored_blocks(course_key, scored_blocks, user_id)
+            except Exception as exc:  # pylint: disable=broad-except
+                if not isinstance(exc, KNOWN_RETRY_ERRORS):
+                    log.info("Grades: unexpected failure updating subsection grades of user {}: {}. task id: {}".format(
+                        user_id,
+                        repr(exc),
+                        self.request.id,
+                    ))
+                failed_updates.extend(user_updates)
+                last_exception = exc
+
+    if failed_updates:
+        raise self.retry(kwargs=dict(kwargs, updates=failed_updates), exc=last_exception)
+
+
 def _has_db_updated_with_new_score(self, scored_block_usage_key, **kwargs):
     """
     Returns whether the database has been updated with the
@@ -281,21 +485,51 @@ def _update_subsection_grades(course_key, scored_block_usage_key, only_if_higher
     for each subsection containing the given block, and to signal
     that those subsection grades were updated.
     """
+    _update_subsection_grades_for_scored_blocks(
+        course_key,
+        {scored_block_usage_key: (only_if_higher, score_deleted)},
+        user_id,
+    )
+
+
+def _update_subsection_grades_for_scored_blocks(course_key, scored_blocks, user_id):
+    """
+    A helper function to update subsection grades in the database
+    for each subsection containing any of the given blocks, and to
+    signal that those subsection grades were updated.
+
+    Arguments:
+        scored_blocks (dict): (only_if_higher, score_deleted) of each
+            changed scored block, by usage key.
+    """
     student = User.objects.get(id=user_id)
     store = modulestore()
     with store.bulk_operations(course_key):
         course_structure = get_course_blocks(student, store.make_course_usage_key(course_key))
-        subsections_to_update = course_structure.get_transformer_block_field(
-            scored_block_usage_key,
-            GradesTransformer,
-            'subsections',
-            set(),
-        )
+
+        # A subsection containing several changed blocks is updated only once, only
+        # if higher when all its changes allow it, and as deleted if any of them is.
+        subsections_to_update = {}
+        for scored_block_usage_key, (only_if_higher, score_deleted) in scored_blocks.iteritems():
+            for subsection_usage_key in course_structure.get_transformer_block_field(
+                    scored_block_usage_key,
+                    GradesTransformer,
+                    'subsections',
+                    set(),
+            ):
+                if subsection_usage_key in subsections_to_update:
+                    previous_only_if_higher, previous_score_deleted = subsections_to_update[subsection_usage_key]
+                    subsections_to_update[subsection_usage_key] = (
+                        previous_only_if_higher and only_if_higher,
+                        previous_score_deleted or score_deleted,
+                    )
+                else:
+                    subsections_to_update[subsection_usage_key] = (only_if_higher, score_deleted)
 
         course = store.get_course(course_key, depth=0)
         subsection_grade_factory = SubsectionGradeFactory(student, course, course_structure)
 
-        for subsection_usage_key in subsections_to_update:
+        for subsection_usage_key, (only_if_higher, score_deleted) in subsections_to_update.iteritems():
             if subsection_usage_key in course_structure:
                 subsection_grade = subsection_grade_factory.update(
                     course_structure[subsection_usage_key],
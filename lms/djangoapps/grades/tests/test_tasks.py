@@ -16,15 +16,21 @@ from mock import MagicMock, patch
 
 from lms.djangoapps.grades import tasks
 from lms.djangoapps.grades.config.models import PersistentGradesEnabledFlag
+from lms.djangoapps.grades.config.waffle import COALESCE_SUBSECTION_GRADE_UPDATES, waffle
 from lms.djangoapps.grades.constants import ScoreDatabaseTableEnum
-from lms.djangoapps.grades.models import PersistentCourseGrade, PersistentSubsectionGrade
+from lms.djangoapps.grades.models import PendingGradeUpdate, PersistentCourseGrade, PersistentSubsectionGrade
 from lms.djangoapps.grades.services import GradesService
+from lms.djangoapps.grades.signals.handlers import deferred_subsection_updates
 from lms.djangoapps.grades.signals.signals import PROBLEM_WEIGHTED_SCORE_CHANGED
 from lms.djangoapps.grades.tasks import (
+    PENDING_GRADE_UPDATES_DELAY_SECONDS,
     RECALCULATE_GRADE_DELAY_SECONDS,
     _course_task_args,
+    _schedule_pending_subsection_grades,
     compute_grades_for_course_v2,
-    recalculate_subsection_grade_v3
+    recalculate_pending_subsection_grades,
+    recalculate_subsection_grade_v3,
+    recalculate_subsection_grades_for_users
 )
 from openedx.core.djangoapps.content.block_structure.exceptions import BlockStructureNotFound
 from student.models import CourseEnrollment, anonymous_id_for_user
@@ -407,6 +413,196 @@ class RecalculateSubsectionGradeTest(HasCourseWithProblemsMixin, ModuleStoreTest
         self.assertFalse(mock_retry.called)
 
 
+class RecalculatePendingSubsectionGradesTest(HasCourseWithProblemsMixin, ModuleStoreTestCase):
+    """
+    Ensures that score changes are coalesced into a single recalculation
+    of the affected subsection grades.
+    """
+    shard = 4
+    ENABLED_SIGNALS = ['course_published', 'pre_publish']
+
+    def setUp(self):
+        super(RecalculatePendingSubsectionGradesTest, self).setUp()
+        self.user = UserFactory()
+        PersistentGradesEnabledFlag.objects.create(enabled_for_all_courses=True, enabled=True)
+        self.set_up_course()
+        self.second_problem = ItemFactory.create(parent=self.sequential, category='problem')
+
+    def _add_pending_update(self, usage_key, **kwargs):
+        """
+        Records a pending score change on the given block.
+        """
+        task_kwargs = dict(self.recalculate_subsection_grade_kwargs, usage_id=unicode(usage_key), **kwargs)
+        return PendingGradeUpdate.add(task_kwargs)
+
+    def _apply_recalculate_pending_subsection_grades(self, score_modified=None, retries=0):
+        """
+        Calls the recalculate_pending_subsection_grades task with necessary
+        mocking in place.
+        """
+        if score_modified is None:
+            score_modified = datetime.utcnow().replace(tzinfo=pytz.UTC) + timedelta(days=1)
+        mock_score = MagicMock(modified=score_modified, grade=1.0, max_grade=2.0)
+        with patch("lms.djangoapps.grades.tasks.get_score", return_value=mock_score):
+            with mock_get_score(1, 2):
+                recalculate_pending_subsection_grades.apply(
+                    kwargs=dict(user_id=self.user.id, course_id=unicode(self.course.id)),
+                    retries=retries,
+                )
+
+    @patch('lms.djangoapps.grades.tasks.transaction.on_commit')
+    @patch('lms.djangoapps.grades.tasks.recalculate_subsection_grade_v3.apply_async')
+    def test_score_changes_are_merged(self, mock_task_apply, mock_on_commit):
+        with waffle().override(COALESCE_SUBSECTION_GRADE_UPDATES, active=True):
+            for only_if_higher in (True, None):
+                send_args = dict(self.problem_weighted_score_changed_kwargs, only_if_higher=only_if_higher)
+                PROBLEM_WEIGHTED_SCORE_CHANGED.send(sender=None, **send_args)
+
+        self.assertFalse(mock_task_apply.called)
+        self.assertEqual(mock_on_commit.call_count, 2)
+        pending_update = PendingGradeUpdate.objects.get(user_id=self.user.id, course_id=self.course.id)
+        self.assertEqual(pending_update.usage_key, self.problem.location)
+        self.assertEqual(pending_update.event_count, 2)
+        self.assertIsNone(pending_update.kwargs['only_if_higher'])
+
+    @patch('lms.djangoapps.grades.tasks.recalculate_pending_subsection_grades.apply_async')
+    def test_scheduled_once_per_window(self, mock_task_apply):
+        for _ in range(3):
+            _schedule_pending_subsection_grades(self.user.id, unicode(self.course.id))
+        mock_task_apply.assert_called_once_with(
+            kwargs=dict(user_id=self.user.id, course_id=unicode(self.course.id)),
+            countdown=PENDING_GRADE_UPDATES_DELAY_SECONDS,
+        )
+
+    @patch('lms.djangoapps.grades.tasks.recalculate_pending_subsection_grades.apply_async')
+    def test_rescheduled_once_task_started(self, mock_task_apply):
+        _schedule_pending_subsection_grades(self.user.id, unicode(self.course.id))
+        self._apply_recalculate_pending_subsection_grades()
+        _schedule_pending_subsection_grades(self.user.id, unicode(self.course.id))
+        self.assertEqual(mock_task_apply.call_count, 2)
+
+    @patch('lms.djangoapps.grades.tasks.recalculate_pending_subsection_grades.apply_async')
+    @patch('lms.djangoapps.grades.tasks.recalculate_pending_subsection_grades.retry')
+    def test_rescheduled_when_out_of_retries(self, mock_retry, mock_task_apply):
+        self._add_pending_update(self.problem.location)
+
+        self._apply_recalculate_pending_subsection_grades(
+            score_modified=datetime.utcnow().replace(tzinfo=pytz.UTC) - timedelta(days=1),
+            retries=recalculate_pending_subsection_grades.max_retries,
+        )
+
+        self.assertTrue(mock_retry.called)
+        mock_task_apply.assert_called_once_with(
+            kwargs=dict(user_id=self.user.id, course_id=unicode(self.course.id)),
+            countdown=PENDING_GRADE_UPDATES_DELAY_SECONDS,
+        )
+        self.assertTrue(PendingGradeUpdate.objects.filter(user_id=self.user.id).exists())
+
+    @patch('lms.djangoapps.grades.signals.signals.SUBSECTION_SCORE_CHANGED.send')
+    def test_subsection_updated_once(self, mock_subsection_signal):
+        self._add_pending_update(self.problem.location)
+        self._add_pending_update(self.problem.location)
+        self._add_pending_update(self.second_problem.location)
+
+        self._apply_recalculate_pending_subsection_grades()
+
+        self.assertEqual(mock_subsection_signal.call_count, 1)
+        self.assertEqual(
+            mock_subsection_signal.call_args[1]['subsection_grade'].location,
+            self.sequential.location,
+        )
+        self.assertFalse(PendingGradeUpdate.objects.filter(user_id=self.user.id).exists())
+        self.assertGreater(len(PersistentSubsectionGrade.bulk_read_grades(self.user.id, self.course.id)), 0)
+
+    @patch('lms.djangoapps.grades.tasks.recalculate_pending_subsection_grades.retry')
+    @patch('lms.djangoapps.grades.signals.signals.SUBSECTION_SCORE_CHANGED.send')
+    def test_retry_when_db_not_updated(self, mock_subsection_signal, mock_retry):
+        self._add_pending_update(self.problem.location)
+
+        self._apply_recalculate_pending_subsection_grades(
+            score_modified=datetime.utcnow().replace(tzinfo=pytz.UTC) - timedelta(days=1),
+        )
+
+        self.assertTrue(mock_retry.called)
+        self.assertFalse(mock_subsection_signal.called)
+        self.assertTrue(PendingGradeUpdate.objects.filter(user_id=self.user.id).exists())
+
+
+class RecalculateSubsectionGradesForUsersTest(HasCourseWithProblemsMixin, ModuleStoreTestCase):
+    """
+    Ensures that deferred score changes are recalculated in bulk.
+    """
+    shard = 4
+    ENABLED_SIGNALS = ['course_published', 'pre_publish']
+
+    def setUp(self):
+        super(RecalculateSubsectionGradesForUsersTest, self).setUp()
+        self.user = UserFactory()
+        self.other_user = UserFactory()
+        PersistentGradesEnabledFlag.objects.create(enabled_for_all_courses=True, enabled=True)
+        self.set_up_course()
+        self.second_problem = ItemFactory.create(parent=self.sequential, category='problem')
+
+    def _update(self, user, usage_key):
+        """
+        Returns the recalculate_subsection_grade task kwargs of a score change.
+        """
+        return dict(self.recalculate_subsection_grade_kwargs, user_id=user.id, usage_id=unicode(usage_key))
+
+    @patch('lms.djangoapps.grades.tasks.recalculate_subsection_grades_for_users.apply_async')
+    @patch('lms.djangoapps.grades.tasks.recalculate_subsection_grade_v3.apply_async')
+    def test_deferred_subsection_updates(self, mock_task_apply, mock_bulk_task_apply):
+        with deferred_subsection_updates():
+            with deferred_subsection_updates():
+                PROBLEM_WEIGHTED_SCORE_CHANGED.send(sender=None, **self.problem_weighted_score_changed_kwargs)
+            PROBLEM_WEIGHTED_SCORE_CHANGED.send(sender=None, **self.problem_weighted_score_changed_kwargs)
+            self.assertFalse(mock_bulk_task_apply.called)
+
+        self.assertFalse(mock_task_apply.called)
+        mock_bulk_task_apply.assert_called_once_with(
+            kwargs=dict(
+                course_id=unicode(self.course.id),
+                updates=[self.recalculate_subsection_grade_kwargs] * 2,
+            ),
+        )
+
+    @patch('lms.djangoapps.grades.signals.signals.SUBSECTION_SCORE_CHANGED.send')
+    def test_subsection_updated_once_per_user(self, mock_subsection_signal):
+        with mock_get_score(1, 2):
+            recalculate_subsection_grades_for_users.apply(kwargs=dict(
+                course_id=unicode(self.course.id),
+                updates=[
+                    self._update(self.user, self.problem.location),
+                    self._update(self.user, self.second_problem.location),
+                    self._update(self.other_user, self.problem.location),
+                ],
+            ))
+
+        self.assertEqual(mock_subsection_signal.call_count, 2)
+        self.assertEqual(
+            {call_args[1]['user'] for call_args in mock_subsection_signal.call_args_list},
+            {self.user, self.other_user},
+        )
+
+    @patch('lms.djangoapps.grades.tasks.recalculate_subsection_grades_for_users.retry')
+    @patch('lms.djangoapps.grades.tasks._update_subsection_grades_for_scored_blocks')
+    def test_retry_failed_users_only(self, mock_update, mock_retry):
+        def update_subsection_grades(course_key, scored_blocks, user_id):  # pylint: disable=unused-argument
+            """
+            Fails to update the subsection grades of self.user.
+            """
+            if user_id == self.user.id:
+                raise IntegrityError("WHAMMY")
+
+        mock_update.side_effect = update_subsection_grades
+        updates = [self._update(self.user, self.problem.location), self._update(self.other_user, self.problem.location)]
+
+        recalculate_subsection_grades_for_users.apply(kwargs=dict(course_id=unicode(self.course.id), updates=updates))
+
+        self.assertEqual(mock_update.call_count, 2)
+        self.assertEqual(mock_retry.call_args[1]['kwargs']['updates'], updates[:1])
+
+
 @ddt.ddt
 class ComputeGradesForCourseTest(HasCourseWithProblemsMixin, ModuleStoreTestCase):
     """
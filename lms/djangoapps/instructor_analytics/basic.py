@@ -20,7 +20,9 @@ import xmodule.graders as xmgraders
 from lms.djangoapps.certificates.models import CertificateStatuses, GeneratedCertificate
 from courseware.models import StudentModule
 from lms.djangoapps.grades.context import grading_context_for_course
+from lms.djangoapps.teams.models import CourseTeamMembership
 from lms.djangoapps.verify_student.services import IDVerificationService
+from openedx.core.djangoapps.course_groups.models import CourseUserGroup
 from openedx.core.djangoapps.site_configuration import helpers as configuration_helpers
 from shoppingcart.models import (
     CouponRedemption,
@@ -53,6 +55,9 @@ CERTIFICATE_FEATURES = ('course_id', 'mode', 'status', 'grade', 'created_date',
 
 UNAVAILABLE = "[unavailable]"
 
+# Number of students fetched at once when iterating over the students of a course.
+ENROLLED_STUDENTS_CHUNK_SIZE = 1000
+
 
 def sale_order_record_features(course_id, features):
     """
@@ -205,6 +210,29 @@ def issued_certificates(course_key, features):
     return generated_certificates
 
 
+def chunked_queryset(queryset, ordering_field, chunk_size=ENROLLED_STUDENTS_CHUNK_SIZE):
+    """
+    Yields the objects of the queryset in lists of at most `chunk_size`
+    objects, ordered by `ordering_field`, which must be unique.
+
+    Each chunk is fetched with its own query, starting after the last value
+    of `ordering_field` of the previous chunk, so that only one chunk is held
+    in memory at a time.
+    """
+    queryset = queryset.order_by(ordering_field)
+    last_value = None
+    while True:
+        chunk_queryset = queryset
+        if last_value is not None:
+            chunk_queryset = queryset.filter(**{ordering_field + '__gt': last_value})
+        chunk = list(chunk_queryset[:chunk_size])
+        if chunk:
+            yield chunk
+        if len(chunk) < chunk_size:
+            return
+        last_value = getattr(chunk[-1], ordering_field)
+
+
 def enrolled_students_features(course_key, features):
     """
     Return list of student features as dictionaries.
@@ -216,6 +244,18 @@ def enrolled_students_features(course_key, features):
         {'username': 'username3', 'first_name': 'firstname3'}
     ]
     """
+    return list(iter_enrolled_students_features(course_key, features))
+
+
+def iter_enrolled_students_features(course_key, features, chunk_size=ENROLLED_STUDENTS_CHUNK_SIZE):
+    """
+    Yield the student features dictionaries of enrolled_students_features,
+    ordered by username.
+
+    Students are fetched in chunks of `chunk_size`, along with their cohorts,
+    teams, enrollment modes and verifications, so that memory usage does not
+    grow with the number of students in the course.
+    """
     include_cohort_column = 'cohort' in features
     include_team_column = 'team' in features
     include_enrollment_mode = 'enrollment_mode' in features
@@ -224,13 +264,7 @@ def enrolled_students_features(course_key, features):
     students = User.objects.filter(
         courseenrollment__course_id=course_key,
         courseenrollment__is_active=1,
-    ).order_by('username').select_related('profile')
-
-    if include_cohort_column:
-        students = students.prefetch_related('course_groups')
-
-    if include_team_column:
-        students = students.prefetch_related('teams')
+    ).select_related('profile')
 
     def extract_attr(student, feature):
         """Evaluate a student attribute that is ready for JSON serialization"""
@@ -241,7 +275,7 @@ def enrolled_students_features(course_key, features):
         except TypeError:
             return unicode(attr)
 
-    def extract_student(student, features):
+    def extract_student(student, features, cohort_names, team_names, verified_user_ids):
         """ convert student to dictionary """
         student_features = [x for x in STUDENT_FEATURES if x in features]
         profile_features = [x for x in PROFILE_FEATURES if x in features]
@@ -269,33 +303,46 @@ def enrolled_students_features(course_key, features):
                 student_dict[meta_feature] = meta_dict.get(meta_key)
 
         if include_cohort_column:
-            # Note that we use student.course_groups.all() here instead of
-            # student.course_groups.filter(). The latter creates a fresh query,
-            # therefore negating the performance gain from prefetch_related().
-            student_dict['cohort'] = next(
-                (cohort.name for cohort in student.course_groups.all() if cohort.course_id == course_key),
-                "[unassigned]"
-            )
+            student_dict['cohort'] = cohort_names.get(student.id, "[unassigned]")
 
         if include_team_column:
-            student_dict['team'] = next(
-                (team.name for team in student.teams.all() if team.course_id == course_key),
-                UNAVAILABLE
-            )
+            student_dict['team'] = team_names.get(student.id, UNAVAILABLE)
 
         if include_enrollment_mode or include_verification_status:
             enrollment_mode = CourseEnrollment.enrollment_mode_for_user(student, course_key)[0]
             if include_verification_status:
                 student_dict['verification_status'] = IDVerificationService.verification_status_for_user(
                     student,
-                    enrollment_mode
+                    enrollment_mode,
+                    user_is_verified=student.id in verified_user_ids,
                 )
             if include_enrollment_mode:
                 student_dict['enrollment_mode'] = enrollment_mode
 
         return student_dict
 
-    return [extract_student(student, features) for student in students]
+    for chunk in chunked_queryset(students, 'username', chunk_size):
+        cohort_names = {}
+        if include_cohort_column:
+            cohorts = CourseUserGroup.objects.filter(course_id=course_key, users__in=chunk)
+            for user_id, name in cohorts.values_list('users', 'name'):
+                cohort_names.setdefault(user_id, name)
+
+        team_names = {}
+        if include_team_column:
+            memberships = CourseTeamMembership.objects.filter(team__course_id=course_key, user__in=chunk)
+            for user_id, name in memberships.values_list('user_id', 'team__name'):
+                team_names.setdefault(user_id, name)
+
+        if include_enrollment_mode or include_verification_status:
+            CourseEnrollment.bulk_fetch_enrollment_states(chunk, course_key)
+
+        verified_user_ids = set()
+        if include_verification_status:
+            verified_user_ids = {verified.user.id for verified in IDVerificationService.get_verified_users(chunk)}
+
+        for student in chunk:
+            yield extract_student(student, features, cohort_names, team_names, verified_user_ids)
 
 
 def list_may_enroll(course_key, features):
@@ -312,6 +359,14 @@ def list_may_enroll(course_key, features):
     Note that result does not include students who may enroll and have
     already done so.
     """
+    return list(iter_may_enroll(course_key, features))
+
+
+def iter_may_enroll(course_key, features, chunk_size=ENROLLED_STUDENTS_CHUNK_SIZE):
+    """
+    Yield the dictionaries of list_may_enroll, fetching the students who may
+    enroll in chunks of `chunk_size`.
+    """
     may_enroll_and_unenrolled = CourseEnrollmentAllowed.may_enroll_and_unenrolled(course_key)
 
     def extract_student(student, features):
@@ -320,7 +375,9 @@ def list_may_enroll(course_key, features):
         """
         return dict((feature, getattr(student, feature)) for feature in features)
 
-    return [extract_student(student, features) for student in may_enroll_and_unenrolled]
+    for chunk in chunked_queryset(may_enroll_and_unenrolled, 'id', chunk_size):
+        for student in chunk:
+            yield extract_student(student, features)
 
 
 def get_proctored_exam_results(course_key, features):
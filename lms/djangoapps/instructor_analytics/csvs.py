@@ -5,6 +5,7 @@ Format and create csv responses
 """
 
 import csv
+from collections import OrderedDict
 
 from django.http import HttpResponse
 
@@ -71,19 +72,22 @@ def format_dictlist(dictlist, features):
     }
     """
 
-    def dict_to_entry(dct):
-        """ Convert dictionary to a list for a csv row """
-        relevant_items = [(k, v) for (k, v) in dct.items() if k in features]
-        ordered = sorted(relevant_items, key=lambda (k, v): header.index(k))
-        vals = [v for (_, v) in ordered]
-        return vals
-
     header = features
-    datarows = map(dict_to_entry, dictlist)
+    datarows = list(iter_dictlist_rows(dictlist, features))
 
     return header, datarows
 
 
+def iter_dictlist_rows(dicts, features):
+    """
+    Yield the datarows of format_dictlist for an iterable of dictionaries,
+    without building the list of datarows.
+    """
+    features = list(OrderedDict.fromkeys(features))
+    for dct in dicts:
+        yield [dct[feature] for feature in features if feature in dct]
+
+
 def format_instances(instances, features):
     """
     Convert a list of instances into a header list and datarows list.
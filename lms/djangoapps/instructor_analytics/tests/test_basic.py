@@ -22,16 +22,20 @@ from instructor_analytics.basic import (
     AVAILABLE_FEATURES,
     PROFILE_FEATURES,
     STUDENT_FEATURES,
+    UNAVAILABLE,
     StudentModule,
     coupon_codes_features,
     course_registration_features,
     enrolled_students_features,
     get_proctored_exam_results,
+    iter_enrolled_students_features,
+    iter_may_enroll,
     list_may_enroll,
     list_problem_responses,
     sale_order_record_features,
     sale_record_features
 )
+from lms.djangoapps.teams.tests.factories import CourseTeamFactory
 from openedx.core.djangoapps.course_groups.tests.helpers import CohortFactory
 from shoppingcart.models import (
     Coupon,
@@ -226,6 +230,25 @@ class TestAnalyticsBasic(ModuleStoreTestCase):
             else:
                 self.assertEqual(report['cohort'], '[unassigned]')
 
+    def test_iter_enrolled_students_features_in_chunks(self):
+        team = CourseTeamFactory.create(course_id=self.course_key)
+        team.add_user(self.users[0])
+        cohort = CohortFactory.create(name='cohort', course_id=self.course_key, users=[self.users[1]])
+
+        query_features = ('username', 'cohort', 'team')
+        # Each of the 5 chunks of at most 7 users costs a query for the users,
+        # one for their cohorts and one for their teams.
+        with self.assertNumQueries(3 * 5):
+            userreports = list(iter_enrolled_students_features(self.course_key, query_features, chunk_size=7))
+
+        usernames = sorted(user.username for user in self.users)
+        self.assertEqual([userreport['username'] for userreport in userreports], usernames)
+        reports_by_username = {userreport['username']: userreport for userreport in userreports}
+        self.assertEqual(reports_by_username[self.users[0].username]['team'], team.name)
+        self.assertEqual(reports_by_username[self.users[0].username]['cohort'], '[unassigned]')
+        self.assertEqual(reports_by_username[self.users[1].username]['team'], UNAVAILABLE)
+        self.assertEqual(reports_by_username[self.users[1].username]['cohort'], cohort.name)
+
     def test_available_features(self):
         self.assertEqual(len(AVAILABLE_FEATURES), len(STUDENT_FEATURES + PROFILE_FEATURES))
         self.assertEqual(set(AVAILABLE_FEATURES), set(STUDENT_FEATURES + PROFILE_FEATURES))
@@ -238,6 +261,13 @@ class TestAnalyticsBasic(ModuleStoreTestCase):
             self.assertEqual(student.keys(), ['email'])
             self.assertIn(student['email'], email_adresses)
 
+    def test_iter_may_enroll_in_chunks(self):
+        may_enroll = list(iter_may_enroll(self.course_key, ['email'], chunk_size=2))
+        self.assertEqual(
+            sorted(student['email'] for student in may_enroll),
+            sorted(student.email for student in self.students_who_may_enroll[len(self.users):]),
+        )
+
     def test_get_student_exam_attempt_features(self):
         query_features = [
             'email',
@@ -44,6 +44,7 @@ from lms.djangoapps.instructor_task.tasks_helper.misc import (
 )
 from lms.djangoapps.instructor_task.tasks_helper.module_state import (
     delete_problem_module_state,
+    perform_module_state_subtask_update,
     perform_module_state_update,
     override_score_module_state,
     rescore_problem_module_state,
@@ -72,15 +73,41 @@ def rescore_problem(entry_id, xmodule_instance_args):
 
     `xmodule_instance_args` provides information needed by _get_module_instance_for_task()
     to instantiate an xmodule instance.
+
+    Rescoring many submissions is split across rescore_problem_subtask subtasks.
     """
     # Translators: This is a past-tense verb that is inserted into task progress messages as {action}.
     action_name = ugettext_noop('rescored')
     update_fcn = partial(rescore_problem_module_state, xmodule_instance_args)
 
-    visit_fcn = partial(perform_module_state_update, update_fcn, None)
+    def _create_rescore_subtask(module_list, initial_subtask_status):
+        """Creates a subtask to rescore the problem for a chunk of student modules."""
+        return rescore_problem_subtask.subtask(
+            (
+                entry_id,
+                [module['pk'] for module in module_list],
+                xmodule_instance_args,
+                initial_subtask_status.to_dict(),
+            ),
+            task_id=initial_subtask_status.task_id,
+        )
+
+    visit_fcn = partial(perform_module_state_update, update_fcn, None, create_subtask_fcn=_create_rescore_subtask)
     return run_main_task(entry_id, visit_fcn, action_name)
 
 
+@task  # pylint: disable=not-callable
+def rescore_problem_subtask(entry_id, module_ids, xmodule_instance_args, subtask_status_dict):
+    """
+    Rescores a problem for the StudentModules with the given ids, as a subtask of
+    the rescore_problem task of the InstructorTask `entry_id`.
+    """
+    # Translators: This is a past-tense verb that is inserted into task progress messages as {action}.
+    action_name = ugettext_noop('rescored')
+    update_fcn = partial(rescore_problem_module_state, xmodule_instance_args)
+    return perform_module_state_subtask_update(update_fcn, entry_id, module_ids, action_name, subtask_status_dict)
+
+
 @task(base=BaseInstructorTask)  # pylint: disable=not-callable
 def override_problem_score(entry_id, xmodule_instance_args):
     """
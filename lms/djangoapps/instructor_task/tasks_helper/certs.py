@@ -6,13 +6,16 @@ from time import time
 from django.contrib.auth.models import User
 from django.db.models import Q
 
-from lms.djangoapps.certificates.api import generate_user_certificates
+from lms.djangoapps.certificates.api import generate_certificates_for_students
 from lms.djangoapps.certificates.models import CertificateStatuses, GeneratedCertificate
 from student.models import CourseEnrollment
 from xmodule.modulestore.django import modulestore
 
 from .runner import TaskProgress
 
+# Number of students whose certificates are generated together.
+CERTIFICATE_GENERATION_BATCH_SIZE = 100
+
 
 def generate_students_certificates(
         _xmodule_instance_args, _entry_id, course_id, task_input, action_name):
@@ -71,19 +74,19 @@ def generate_students_certificates(
     task_progress.update_task_state(extra_meta=current_step)
 
     course = modulestore().get_course(course_id, depth=0)
-    # Generate certificate for each student
-    for student in students_require_certs:
-        task_progress.attempted += 1
-        status = generate_user_certificates(
-            student,
-            course_id,
-            course=course
-        )
-
-        if CertificateStatuses.is_passing_status(status):
-            task_progress.succeeded += 1
-        else:
-            task_progress.failed += 1
+    # Generate certificates for the students, one batch at a time
+    students_require_certs = list(students_require_certs)
+    for batch_start in xrange(0, len(students_require_certs), CERTIFICATE_GENERATION_BATCH_SIZE):
+        students = students_require_certs[batch_start:batch_start + CERTIFICATE_GENERATION_BATCH_SIZE]
+        statuses = generate_certificates_for_students(students, course_id, course=course)
+
+        for status in statuses:
+            task_progress.attempted += 1
+            if CertificateStatuses.is_passing_status(status):
+                task_progress.succeeded += 1
+            else:
+                task_progress.failed += 1
+        task_progress.update_task_state(extra_meta=current_step)
 
     return task_progress.update_task_state(extra_meta=current_step)
 
@@ -12,8 +12,8 @@ from pytz import UTC
 
 from courseware.courses import get_course_by_id
 from edxmako.shortcuts import render_to_string
-from instructor_analytics.basic import enrolled_students_features, list_may_enroll
-from instructor_analytics.csvs import format_dictlist
+from instructor_analytics.basic import chunked_queryset, iter_enrolled_students_features, iter_may_enroll
+from instructor_analytics.csvs import iter_dictlist_rows
 from lms.djangoapps.instructor.paidcourse_enrollment_report import PaidCourseEnrollmentReportProvider
 from lms.djangoapps.instructor_task.models import ReportStore
 from shoppingcart.models import (
@@ -56,13 +56,9 @@ def upload_enrollment_report(_xmodule_instance_args, _entry_id, course_id, _task
     )
     TASK_LOG.info(u'%s, Task type: %s, Starting task execution', task_info_string, action_name)
 
-    # Loop over all our students and build our CSV lists in memory
-    rows = []
-    header = None
     current_step = {'step': 'Gathering Profile Information'}
     enrollment_report_provider = PaidCourseEnrollmentReportProvider()
     total_students = students_in_course.count()
-    student_counter = 0
     TASK_LOG.info(
         u'%s, Task type: %s, Current step: %s, generating detailed enrollment report for total students: %s',
         task_info_string,
@@ -71,89 +67,100 @@ def upload_enrollment_report(_xmodule_instance_args, _entry_id, course_id, _task
         total_students
     )
 
-    for student in students_in_course:
-        # Periodically update task status (this is a cache write)
-        if task_progress.attempted % status_interval == 0:
-            task_progress.update_task_state(extra_meta=current_step)
-        task_progress.attempted += 1
-
-        # Now add a log entry after certain intervals to get a hint that task is in progress
-        student_counter += 1
-        if student_counter % 100 == 0:
-            TASK_LOG.info(
-                u'%s, Task type: %s, Current step: %s, gathering enrollment profile for students in progress: %s/%s',
-                task_info_string,
-                action_name,
-                current_step,
-                student_counter,
-                total_students
-            )
-
-        user_data = enrollment_report_provider.get_user_profile(student.id)
-        course_enrollment_data = enrollment_report_provider.get_enrollment_info(student, course_id)
-        payment_data = enrollment_report_provider.get_payment_info(student, course_id)
-
-        # display name map for the column headers
-        enrollment_report_headers = {
-            'User ID': _('User ID'),
-            'Username': _('Username'),
-            'Full Name': _('Full Name'),
-            'First Name': _('First Name'),
-            'Last Name': _('Last Name'),
-            'Company Name': _('Company Name'),
-            'Title': _('Title'),
-            'Language': _('Language'),
-            'Year of Birth': _('Year of Birth'),
-            'Gender': _('Gender'),
-            'Level of Education': _('Level of Education'),
-            'Mailing Address': _('Mailing Address'),
-            'Goals': _('Goals'),
-            'City': _('City'),
-            'Country': _('Country'),
-            'Enrollment Date': _('Enrollment Date'),
-            'Currently Enrolled': _('Currently Enrolled'),
-            'Enrollment Source': _('Enrollment Source'),
-            'Manual (Un)Enrollment Reason': _('Manual (Un)Enrollment Reason'),
-            'Enrollment Role': _('Enrollment Role'),
-            'List Price': _('List Price'),
-            'Payment Amount': _('Payment Amount'),
-            'Coupon Codes Used': _('Coupon Codes Used'),
-            'Registration Code Used': _('Registration Code Used'),
-            'Payment Status': _('Payment Status'),
-            'Transaction Reference Number': _('Transaction Reference Number')
-        }
-
-        if not header:
-            header = user_data.keys() + course_enrollment_data.keys() + payment_data.keys()
-            display_headers = []
-            for header_element in header:
-                # translate header into a localizable display string
-                display_headers.append(enrollment_report_headers.get(header_element, header_element))
-            rows.append(display_headers)
-
-        rows.append(user_data.values() + course_enrollment_data.values() + payment_data.values())
-        task_progress.succeeded += 1
-
-    TASK_LOG.info(
-        u'%s, Task type: %s, Current step: %s, Detailed enrollment report generated for students: %s/%s',
-        task_info_string,
-        action_name,
-        current_step,
-        student_counter,
-        total_students
-    )
+    # display name map for the column headers
+    enrollment_report_headers = {
+        'User ID': _('User ID'),
+        'Username': _('Username'),
+        'Full Name': _('Full Name'),
+        'First Name': _('First Name'),
+        'Last Name': _('Last Name'),
+        'Company Name': _('Company Name'),
+        'Title': _('Title'),
+        'Language': _('Language'),
+        'Year of Birth': _('Year of Birth'),
+        'Gender': _('Gender'),
+        'Level of Education': _('Level of Education'),
+        'Mailing Address': _('Mailing Address'),
+        'Goals': _('Goals'),
+        'City': _('City'),
+        'Country': _('Country'),
+        'Enrollment Date': _('Enrollment Date'),
+        'Currently Enrolled': _('Currently Enrolled'),
+        'Enrollment Source': _('Enrollment Source'),
+        'Manual (Un)Enrollment Reason': _('Manual (Un)Enrollment Reason'),
+        'Enrollment Role': _('Enrollment Role'),
+        'List Price': _('List Price'),
+        'Payment Amount': _('Payment Amount'),
+        'Coupon Codes Used': _('Coupon Codes Used'),
+        'Registration Code Used': _('Registration Code Used'),
+        'Payment Status': _('Payment Status'),
+        'Transaction Reference Number': _('Transaction Reference Number')
+    }
 
-    # By this point, we've got the rows we're going to stuff into our CSV files.
-    current_step = {'step': 'Uploading CSVs'}
-    task_progress.update_task_state(extra_meta=current_step)
-    TASK_LOG.info(u'%s, Task type: %s, Current step: %s', task_info_string, action_name, current_step)
+    def enrollment_report_rows():
+        """
+        Yields the rows of the report, fetching the students in chunks, so that
+        rows are written to the report as they are generated.
+        """
+        current_step = {'step': 'Gathering Profile Information'}
+        header = None
+        student_counter = 0
+        for students in chunked_queryset(students_in_course, 'id'):
+            for student in students:
+                # Periodically update task status (this is a cache write)
+                if task_progress.attempted % status_interval == 0:
+                    task_progress.update_task_state(extra_meta=current_step)
+                task_progress.attempted += 1
+
+                # Now add a log entry after certain intervals to get a hint that task is in progress
+                student_counter += 1
+                if student_counter % 100 == 0:
+                    TASK_LOG.info(
+                        u'%s, Task type: %s, Current step: %s, '
+                        u'gathering enrollment profile for students in progress: %s/%s',
+                        task_info_string,
+                        action_name,
+                        current_step,
+                        student_counter,
+                        total_students
+                    )
+
+                user_data = enrollment_report_provider.get_user_profile(student.id)
+                course_enrollment_data = enrollment_report_provider.get_enrollment_info(student, course_id)
+                payment_data = enrollment_report_provider.get_payment_info(student, course_id)
+
+                if not header:
+                    header = user_data.keys() + course_enrollment_data.keys() + payment_data.keys()
+                    # translate header into a localizable display string
+                    yield [
+                        enrollment_report_headers.get(header_element, header_element) for header_element in header
+                    ]
+
+                yield user_data.values() + course_enrollment_data.values() + payment_data.values()
+                task_progress.succeeded += 1
+
+        TASK_LOG.info(
+            u'%s, Task type: %s, Current step: %s, Detailed enrollment report generated for students: %s/%s',
+            task_info_string,
+            action_name,
+            current_step,
+            student_counter,
+            total_students
+        )
+
+        # By this point, all the rows have been written to our CSV file.
+        current_step = {'step': 'Uploading CSVs'}
+        task_progress.update_task_state(extra_meta=current_step)
+        TASK_LOG.info(u'%s, Task type: %s, Current step: %s', task_info_string, action_name, current_step)
 
     # Perform the actual upload
-    upload_csv_to_report_store(rows, 'enrollment_report', course_id, start_date, config_name='FINANCIAL_REPORTS')
+    upload_csv_to_report_store(
+        enrollment_report_rows(), 'enrollment_report', course_id, start_date, config_name='FINANCIAL_REPORTS'
+    )
 
     # One last update before we close out...
     TASK_LOG.info(u'%s, Task type: %s, Finalizing detailed enrollment task', task_info_string, action_name)
-    return task_progress.update_task_state(extra_meta=current_step)
+    return task_progress.update_task_state(extra_meta={'step': 'Uploading CSVs'})
 
 
 def upload_may_enroll_csv(_xmodule_instance_args, _entry_id, course_id, task_input, action_name):
@@ -169,22 +176,18 @@ def upload_may_enroll_csv(_xmodule_instance_args, _entry_id, course_id, task_inp
     current_step = {'step': 'Calculating info about students who may enroll'}
     task_progress.update_task_state(extra_meta=current_step)
 
-    # Compute result table and format it
+    # Compute result table and write it to the report as it is computed
     query_features = task_input.get('features')
-    student_data = list_may_enroll(course_id, query_features)
-    header, rows = format_dictlist(student_data, query_features)
-
-    task_progress.attempted = task_progress.succeeded = len(rows)
+    student_data = iter_may_enroll(course_id, query_features)
+    upload_csv_to_report_store(
+        _counted_rows(task_progress, query_features, iter_dictlist_rows(student_data, query_features)),
+        'may_enroll_info',
+        course_id,
+        start_date,
+    )
     task_progress.skipped = task_progress.total - task_progress.attempted
 
-    rows.insert(0, header)
-
     current_step = {'step': 'Uploading CSV'}
-    task_progress.update_task_state(extra_meta=current_step)
-
-    # Perform the upload
-    upload_csv_to_report_store(rows, 'may_enroll_info', course_id, start_date)
-
     return task_progress.update_task_state(extra_meta=current_step)
 
 
@@ -202,23 +205,31 @@ def upload_students_csv(_xmodule_instance_args, _entry_id, course_id, task_input
     current_step = {'step': 'Calculating Profile Info'}
     task_progress.update_task_state(extra_meta=current_step)
 
-    # compute the student features table and format it
+    # compute the student features table and write it to the report as it is computed
     query_features = task_input
-    student_data = enrolled_students_features(course_id, query_features)
-    header, rows = format_dictlist(student_data, query_features)
-
-    task_progress.attempted = task_progress.succeeded = len(rows)
+    student_data = iter_enrolled_students_features(course_id, query_features)
+    upload_csv_to_report_store(
+        _counted_rows(task_progress, query_features, iter_dictlist_rows(student_data, query_features)),
+        'student_profile_info',
+        course_id,
+        start_date,
+    )
     task_progress.skipped = task_progress.total - task_progress.attempted
 
-    rows.insert(0, header)
-
     current_step = {'step': 'Uploading CSV'}
-    task_progress.update_task_state(extra_meta=current_step)
+    return task_progress.update_task_state(extra_meta=current_step)
 
-    # Perform the upload
-    upload_csv_to_report_store(rows, 'student_profile_info', course_id, start_date)
 
-    return task_progress.update_task_state(extra_meta=current_step)
+def _counted_rows(task_progress, header, rows):
+    """
+    Yields the header, then each of the rows, counting each row as
+    attempted and succeeded in `task_progress`.
+    """
+    yield header
+    for row in rows:
+        task_progress.attempted += 1
+        task_progress.succeeded += 1
+        yield row
 
 
 def get_executive_report(course_id):
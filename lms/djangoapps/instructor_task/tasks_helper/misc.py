@@ -9,15 +9,19 @@ from datetime import datetime
 from time import time
 
 import unicodecsv
-from django.contrib.auth.models import User
-from django.core.exceptions import ValidationError
 from django.core.files.storage import DefaultStorage
 from openassessment.data import OraAggregateData
 from pytz import UTC
 
 from instructor_analytics.basic import get_proctored_exam_results
 from instructor_analytics.csvs import format_dictlist
-from openedx.core.djangoapps.course_groups.cohorts import add_user_to_cohort
+from openedx.core.djangoapps.course_groups.cohorts import (
+    COHORT_ASSIGNMENT_ADDED,
+    COHORT_ASSIGNMENT_INVALID_EMAIL,
+    COHORT_ASSIGNMENT_PREASSIGNED,
+    COHORT_ASSIGNMENT_USER_NOT_FOUND,
+    add_users_to_cohorts
+)
 from openedx.core.djangoapps.course_groups.models import CourseUserGroup
 from survey.models import SurveyAnswer
 from util.file import UniversalNewlineIterator
@@ -28,6 +32,9 @@ from .utils import UPDATE_STATUS_FAILED, UPDATE_STATUS_SUCCEEDED, upload_csv_to_
 # define different loggers for use within tasks and on client side
 TASK_LOG = logging.getLogger('edx.celery.task')
 
+# Number of CSV rows whose users are added to cohorts at once.
+COHORT_STUDENTS_CHUNK_SIZE = 1000
+
 
 def upload_course_survey_report(_xmodule_instance_args, _entry_id, course_id, _task_input, action_name):
     """
@@ -142,13 +149,10 @@ def cohort_students_and_upload(_xmodule_instance_args, _entry_id, course_id, tas
     start_time = time()
     start_date = datetime.now(UTC)
 
-    # Iterate through rows to get total assignments for task progress
     with DefaultStorage().open(task_input['file_name']) as f:
-        total_assignments = 0
-        for _line in unicodecsv.DictReader(UniversalNewlineIterator(f)):
-            total_assignments += 1
+        rows = list(unicodecsv.DictReader(UniversalNewlineIterator(f), encoding='utf-8'))
 
-    task_progress = TaskProgress(action_name, total_assignments, start_time)
+    task_progress = TaskProgress(action_name, len(rows), start_time)
     current_step = {'step': 'Cohorting Students'}
     task_progress.update_task_state(extra_meta=current_step)
 
@@ -158,9 +162,16 @@ def cohort_students_and_upload(_xmodule_instance_args, _entry_id, course_id, tas
     # users, and a cached reference to the corresponding cohort object
     # to prevent redundant cohort queries.
     cohorts_status = {}
-
-    with DefaultStorage().open(task_input['file_name']) as f:
-        for row in unicodecsv.DictReader(UniversalNewlineIterator(f), encoding='utf-8'):
+    # Cohort names are matched case-insensitively, as by the database's collation.
+    existing_cohorts = {
+        cohort.name.lower(): cohort
+        for cohort in CourseUserGroup.objects.filter(course_id=course_id, group_type=CourseUserGroup.COHORT)
+    }
+
+    # Users are added to cohorts in chunks of rows, with a few queries per chunk.
+    for chunk_start in xrange(0, len(rows), COHORT_STUDENTS_CHUNK_SIZE):
+        assignments, assignment_statuses = [], []
+        for row in rows[chunk_start:chunk_start + COHORT_STUDENTS_CHUNK_SIZE]:
             # Try to use the 'email' field to identify the user.  If it's not present, use 'username'.
             username_or_email = row.get('email') or row.get('username')
             cohort_name = row.get('cohort') or ''
@@ -174,46 +185,40 @@ def cohort_students_and_upload(_xmodule_instance_args, _entry_id, course_id, tas
                     'Invalid Email Addresses': set(),
                     'Preassigned Learners': set()
                 }
-                try:
-                    cohorts_status[cohort_name]['cohort'] = CourseUserGroup.objects.get(
-                        course_id=course_id,
-                        group_type=CourseUserGroup.COHORT,
-                        name=cohort_name
-                    )
+                if cohort_name.lower() in existing_cohorts:
+                    cohorts_status[cohort_name]['cohort'] = existing_cohorts[cohort_name.lower()]
                     cohorts_status[cohort_name]["Exists"] = True
-                except CourseUserGroup.DoesNotExist:
+                else:
                     cohorts_status[cohort_name]["Exists"] = False
 
             if not cohorts_status[cohort_name]['Exists']:
                 task_progress.failed += 1
                 continue
 
-            try:
-                # If add_user_to_cohort successfully adds a user, a user object is returned.
-                # If a user is preassigned to a cohort, no user object is returned (we already have the email address).
-                (user, previous_cohort, preassigned) = add_user_to_cohort(cohorts_status[cohort_name]['cohort'], username_or_email)
-                if preassigned:
-                    cohorts_status[cohort_name]['Preassigned Learners'].add(username_or_email)
-                    task_progress.preassigned += 1
-                else:
-                    cohorts_status[cohort_name]['Learners Added'] += 1
-                    task_progress.succeeded += 1
-            except User.DoesNotExist:
-                # Raised when a user with the username could not be found, and the email is not valid
-                cohorts_status[cohort_name]['Learners Not Found'].add(username_or_email)
+            assignments.append((username_or_email, cohorts_status[cohort_name]['cohort']))
+            assignment_statuses.append(cohorts_status[cohort_name])
+
+        outcomes = add_users_to_cohorts(course_id, assignments)
+        for (username_or_email, _cohort), cohort_status, outcome in zip(assignments, assignment_statuses, outcomes):
+            if outcome == COHORT_ASSIGNMENT_ADDED:
+                cohort_status['Learners Added'] += 1
+                task_progress.succeeded += 1
+            elif outcome == COHORT_ASSIGNMENT_PREASSIGNED:
+                cohort_status['Preassigned Learners'].add(username_or_email)
+                task_progress.preassigned += 1
+            elif outcome == COHORT_ASSIGNMENT_USER_NOT_FOUND:
+                cohort_status['Learners Not Found'].add(username_or_email)
                 task_progress.failed += 1
-            except ValidationError:
-                # Raised when a user with the username could not be found, and the email is not valid,
-                # but the entered string contains an "@"
+            elif outcome == COHORT_ASSIGNMENT_INVALID_EMAIL:
                 # Since there is no way to know if the entered string is an invalid username or an invalid email,
                 # assume that a string with the "@" symbol in it is an attempt at entering an email
-                cohorts_status[cohort_name]['Invalid Email Addresses'].add(username_or_email)
+                cohort_status['Invalid Email Addresses'].add(username_or_email)
                 task_progress.failed += 1
-            except ValueError:
-                # Raised when the user is already in the given cohort
+            else:
+                # The user is already in the given cohort
                 task_progress.skipped += 1
 
-            task_progress.update_task_state(extra_meta=current_step)
+        task_progress.update_task_state(extra_meta=current_step)
 
     current_step['step'] = 'Uploading CSV'
     task_progress.update_task_state(extra_meta=current_step)
@@ -5,6 +5,8 @@ import json
 import logging
 from time import time
 
+from celery.states import FAILURE, SUCCESS
+from django.conf import settings
 from django.contrib.auth.models import User
 from django.utils.translation import ugettext_noop
 from opaque_keys.edx.keys import UsageKey
@@ -16,6 +18,7 @@ from courseware.model_data import DjangoKeyValueStore, FieldDataCache
 from courseware.models import StudentModule
 from courseware.module_render import get_module_for_descriptor_internal
 from lms.djangoapps.grades.events import GRADES_OVERRIDE_EVENT_TYPE, GRADES_RESCORE_EVENT_TYPE
+from lms.djangoapps.grades.signals.handlers import deferred_subsection_updates
 from track.event_transaction_utils import create_new_event_transaction_id, set_event_transaction_type
 from track.views import task_track
 from util.db import outer_atomic
@@ -24,13 +27,16 @@ from xblock.runtime import KvsFieldData
 from xblock.scorable import Score
 from xmodule.modulestore.django import modulestore
 from ..exceptions import UpdateProblemModuleStateError
+from ..models import InstructorTask
+from ..subtasks import SubtaskStatus, check_subtask_is_valid, queue_subtasks_for_query, update_subtask_status
 from .runner import TaskProgress
 from .utils import UNKNOWN_TASK_ID, UPDATE_STATUS_FAILED, UPDATE_STATUS_SKIPPED, UPDATE_STATUS_SUCCEEDED
 
 TASK_LOG = logging.getLogger('edx.celery.task')
 
 
-def perform_module_state_update(update_fcn, filter_fcn, _entry_id, course_id, task_input, action_name):
+def perform_module_state_update(update_fcn, filter_fcn, entry_id, course_id, task_input, action_name,
+                                create_subtask_fcn=None):
     """
     Performs generic update by visiting StudentModule instances with the update_fcn provided.
 
@@ -42,6 +48,11 @@ def perform_module_state_update(update_fcn, filter_fcn, _entry_id, course_id, ta
     on the particular student module failed.
     A raised exception indicates a fatal condition -- that no other student modules should be considered.
 
+    If `create_subtask_fcn` is provided and the update applies to more than
+    settings.INSTRUCTOR_TASK_MODULES_PER_SUBTASK modules of all students, the modules are instead
+    split into chunks, each updated by a subtask created by `create_subtask_fcn` (see
+    queue_subtasks_for_query), which should call perform_module_state_subtask_update.
+
     The return value is a dict containing the task's results, with the following keys:
 
           'attempted': number of attempts made
@@ -59,11 +70,105 @@ def perform_module_state_update(update_fcn, filter_fcn, _entry_id, course_id, ta
 
     """
     start_time = time()
+    student_identifier = task_input.get('student')
+    override_score_task = action_name == ugettext_noop('overridden')
+
+    usage_keys, problems = _get_problems_to_update(course_id, task_input)
+
+    modules_to_update = _get_modules_to_update(
+        course_id, usage_keys, student_identifier, filter_fcn, override_score_task
+    )
+
+    if create_subtask_fcn is not None and student_identifier is None:
+        total_num_modules = modules_to_update.count()
+        if total_num_modules > settings.INSTRUCTOR_TASK_MODULES_PER_SUBTASK:
+            return queue_subtasks_for_query(
+                InstructorTask.objects.get(pk=entry_id),
+                action_name,
+                create_subtask_fcn,
+                [modules_to_update],
+                [],
+                settings.INSTRUCTOR_TASK_MODULES_PER_SUBTASK,
+                total_num_modules,
+            )
+
+    task_progress = TaskProgress(action_name, len(modules_to_update), start_time)
+    task_progress.update_task_state()
+
+    # Load the course once for all the modules, and defer the resulting grade
+    # updates to a bulk recalculation once all the modules are updated.
+    with modulestore().bulk_operations(course_id), deferred_subsection_updates():
+        for module_to_update in modules_to_update:
+            task_progress.attempted += 1
+            update_status = _update_module_state(update_fcn, problems, module_to_update, task_input, action_name)
+            if update_status == UPDATE_STATUS_SUCCEEDED:
+                # If the update_fcn returns true, then it performed some kind of work.
+                # Logging of failures is left to the update_fcn itself.
+                task_progress.succeeded += 1
+            elif update_status == UPDATE_STATUS_FAILED:
+                task_progress.failed += 1
+            else:
+                task_progress.skipped += 1
+
+    return task_progress.update_task_state()
+
+
+def perform_module_state_subtask_update(update_fcn, entry_id, module_ids, action_name, subtask_status_dict):
+    """
+    Performs the update of the StudentModules with the given ids, as a subtask of the
+    InstructorTask `entry_id` queued by perform_module_state_update, with the `update_fcn` provided.
+
+    Records the number of modules that succeeded, failed or were skipped in the InstructorTask,
+    and returns the final SubtaskStatus of the subtask as a dict.
+    """
+    subtask_status = SubtaskStatus.from_dict(subtask_status_dict)
+    current_task_id = subtask_status.task_id
+
+    # Reject duplicate subtasks, e.g. when the parent task was requeued.
+    check_subtask_is_valid(entry_id, current_task_id, subtask_status)
+
+    counts = {UPDATE_STATUS_SUCCEEDED: 0, UPDATE_STATUS_FAILED: 0, UPDATE_STATUS_SKIPPED: 0}
+    try:
+        entry = InstructorTask.objects.get(pk=entry_id)
+        course_id = entry.course_id
+        task_input = json.loads(entry.task_input)
+        problems = _get_problems_to_update(course_id, task_input)[1]
+        modules_to_update = StudentModule.objects.filter(pk__in=module_ids).select_related('student')
+
+        with modulestore().bulk_operations(course_id), deferred_subsection_updates():
+            for module_to_update in modules_to_update:
+                update_status = _update_module_state(update_fcn, problems, module_to_update, task_input, action_name)
+                counts[update_status] += 1
+    except Exception:
+        TASK_LOG.exception(u"Subtask %s of instructor task %d: failed unexpectedly!", current_task_id, entry_id)
+        # Modules that weren't processed are counted as failed, to keep the counts consistent.
+        subtask_status.increment(
+            succeeded=counts[UPDATE_STATUS_SUCCEEDED],
+            skipped=counts[UPDATE_STATUS_SKIPPED],
+            failed=len(module_ids) - counts[UPDATE_STATUS_SUCCEEDED] - counts[UPDATE_STATUS_SKIPPED],
+            state=FAILURE,
+        )
+        update_subtask_status(entry_id, current_task_id, subtask_status)
+        raise
+
+    subtask_status.increment(
+        succeeded=counts[UPDATE_STATUS_SUCCEEDED],
+        failed=counts[UPDATE_STATUS_FAILED],
+        skipped=counts[UPDATE_STATUS_SKIPPED],
+        state=SUCCESS,
+    )
+    update_subtask_status(entry_id, current_task_id, subtask_status)
+    return subtask_status.to_dict()
+
+
+def _get_problems_to_update(course_id, task_input):
+    """
+    Returns the usage keys of the problems to update for the given `task_input`,
+    along with a dict of their descriptors by usage key string.
+    """
     usage_keys = []
     problem_url = task_input.get('problem_url')
     entrance_exam_url = task_input.get('entrance_exam_url')
-    student_identifier = task_input.get('student')
-    override_score_task = action_name == ugettext_noop('overridden')
     problems = {}
 
     # if problem_url is present make a usage key from it
@@ -80,32 +185,21 @@ def perform_module_state_update(update_fcn, filter_fcn, _entry_id, course_id, ta
         problems = get_problems_in_section(entrance_exam_url)
         usage_keys = [UsageKey.from_string(location) for location in problems.keys()]
 
-    modules_to_update = _get_modules_to_update(
-        course_id, usage_keys, student_identifier, filter_fcn, override_score_task
-    )
+    return usage_keys, problems
 
-    task_progress = TaskProgress(action_name, len(modules_to_update), start_time)
-    task_progress.update_task_state()
 
-    for module_to_update in modules_to_update:
-        task_progress.attempted += 1
-        module_descriptor = problems[unicode(module_to_update.module_state_key)]
-        # There is no try here:  if there's an error, we let it throw, and the task will
-        # be marked as FAILED, with a stack trace.
-        with dog_stats_api.timer('instructor_tasks.module.time.step', tags=[u'action:{name}'.format(name=action_name)]):
-            update_status = update_fcn(module_descriptor, module_to_update, task_input)
-            if update_status == UPDATE_STATUS_SUCCEEDED:
-                # If the update_fcn returns true, then it performed some kind of work.
-                # Logging of failures is left to the update_fcn itself.
-                task_progress.succeeded += 1
-            elif update_status == UPDATE_STATUS_FAILED:
-                task_progress.failed += 1
-            elif update_status == UPDATE_STATUS_SKIPPED:
-                task_progress.skipped += 1
-            else:
-                raise UpdateProblemModuleStateError("Unexpected update_status returned: {}".format(update_status))
-
-    return task_progress.update_task_state()
+def _update_module_state(update_fcn, problems, module_to_update, task_input, action_name):
+    """
+    Calls `update_fcn` on the given StudentModule, and returns the resulting update status.
+    """
+    module_descriptor = problems[unicode(module_to_update.module_state_key)]
+    # There is no try here:  if there's an error, we let it throw, and the task will
+    # be marked as FAILED, with a stack trace.
+    with dog_stats_api.timer('instructor_tasks.module.time.step', tags=[u'action:{name}'.format(name=action_name)]):
+        update_status = update_fcn(module_descriptor, module_to_update, task_input)
+        if update_status not in (UPDATE_STATUS_SUCCEEDED, UPDATE_STATUS_FAILED, UPDATE_STATUS_SKIPPED):
+            raise UpdateProblemModuleStateError("Unexpected update_status returned: {}".format(update_status))
+    return update_status
 
 
 @outer_atomic
@@ -424,7 +518,8 @@ def _get_modules_to_update(course_id, usage_keys, student_identifier, filter_fcn
     if student:
         module_query_params['student_id'] = student.id
 
-    student_modules = StudentModule.get_state_by_params(**module_query_params)
+    # The student of each module is needed to update it.
+    student_modules = StudentModule.get_state_by_params(**module_query_params).select_related('student')
     if filter_fcn is not None:
         student_modules = filter_fcn(student_modules)
 
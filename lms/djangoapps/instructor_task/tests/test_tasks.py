@@ -11,6 +11,7 @@ from uuid import uuid4
 
 import ddt
 from celery.states import FAILURE, SUCCESS
+from django.test.utils import override_settings
 from django.utils.translation import ugettext_noop
 from mock import MagicMock, Mock, patch
 from nose.plugins.attrib import attr
@@ -490,6 +491,40 @@ class TestRescoreInstructorTask(TestInstructorTasks):
         )
 
 
+    @override_settings(INSTRUCTOR_TASK_MODULES_PER_SUBTASK=3)
+    def test_rescoring_in_subtasks(self):
+        """
+        Tests rescoring a problem for many students is split across subtasks.
+        """
+        mock_instance = MagicMock()
+        getattr(mock_instance, 'rescore').return_value = None
+        mock_instance.has_submitted_answer.side_effect = [True] * 8 + [False] * 2
+
+        num_students = 10
+        self._create_students_with_state(num_students)
+        task_entry = self._create_input_entry()
+        with patch(
+                'lms.djangoapps.instructor_task.tasks_helper.module_state.get_module_for_descriptor_internal'
+        ) as mock_get_module:
+            mock_get_module.return_value = mock_instance
+            self._run_task_with_mock_celery(rescore_problem, task_entry.id, task_entry.task_id)
+
+        entry = InstructorTask.objects.get(id=task_entry.id)
+        self.assertEqual(entry.task_state, SUCCESS)
+        subtasks = json.loads(entry.subtasks)
+        self.assertEqual(subtasks['total'], 4)
+        self.assertEqual(subtasks['succeeded'], 4)
+        self.assertEqual(mock_instance.rescore.call_count, 8)
+        self.assert_task_output(
+            output=self.get_task_output(task_entry.id),
+            total=num_students,
+            attempted=8,
+            succeeded=8,
+            skipped=2,
+            failed=0,
+            action_name='rescored'
+        )
+
 @attr(shard=3)
 class TestResetAttemptsInstructorTask(TestInstructorTasks):
     """Tests instructor task that resets problem attempts."""
@@ -1740,6 +1740,21 @@ class TestCohortStudents(TestReportMixin, InstructorTaskCourseTestCase):
             verify_order=False
         )
 
+    def test_cohort_name_case(self):
+        result = self._cohort_students_and_upload(
+            'username,email,cohort\n'
+            ',student_1@example.com,cohort 1\n'
+            'student_2,,COHORT 2'
+        )
+        self.assertDictContainsSubset({'total': 2, 'attempted': 2, 'succeeded': 2, 'failed': 0}, result)
+        self.verify_rows_in_csv(
+            [
+                dict(zip(self.csv_header_row, ['cohort 1', 'True', '1', '', '', ''])),
+                dict(zip(self.csv_header_row, ['COHORT 2', 'True', '1', '', '', ''])),
+            ],
+            verify_order=False
+        )
+
     def test_preassigned_user(self):
         result = self._cohort_students_and_upload(
             'username,email,cohort\n'
@@ -639,6 +639,11 @@ POLICY_CHANGE_TASK_RATE_LIMIT = ENV_TOKENS.get('POLICY_CHANGE_TASK_RATE_LIMIT',
 # financial reports
 FINANCIAL_REPORTS = ENV_TOKENS.get("FINANCIAL_REPORTS", FINANCIAL_REPORTS)
 
+# Instructor tasks
+INSTRUCTOR_TASK_MODULES_PER_SUBTASK = ENV_TOKENS.get(
+    'INSTRUCTOR_TASK_MODULES_PER_SUBTASK', INSTRUCTOR_TASK_MODULES_PER_SUBTASK
+)
+
 ##### ORA2 ######
 # Prefix for uploads of example-based assessment AI classifiers
 # This can be used to separate uploads for different environments
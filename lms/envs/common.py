@@ -398,6 +398,14 @@ FEATURES = {
 
     # Whether to display the account deletion section the account settings page
     'ENABLE_ACCOUNT_DELETION': True,
+
+    # Whether to serve waffle switches, flags and course overrides from a process-wide snapshot,
+    # invalidated through the shared cache, instead of looking them up in every request.
+    'ENABLE_WAFFLE_SNAPSHOT': False,
+
+    # Whether to answer bulk enrollment checks of actively enrolled users from a cached
+    # per-course index of active enrollments by mode, instead of querying their enrollments.
+    'ENABLE_ENROLLMENT_INDEX': False,
 }
 
 # Settings for the course reviews tool template and identification key, set either to None to disable course reviews
@@ -2610,6 +2618,10 @@ FINANCIAL_REPORTS = {
     'ROOT_PATH': '/tmp/edx-s3/financial_reports',
 }
 
+#### Instructor task settings #####
+# Rescoring a problem for more student modules than this is split into subtasks of this size
+INSTRUCTOR_TASK_MODULES_PER_SUBTASK = 500
+
 #### Grading policy change-related settings #####
 # Rate limit for regrading tasks that a grading policy change can kick off
 POLICY_CHANGE_TASK_RATE_LIMIT = '300/h'
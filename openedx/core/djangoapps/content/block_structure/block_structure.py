@@ -8,6 +8,7 @@ The following internal data structures are implemented:
     _BlockRelations - Data structure for a single block's relations.
     _BlockData - Data structure for a single block's data.
 """
+from contextlib import contextmanager
 from copy import deepcopy
 from functools import partial
 from logging import getLogger
@@ -414,6 +415,10 @@ class BlockStructureBlockData(BlockStructure):
         # Map of a transformer's name to its non-block-specific data.
         self.transformer_data = TransformerDataMap()
 
+        # List of the (usage key, keep_descendants) of the blocks removed
+        # while removals are being recorded, None otherwise.
+        self._removed_blocks = None
+
     def copy(self):
         """
         Returns a new instance of BlockStructureBlockData with a
@@ -427,6 +432,48 @@ class BlockStructureBlockData(BlockStructure):
             deepcopy(self._block_data_map),
         )
 
+    def copy_subtree(self, usage_key):
+        """
+        Returns a new instance of BlockStructureBlockData rooted at the
+        given usage key, with a deep-copy of the relations and data of
+        the blocks in its subtree only.
+
+        Relations to parents outside of the subtree are dropped, but
+        the data of the root's ancestors is still copied so that it
+        remains available to transformers.
+
+        Arguments:
+            usage_key (UsageKey) - Usage key of the root of the
+                subtree that is to be copied.
+        """
+        from .factory import BlockStructureFactory
+
+        subtree_keys = set(self.post_order_traversal(start_node=usage_key))
+        block_relations = {}
+        for block_key in subtree_keys:
+            relations = block_relations[block_key] = _BlockRelations()
+            relations.children = list(self.get_children(block_key))
+            relations.parents = [parent for parent in self.get_parents(block_key) if parent in subtree_keys]
+
+        ancestor_keys = set()
+        stack = list(self.get_parents(usage_key))
+        while stack:
+            ancestor_key = stack.pop()
+            if ancestor_key not in ancestor_keys:
+                ancestor_keys.add(ancestor_key)
+                stack.extend(self.get_parents(ancestor_key))
+
+        return BlockStructureFactory.create_new(
+            usage_key,
+            block_relations,
+            deepcopy(self.transformer_data),
+            deepcopy({
+                block_key: block_data
+                for block_key, block_data in self._block_data_map.iteritems()
+                if block_key in subtree_keys or block_key in ancestor_keys
+            }),
+        )
+
     def iteritems(self):
         """
         Returns iterator of (UsageKey, BlockData) pairs for all
@@ -639,6 +686,9 @@ class BlockStructureBlockData(BlockStructure):
                 for parent in parents:
                     self._add_relation(parent, child)
 
+        if self._removed_blocks is not None:
+            self._removed_blocks.append((usage_key, keep_descendants))
+
     def create_universal_filter(self):
         """
         Returns a filter function that always returns True for all blocks.
@@ -730,6 +780,19 @@ class BlockStructureBlockData(BlockStructure):
     #--- Internal methods ---#
     # To be used within the block_structure framework or by tests.
 
+    @contextmanager
+    def _record_removed_blocks(self):
+        """
+        A context manager yielding the list of the (usage key,
+        keep_descendants) of the blocks removed within its context,
+        in the order in which they were removed.
+        """
+        self._removed_blocks = removed_blocks = []
+        try:
+            yield removed_blocks
+        finally:
+            self._removed_blocks = None
+
     def _get_transformer_data_version(self, transformer):
         """
         Returns the version number stored for the given transformer.
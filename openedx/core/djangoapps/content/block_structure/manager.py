@@ -32,6 +32,7 @@ class BlockStructureManager(object):
         """
         self.root_block_usage_key = root_block_usage_key
         self.modulestore = modulestore
+        self.cache = cache
         self.store = BlockStructureStore(cache)
 
     def get_transformed(self, transformers, starting_block_usage_key=None, collected_block_structure=None):
@@ -60,20 +61,25 @@ class BlockStructureManager(object):
             BlockStructureBlockData - A transformed block structure,
                 starting at starting_block_usage_key.
         """
-        block_structure = collected_block_structure.copy() if collected_block_structure else self.get_collected()
+        block_structure = collected_block_structure or self.get_collected()
 
         if starting_block_usage_key:
-            # Override the root_block_usage_key so traversals start at the
-            # requested location.  The rest of the structure will be pruned
-            # as part of the transformation.
+            # Only copy the subtree at the requested location, so the
+            # transformers don't traverse the rest of the structure.
             if starting_block_usage_key not in block_structure:
                 raise UsageKeyNotInBlockStructure(
                     "The requested usage_key '{0}' is not found in the block_structure with root '{1}'",
                     unicode(starting_block_usage_key),
                     unicode(self.root_block_usage_key),
                 )
-            block_structure.set_root_block(starting_block_usage_key)
-        transformers.transform(block_structure)
+            block_structure = block_structure.copy_subtree(starting_block_usage_key)
+        elif collected_block_structure:
+            block_structure = block_structure.copy()
+
+        if config.waffle().is_enabled(config.CACHE_FILTERED_BLOCKS):
+            transformers.transform(block_structure, filtered_blocks_cache=self.cache)
+        else:
+            transformers.transform(block_structure)
         return block_structure
 
     def get_collected(self):
@@ -105,6 +111,26 @@ class BlockStructureManager(object):
 
         return block_structure
 
+    def get_collected_if_cached(self):
+        """
+        Returns the collected Block Structure for the root_block_usage_key
+        if it is already in the store, without accessing the modulestore.
+
+        Returns:
+            BlockStructureBlockData - The collected block structure, or None
+                if it isn't in the store or its collected data is
+                incompatible with the registered transformers.
+        """
+        try:
+            block_structure = BlockStructureFactory.create_from_store(
+                self.root_block_usage_key,
+                self.store,
+            )
+            BlockStructureTransformers.verify_versions(block_structure)
+        except (BlockStructureNotFound, TransformerDataIncompatible):
+            return None
+        return block_structure
+
     def update_collected_if_needed(self):
         """
         The store is updated with newly collected transformers data from
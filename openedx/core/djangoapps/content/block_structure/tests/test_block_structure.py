@@ -308,3 +308,23 @@ class TestBlockStructureData(TestCase, ChildrenMapTestMixin):
         _set_value(new_copy, 'edit2')
         self.assertEquals(_get_value(block_structure), 'edit1')
         self.assertEquals(_get_value(new_copy), 'edit2')
+
+    def test_copy_subtree(self):
+        block_structure = self.create_block_structure(ChildrenMapTestMixin.DAG_CHILDREN_MAP)
+        for block in range(len(ChildrenMapTestMixin.DAG_CHILDREN_MAP)):
+            block_structure.set_transformer_block_field(block, 'transformer', 'test_key', block)
+
+        subtree = block_structure.copy_subtree(2)
+        self.assertEquals(subtree.root_block_usage_key, 2)
+
+        # the relations to block 1, outside of the subtree, are dropped
+        self.assert_block_structure(subtree, [[], [], [3, 4], [5, 6], [], [], []], missing_blocks=[0, 1])
+        self.assertEquals(subtree.get_parents(3), [2])
+
+        # the data of the ancestors is still available
+        self.assertEquals(subtree.get_transformer_block_field(0, 'transformer', 'test_key'), 0)
+        self.assertIsNone(subtree.get_transformer_block_field(1, 'transformer', 'test_key'))
+
+        # verify edits to the subtree do not affect the original
+        subtree.set_transformer_block_field(3, 'transformer', 'test_key', 'edit')
+        self.assertEquals(block_structure.get_transformer_block_field(3, 'transformer', 'test_key'), 3)
@@ -171,6 +171,18 @@ class TestBlockStructureManager(UsageKeyFactoryMixin, ChildrenMapTestMixin, Test
         self.collect_and_verify(expect_modulestore_called=False, expect_cache_updated=False)
         self.assertEquals(TestTransformer1.collect_call_count, 1)
 
+    def test_get_collected_if_cached(self):
+        with mock_registered_transformers(self.registered_transformers):
+            self.assertIsNone(self.bs_manager.get_collected_if_cached())
+            self.assertEquals(self.modulestore.get_items_call_count, 0)
+
+            self.bs_manager.get_collected()
+            self.modulestore.get_items_call_count = 0
+            block_structure = self.bs_manager.get_collected_if_cached()
+        self.assert_block_structure(block_structure, self.children_map)
+        self.assertEquals(self.modulestore.get_items_call_count, 0)
+        self.assertEquals(TestTransformer1.collect_call_count, 1)
+
     def test_get_collected_error_raised(self):
         with waffle().override(RAISE_ERROR_WHEN_NOT_FOUND, active=True):
             with mock_registered_transformers(self.registered_transformers):
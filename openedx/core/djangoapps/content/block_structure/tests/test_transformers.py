@@ -9,7 +9,7 @@ from ..block_structure import BlockStructureModulestoreData
 from ..exceptions import TransformerException, TransformerDataIncompatible
 from ..transformers import BlockStructureTransformers
 from .helpers import (
-    ChildrenMapTestMixin, MockTransformer, MockFilteringTransformer, mock_registered_transformers
+    ChildrenMapTestMixin, MockCache, MockTransformer, MockFilteringTransformer, mock_registered_transformers
 )
 
 
@@ -71,6 +71,18 @@ class TestBlockStructureTransformers(ChildrenMapTestMixin, TestCase):
             self.transformers.transform(block_structure=MagicMock())
             self.assertTrue(mock_transform_call.called)
 
+    def test_get_usage_signature(self):
+        self.add_mock_transformer()
+        block_structure = MagicMock()
+        self.assertIsNone(self.transformers.get_usage_signature(block_structure))
+
+        with patch.object(self.registered_transformers[0], 'transform_signature', return_value=()):
+            with patch.object(self.registered_transformers[1], 'transform_signature', return_value='filters'):
+                self.assertEqual(
+                    self.transformers.get_usage_signature(block_structure),
+                    (('MockFilteringTransformer', 1, 'filters'), ('MockTransformer', 1, ())),
+                )
+
     def test_verify_versions(self):
         block_structure = self.create_block_structure(
             self.SIMPLE_CHILDREN_MAP,
@@ -82,3 +94,87 @@ class TestBlockStructureTransformers(ChildrenMapTestMixin, TestCase):
                 self.transformers.verify_versions(block_structure)
             self.transformers.collect(block_structure)
             self.assertTrue(self.transformers.verify_versions(block_structure))
+
+
+class MockSignedFilteringTransformer(MockFilteringTransformer):
+    """
+    A mock filtering transformer removing block 1 for all usages.
+    """
+    def transform_block_filters_signature(self, usage_info, block_structure):
+        return 'everyone'
+
+    def transform_block_filters(self, usage_info, block_structure):
+        return [block_structure.create_removal_filter(lambda block_key: block_key == 1)]
+
+
+class MockUnsignedFilteringTransformer(MockFilteringTransformer):
+    """
+    A mock filtering transformer removing block 2, without a signature.
+    """
+    def transform_block_filters(self, usage_info, block_structure):
+        return [block_structure.create_removal_filter(lambda block_key: block_key == 2)]
+
+
+@attr(shard=2)
+@patch(
+    'openedx.core.djangoapps.content.block_structure.config.cache_timeout_in_seconds',
+    MagicMock(return_value=60),
+)
+class TestFilteredBlocksCache(ChildrenMapTestMixin, TestCase):
+    """
+    Test class for the caching of the blocks removed by filtering transformers.
+    """
+    def setUp(self):
+        super(TestFilteredBlocksCache, self).setUp()
+        self.cache = MockCache()
+        self.signed_transformer = MockSignedFilteringTransformer()
+        self.unsigned_transformer = MockUnsignedFilteringTransformer()
+        with mock_registered_transformers([self.signed_transformer, self.unsigned_transformer]):
+            self.transformers = BlockStructureTransformers(
+                [self.signed_transformer, self.unsigned_transformer],
+                usage_info=MagicMock(),
+            )
+
+    def transform(self, course_version=u'version'):
+        """
+        Transforms a new simple block structure of the given course
+        version, and verifies that blocks 1 and 2 were filtered out.
+        """
+        block_structure = self.create_block_structure(self.SIMPLE_CHILDREN_MAP)
+        block_structure._get_or_create_block(0)  # pylint: disable=protected-access
+        block_structure.override_xblock_field(0, 'course_version', course_version)
+
+        self.transformers.transform(block_structure, filtered_blocks_cache=self.cache)
+        self.assert_block_structure(block_structure, [[], [], [], [], []], missing_blocks=[1, 2, 3, 4])
+
+    def test_removed_blocks_reused(self):
+        self.transform()
+        self.assertEqual(self.cache.set_call_count, 1)
+
+        with patch.object(
+            self.signed_transformer, 'transform_block_filters', wraps=self.signed_transformer.transform_block_filters
+        ) as mock_signed_filters:
+            with patch.object(
+                self.unsigned_transformer,
+                'transform_block_filters',
+                wraps=self.unsigned_transformer.transform_block_filters,
+            ) as mock_unsigned_filters:
+                self.transform()
+
+        self.assertFalse(mock_signed_filters.called)
+        self.assertTrue(mock_unsigned_filters.called)
+        self.assertEqual(self.cache.set_call_count, 1)
+
+    def test_removed_blocks_per_version(self):
+        self.transform(course_version=u'version1')
+        self.transform(course_version=u'version2')
+        self.assertEqual(self.cache.set_call_count, 2)
+
+    def test_no_course_version(self):
+        self.transform(course_version=None)
+        self.assertEqual(self.cache.set_call_count, 0)
+
+    def test_no_signature(self):
+        with patch.object(self.signed_transformer, 'transform_block_filters_signature', return_value=None):
+            self.transform()
+        self.assertEqual(self.cache.set_call_count, 0)
@@ -155,6 +155,24 @@ class BlockStructureTransformer(object):
         """
         raise NotImplementedError
 
+    def transform_signature(self, usage_info, block_structure):  # pylint: disable=unused-argument
+        """
+        Returns a hashable value such that, for a given version of the
+        course, the transform method produces the same result for all
+        usages with an equal signature. Clients may then share the
+        result of a transformation between such usages.
+
+        Transformers whose result depends on any usage-specific state
+        that can't be summarized must return None, the default.
+
+        Arguments:
+            usage_info (any negotiated type) - See transform.
+
+            block_structure (BlockStructureBlockData) - The block
+                structure that is to be transformed.
+        """
+        return None
+
 
 class FilteringTransformerMixin(BlockStructureTransformer):
     """
@@ -207,3 +225,32 @@ class FilteringTransformerMixin(BlockStructureTransformer):
                 transformer, that is to be transformed in place.
         """
         raise NotImplementedError
+
+    def transform_signature(self, usage_info, block_structure):
+        """
+        By default, the signature of a FilteringTransformer is the
+        signature of its filters.
+        """
+        return self.transform_block_filters_signature(usage_info, block_structure)
+
+    def transform_block_filters_signature(self, usage_info, block_structure):  # pylint: disable=unused-argument
+        """
+        Returns a hashable value such that, for a given version of the
+        course, the filters returned by transform_block_filters remove
+        the same blocks for all usages with an equal signature. For
+        example, a transformer that only hides content from non-staff
+        users could return whether the user has staff access.
+
+        When a signature is returned, the blocks removed by the filters
+        may be cached and shared between usages with the same signature,
+        instead of evaluating the filters again. Transformers whose
+        filters depend on any other usage-specific state must return
+        None, the default, to always be applied.
+
+        Arguments:
+            usage_info (any negotiated type) - See transform_block_filters.
+
+            block_structure (BlockStructureBlockData) - The block
+                structure that is to be transformed.
+        """
+        return None
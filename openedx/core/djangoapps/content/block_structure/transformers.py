@@ -2,8 +2,12 @@
 Module for a collection of BlockStructureTransformers.
 """
 import functools
+from hashlib import sha1
 from logging import getLogger
 
+from openedx.core.lib.cache_utils import zpickle, zunpickle
+
+from . import config
 from .exceptions import TransformerException, TransformerDataIncompatible
 from .transformer import FilteringTransformerMixin
 from .transformer_registry import TransformerRegistry
@@ -79,6 +83,11 @@ class BlockStructureTransformers(object):
             block_structure._add_transformer(transformer)  # pylint: disable=protected-access
             transformer.collect(block_structure)
 
+        # The course version is needed to share the blocks removed by
+        # filtering transformers between usages, and to tell whether the
+        # collected structure is still current.
+        block_structure.request_xblock_fields('course_version')
+
         # Collect all fields that were requested by the transformers.
         block_structure._collect_requested_xblock_fields()  # pylint: disable=protected-access
 
@@ -105,20 +114,40 @@ class BlockStructureTransformers(object):
             )
         return True
 
-    def transform(self, block_structure):
+    def transform(self, block_structure, filtered_blocks_cache=None):
         """
         The given block structure is transformed by each transformer in the
         collection. Tranformers with filters are combined and run first in a
         single course tree traversal, then remaining transformers are run in
         the order that they were added.
+
+        If a filtered_blocks_cache is given, the blocks removed by the
+        filtering transformers that provide a filters signature are
+        stored in it and reused for later usages with the same
+        signatures, instead of evaluating their filters again.
         """
-        self._transform_with_filters(block_structure)
+        self._transform_with_filters(block_structure, filtered_blocks_cache)
         self._transform_without_filters(block_structure)
 
         # Prune the block structure to remove any unreachable blocks.
         block_structure._prune_unreachable()  # pylint: disable=protected-access
 
-    def _transform_with_filters(self, block_structure):
+    def get_usage_signature(self, block_structure):
+        """
+        Returns a hashable value that is equal for all usages for which
+        the transformers in the collection transform the given block
+        structure in the same way, or None if any of the transformers
+        doesn't provide a signature.
+        """
+        signatures = []
+        for transformer in self._transformers['supports_filter'] + self._transformers['no_filter']:
+            signature = transformer.transform_signature(self.usage_info, block_structure)
+            if signature is None:
+                return None
+            signatures.append((transformer.name(), transformer.READ_VERSION, signature))
+        return tuple(signatures)
+
+    def _transform_with_filters(self, block_structure, filtered_blocks_cache=None):
         """
         Transforms the given block_structure using the transform_block_filters
         method from the given transformers.
@@ -126,16 +155,74 @@ class BlockStructureTransformers(object):
         if not self._transformers['supports_filter']:
             return
 
-        filters = []
+        cache_key = None
+        if filtered_blocks_cache is not None:
+            cacheable, uncacheable, cache_key = self._get_filtered_blocks_cache_key(block_structure)
+
+        if cache_key is None:
+            block_structure.filter_topological_traversal(
+                self._combine_filters(block_structure, self._transformers['supports_filter'])
+            )
+            return
+
+        # Filters are all created before the structure is modified, as
+        # they would be when combined in a single traversal.
+        cached_removed_blocks = filtered_blocks_cache.get(cache_key)
+        if cached_removed_blocks is None:
+            cacheable_filters = self._combine_filters(block_structure, cacheable)
+        uncacheable_filters = self._combine_filters(block_structure, uncacheable) if uncacheable else None
+
+        if cached_removed_blocks is None:
+            with block_structure._record_removed_blocks() as removed_blocks:  # pylint: disable=protected-access
+                block_structure.filter_topological_traversal(cacheable_filters)
+            filtered_blocks_cache.set(cache_key, zpickle(removed_blocks), config.cache_timeout_in_seconds())
+        else:
+            for usage_key, keep_descendants in zunpickle(cached_removed_blocks):
+                if usage_key in block_structure:
+                    block_structure.remove_block(usage_key, keep_descendants)
+
+        if uncacheable_filters:
+            block_structure.filter_topological_traversal(uncacheable_filters)
+
+    def _get_filtered_blocks_cache_key(self, block_structure):
+        """
+        Returns the filtering transformers that provide a filters
+        signature, those that don't, and the cache key of the blocks
+        removed by the former for this usage, or None if the removed
+        blocks can't be shared.
+        """
+        cacheable, uncacheable, signatures = [], [], []
         for transformer in self._transformers['supports_filter']:
+            signature = transformer.transform_block_filters_signature(self.usage_info, block_structure)
+            if signature is None:
+                uncacheable.append(transformer)
+            else:
+                cacheable.append(transformer)
+                signatures.append((transformer.name(), transformer.READ_VERSION, signature))
+
+        root_block_usage_key = block_structure.root_block_usage_key
+        course_version = block_structure.get_xblock_field(root_block_usage_key, 'course_version')
+        if not cacheable or course_version is None:
+            return cacheable, uncacheable, None
+
+        return cacheable, uncacheable, u'block_structure.filtered_blocks.{}'.format(
+            sha1(repr((unicode(root_block_usage_key), unicode(course_version), signatures))).hexdigest()
+        )
+
+    def _combine_filters(self, block_structure, transformers):
+        """
+        Returns a single filter combining the filters of the given
+        transformers.
+        """
+        filters = []
+        for transformer in transformers:
             filters.extend(transformer.transform_block_filters(self.usage_info, block_structure))
 
-        combined_filters = functools.reduce(
+        return functools.reduce(
             self._filter_chain,
             filters,
             block_structure.create_universal_filter()
         )
-        block_structure.filter_topological_traversal(combined_filters)
 
     def _filter_chain(self, accumulated, additional):
         """
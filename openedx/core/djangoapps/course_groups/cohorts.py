@@ -5,12 +5,15 @@ forums, and to the cohort admin views.
 
 import logging
 import random
+from collections import OrderedDict, defaultdict
 
 from courseware import courses
+from django.apps import apps
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
 from django.core.validators import validate_email
 from django.db import IntegrityError, transaction
+from django.db.models import Q
 from django.db.models.signals import m2m_changed, post_save
 from django.dispatch import receiver
 from django.http import Http404
@@ -18,7 +21,7 @@ from django.utils.translation import ugettext as _
 from eventtracking import tracker
 from openedx.core.djangoapps.request_cache import clear_cache, get_cache
 from openedx.core.djangoapps.request_cache.middleware import request_cached
-from student.models import get_user_by_username_or_email
+from student.models import get_user_by_username_or_email, strip_if_string
 
 from .models import (
     CohortMembership,
@@ -502,6 +505,241 @@ def add_user_to_cohort(cohort, username_or_email):
                 raise ex
 
 
+# Outcomes of each assignment of add_users_to_cohorts.
+COHORT_ASSIGNMENT_ADDED = 'added'
+COHORT_ASSIGNMENT_PREASSIGNED = 'preassigned'
+COHORT_ASSIGNMENT_ALREADY_PRESENT = 'already_present'
+COHORT_ASSIGNMENT_USER_NOT_FOUND = 'user_not_found'
+COHORT_ASSIGNMENT_INVALID_EMAIL = 'invalid_email'
+
+
+def add_users_to_cohorts(course_key, assignments):
+    """
+    Add users to cohorts of a course in bulk, with the same outcome, events and
+    signals as calling add_user_to_cohort for each assignment in turn.
+
+    Users are looked up, and memberships and preassignments are written, with a
+    few queries for all the assignments. If a conflicting membership or
+    preassignment is written concurrently, the assignments are applied one at a
+    time with add_user_to_cohort instead.
+
+    Arguments:
+        course_key: CourseKey of the course of the cohorts
+        assignments: list of (username_or_email, cohort) pairs, where cohort is a CourseUserGroup
+
+    Returns:
+        list of the outcome of each assignment, one of the COHORT_ASSIGNMENT_* values:
+        the user was added to the cohort, the email address was preassigned to it, the
+        user was already present in it, the user could not be found, or the email
+        address is invalid.
+
+    Raises:
+        User.MultipleObjectsReturned if a username or email matches more than one user.
+    """
+    users = _get_users_by_username_or_email([username_or_email for username_or_email, _cohort in assignments])
+    memberships = {
+        membership.user_id: membership
+        for membership in CohortMembership.objects.filter(
+            course_id=course_key,
+            user_id__in=[user.id for user in users.itervalues()],
+        ).select_related('course_user_group')
+    }
+
+    # Apply the assignments in turn to the current cohort of each user, then write the resulting changes.
+    original_cohorts = {user_id: membership.course_user_group for user_id, membership in memberships.iteritems()}
+    current_cohorts = dict(original_cohorts)
+    preassignments = OrderedDict()
+    outcomes, events, updated_users = [], [], []
+    for username_or_email, cohort in assignments:
+        user = users.get(strip_if_string(username_or_email).lower())
+        if user is None:
+            try:
+                validate_email(username_or_email)
+            except ValidationError:
+                outcomes.append(
+                    COHORT_ASSIGNMENT_INVALID_EMAIL if "@" in username_or_email else COHORT_ASSIGNMENT_USER_NOT_FOUND
+                )
+                continue
+            preassignments[username_or_email] = cohort
+            events.append((
+                "edx.cohort.email_address_preassigned",
+                {"user_email": username_or_email, "cohort_id": cohort.id, "cohort_name": cohort.name},
+            ))
+            outcomes.append(COHORT_ASSIGNMENT_PREASSIGNED)
+            continue
+
+        previous_cohort = current_cohorts.get(user.id)
+        if previous_cohort is not None and previous_cohort.id == cohort.id:
+            outcomes.append(COHORT_ASSIGNMENT_ALREADY_PRESENT)
+            continue
+
+        current_cohorts[user.id] = cohort
+        if previous_cohort is not None:
+            events.append((
+                "edx.cohort.user_removed",
+                {"cohort_id": previous_cohort.id, "cohort_name": previous_cohort.name, "user_id": user.id},
+            ))
+        events.append((
+            "edx.cohort.user_added",
+            {"cohort_id": cohort.id, "cohort_name": cohort.name, "user_id": user.id},
+        ))
+        events.append((
+            "edx.cohort.user_add_requested",
+            {
+                "user_id": user.id,
+                "cohort_id": cohort.id,
+                "cohort_name": cohort.name,
+                "previous_cohort_id": previous_cohort.id if previous_cohort is not None else None,
+                "previous_cohort_name": previous_cohort.name if previous_cohort is not None else None,
+            }
+        ))
+        updated_users.append(user)
+        outcomes.append(COHORT_ASSIGNMENT_ADDED)
+
+    try:
+        with transaction.atomic():
+            _update_cohort_memberships(course_key, memberships, original_cohorts, current_cohorts)
+            _update_cohort_preassignments(course_key, preassignments)
+    except IntegrityError:
+        # A membership or preassignment was created since they were read, e.g. when a user was
+        # auto-cohorted on enrollment, so the users are added one at a time with the membership locked.
+        log.info(u"Adding %d users to cohorts one at a time in course %s", len(assignments), course_key)
+        return [
+            _add_user_to_cohort_outcome(cohort, username_or_email)
+            for username_or_email, cohort in assignments
+        ]
+
+    for event_name, event in events:
+        tracker.emit(event_name, event)
+    for user in updated_users:
+        COHORT_MEMBERSHIP_UPDATED.send(sender=None, user=user, course_key=course_key)
+
+    return outcomes
+
+
+def _add_user_to_cohort_outcome(cohort, username_or_email):
+    """
+    Adds the user to the cohort with add_user_to_cohort, and returns the
+    outcome of the assignment as one of the COHORT_ASSIGNMENT_* values.
+    """
+    try:
+        __, __, preassigned = add_user_to_cohort(cohort, username_or_email)
+    except ValueError:
+        return COHORT_ASSIGNMENT_ALREADY_PRESENT
+    except ValidationError:
+        return COHORT_ASSIGNMENT_INVALID_EMAIL
+    except User.DoesNotExist:
+        return COHORT_ASSIGNMENT_USER_NOT_FOUND
+    return COHORT_ASSIGNMENT_PREASSIGNED if preassigned else COHORT_ASSIGNMENT_ADDED
+
+
+def _get_users_by_username_or_email(usernames_or_emails):
+    """
+    Returns the users found by get_user_by_username_or_email for each of the given
+    usernames or emails, as a dict keyed by the stripped and lowercased username or email.
+
+    Raises:
+        User.MultipleObjectsReturned if a username or email matches more than one user.
+    """
+    UserRetirementRequest = apps.get_model('user_api', 'UserRetirementRequest')
+
+    identifiers = {strip_if_string(username_or_email) for username_or_email in usernames_or_emails}
+    matching_users = User.objects.filter(Q(email__in=identifiers) | Q(username__in=identifiers))
+    lowered_identifiers = {identifier.lower() for identifier in identifiers}
+
+    users = {}
+    for user in matching_users:
+        for identifier in {user.email.lower(), user.username.lower()} & lowered_identifiers:
+            if identifier in users:
+                raise User.MultipleObjectsReturned(
+                    u"More than one user matches the username or email {}".format(identifier)
+                )
+            users[identifier] = user
+
+    # Users found by their username are not found if they requested their retirement.
+    found_by_username = [user.id for identifier, user in users.iteritems() if user.username.lower() == identifier]
+    retiring_user_ids = set(
+        UserRetirementRequest.objects.filter(user_id__in=found_by_username).values_list('user_id', flat=True)
+    )
+    return {
+        identifier: user for identifier, user in users.iteritems()
+        if not (user.id in retiring_user_ids and user.username.lower() == identifier)
+    }
+
+
+def _update_cohort_memberships(course_key, memberships, original_cohorts, current_cohorts):
+    """
+    Writes the changes from the original to the current cohort of each user, with
+    bulk queries on CohortMembership and on the users of the cohorts.
+
+    Tracking events of the cohort users changes are left to the caller.
+    """
+    CohortUser = CourseUserGroup.users.through
+
+    new_memberships, moved_membership_ids = [], defaultdict(list)
+    added_cohort_users, removed_cohort_user_ids = [], defaultdict(list)
+    for user_id, cohort in current_cohorts.iteritems():
+        original_cohort = original_cohorts.get(user_id)
+        if original_cohort is not None and original_cohort.id == cohort.id:
+            continue
+        if original_cohort is None:
+            new_memberships.append(CohortMembership(course_user_group=cohort, user_id=user_id, course_id=course_key))
+        else:
+            moved_membership_ids[cohort.id].append(memberships[user_id].id)
+            removed_cohort_user_ids[original_cohort.id].append(user_id)
+        added_cohort_users.append(CohortUser(courseusergroup_id=cohort.id, user_id=user_id))
+
+    CohortMembership.objects.bulk_create(new_memberships)
+    for cohort_id, membership_ids in moved_membership_ids.iteritems():
+        CohortMembership.objects.filter(id__in=membership_ids).update(course_user_group_id=cohort_id)
+    for cohort_id, user_ids in removed_cohort_user_ids.iteritems():
+        CohortUser.objects.filter(courseusergroup_id=cohort_id, user_id__in=user_ids).delete()
+
+    # The users of a cohort may already include users who have no CohortMembership in the course, e.g.
+    # from before memberships were recorded, so only the missing cohort users are created.
+    existing_cohort_users = set(
+        CohortUser.objects.filter(
+            courseusergroup_id__in={cohort_user.courseusergroup_id for cohort_user in added_cohort_users},
+            user_id__in={cohort_user.user_id for cohort_user in added_cohort_users},
+        ).values_list('courseusergroup_id', 'user_id')
+    )
+    CohortUser.objects.bulk_create([
+        cohort_user for cohort_user in added_cohort_users
+        if (cohort_user.courseusergroup_id, cohort_user.user_id) not in existing_cohort_users
+    ])
+
+
+def _update_cohort_preassignments(course_key, preassignments):
+    """
+    Writes the cohort preassigned to each of the given email addresses.
+
+    Arguments:
+        preassignments: dict of CourseUserGroup by email address
+    """
+    existing_assignments = {
+        assignment.email: assignment
+        for assignment in UnregisteredLearnerCohortAssignments.objects.filter(
+            course_id=course_key,
+            email__in=preassignments.keys(),
+        )
+    }
+
+    new_assignments, moved_assignment_ids = [], defaultdict(list)
+    for email, cohort in preassignments.iteritems():
+        if email in existing_assignments:
+            moved_assignment_ids[cohort.id].append(existing_assignments[email].id)
+        else:
+            new_assignments.append(
+                UnregisteredLearnerCohortAssignments(course_user_group=cohort, email=email, course_id=course_key)
+            )
+
+    UnregisteredLearnerCohortAssignments.objects.bulk_create(new_assignments)
+    for cohort_id, assignment_ids in moved_assignment_ids.iteritems():
+        UnregisteredLearnerCohortAssignments.objects.filter(id__in=assignment_ids).update(
+            course_user_group_id=cohort_id
+        )
+
+
 def get_group_info_for_cohort(cohort, use_cached=False):
     """
     Get the ids of the group and partition to which this cohort has been linked
@@ -0,0 +1,164 @@
+"""
+Tests for adding users to cohorts in bulk
+"""
+# pylint: disable=no-member
+from mock import call, patch
+from nose.plugins.attrib import attr
+
+from django.db import IntegrityError, connection
+from django.test.utils import CaptureQueriesContext
+
+from student.models import CourseEnrollment
+from student.tests.factories import UserFactory
+from xmodule.modulestore.django import modulestore
+from xmodule.modulestore.tests.django_utils import TEST_DATA_MIXED_MODULESTORE, ModuleStoreTestCase
+from xmodule.modulestore.tests.factories import ToyCourseFactory
+
+from .. import cohorts
+from ..models import CohortMembership, UnregisteredLearnerCohortAssignments
+from ..tests.helpers import CohortFactory
+
+
+@attr(shard=2)
+class TestAddUsersToCohorts(ModuleStoreTestCase):
+    """
+    Test adding users to cohorts in bulk with cohorts.add_users_to_cohorts()
+    """
+    MODULESTORE = TEST_DATA_MIXED_MODULESTORE
+
+    def setUp(self):
+        super(TestAddUsersToCohorts, self).setUp()
+        self.course_key = ToyCourseFactory.create().id
+
+    @patch("openedx.core.djangoapps.course_groups.cohorts.tracker")
+    @patch("openedx.core.djangoapps.course_groups.cohorts.COHORT_MEMBERSHIP_UPDATED")
+    def test_add_users_to_cohorts(self, mock_signal, mock_tracker):
+        """
+        Make sure cohorts.add_users_to_cohorts() has the same outcome as adding
+        each user in turn with cohorts.add_user_to_cohort().
+        """
+        moved_user = UserFactory(username="Username", email="a@b.com")
+        new_user = UserFactory(username="OtherUsername", email="b@b.com")
+        course = modulestore().get_course(self.course_key)
+        CourseEnrollment.enroll(moved_user, self.course_key)
+        CourseEnrollment.enroll(new_user, self.course_key)
+        first_cohort = CohortFactory(course_id=course.id, name="FirstCohort")
+        second_cohort = CohortFactory(course_id=course.id, name="SecondCohort")
+        cohorts.add_user_to_cohort(first_cohort, "Username")
+        mock_tracker.reset_mock()
+        mock_signal.reset_mock()
+
+        outcomes = cohorts.add_users_to_cohorts(self.course_key, [
+            ("Username", second_cohort),
+            ("b@b.com", first_cohort),
+            ("otherusername", first_cohort),
+            ("new_email@example.com", first_cohort),
+            ("new_email@example.com", second_cohort),
+            ("non_existent_username", first_cohort),
+            ("invalid@email", first_cohort),
+        ])
+
+        self.assertEqual(outcomes, [
+            cohorts.COHORT_ASSIGNMENT_ADDED,
+            cohorts.COHORT_ASSIGNMENT_ADDED,
+            cohorts.COHORT_ASSIGNMENT_ALREADY_PRESENT,
+            cohorts.COHORT_ASSIGNMENT_PREASSIGNED,
+            cohorts.COHORT_ASSIGNMENT_PREASSIGNED,
+            cohorts.COHORT_ASSIGNMENT_USER_NOT_FOUND,
+            cohorts.COHORT_ASSIGNMENT_INVALID_EMAIL,
+        ])
+        self.assertEqual(cohorts.get_cohort(moved_user, self.course_key), second_cohort)
+        self.assertEqual(cohorts.get_cohort(new_user, self.course_key), first_cohort)
+        self.assertEqual(list(first_cohort.users.all()), [new_user])
+        self.assertEqual(list(second_cohort.users.all()), [moved_user])
+        self.assertEqual(
+            UnregisteredLearnerCohortAssignments.objects.get(email="new_email@example.com").course_user_group,
+            second_cohort
+        )
+        mock_tracker.emit.assert_any_call(
+            "edx.cohort.user_add_requested",
+            {
+                "user_id": moved_user.id,
+                "cohort_id": second_cohort.id,
+                "cohort_name": second_cohort.name,
+                "previous_cohort_id": first_cohort.id,
+                "previous_cohort_name": first_cohort.name,
+            }
+        )
+        mock_tracker.emit.assert_any_call(
+            "edx.cohort.user_removed",
+            {"cohort_id": first_cohort.id, "cohort_name": first_cohort.name, "user_id": moved_user.id}
+        )
+        mock_signal.send.assert_has_calls([
+            call(sender=None, user=moved_user, course_key=self.course_key),
+            call(sender=None, user=new_user, course_key=self.course_key),
+        ])
+
+    @patch("openedx.core.djangoapps.course_groups.cohorts.COHORT_MEMBERSHIP_UPDATED")
+    def test_add_users_to_cohorts_queries(self, _mock_signal):
+        """
+        Make sure the number of queries of cohorts.add_users_to_cohorts() does not
+        depend on the number of assignments.
+        """
+        course = modulestore().get_course(self.course_key)
+        first_cohort = CohortFactory(course_id=course.id, name="FirstCohort")
+        second_cohort = CohortFactory(course_id=course.id, name="SecondCohort")
+        first_users = [UserFactory() for _ in range(2)]
+        second_users = [UserFactory() for _ in range(10)]
+
+        with CaptureQueriesContext(connection) as first_queries:
+            cohorts.add_users_to_cohorts(
+                self.course_key,
+                [(user.username, first_cohort) for user in first_users] + [("first@example.com", first_cohort)],
+            )
+        with CaptureQueriesContext(connection) as second_queries:
+            cohorts.add_users_to_cohorts(
+                self.course_key,
+                [(user.username, second_cohort) for user in second_users] + [("second@example.com", second_cohort)],
+            )
+
+        self.assertEqual(len(first_queries), len(second_queries))
+        self.assertEqual(set(first_cohort.users.all()), set(first_users))
+        self.assertEqual(set(second_cohort.users.all()), set(second_users))
+
+    @patch("openedx.core.djangoapps.course_groups.cohorts.COHORT_MEMBERSHIP_UPDATED")
+    def test_add_users_to_cohorts_existing_cohort_user(self, _mock_signal):
+        """
+        Make sure users who are already among the users of a cohort, without a
+        membership, are added to it.
+        """
+        user = UserFactory()
+        cohort = CohortFactory(course_id=self.course_key, name="Cohort")
+        cohort.users.add(user)
+
+        outcomes = cohorts.add_users_to_cohorts(self.course_key, [(user.username, cohort)])
+
+        self.assertEqual(outcomes, [cohorts.COHORT_ASSIGNMENT_ADDED])
+        self.assertEqual(list(cohort.users.all()), [user])
+        self.assertEqual(CohortMembership.objects.get(user=user, course_id=self.course_key).course_user_group, cohort)
+
+    @patch("openedx.core.djangoapps.course_groups.cohorts.COHORT_MEMBERSHIP_UPDATED")
+    def test_add_users_to_cohorts_concurrent_membership(self, _mock_signal):
+        """
+        Make sure the users are added one at a time when a conflicting membership
+        is written concurrently, e.g. when a user is auto-cohorted on enrollment.
+        """
+        user = UserFactory()
+        cohort = CohortFactory(course_id=self.course_key, name="Cohort")
+
+        with patch.object(cohorts, "_update_cohort_memberships", side_effect=IntegrityError):
+            outcomes = cohorts.add_users_to_cohorts(
+                self.course_key,
+                [(user.username, cohort), (user.username, cohort), ("new_email@example.com", cohort)],
+            )
+
+        self.assertEqual(outcomes, [
+            cohorts.COHORT_ASSIGNMENT_ADDED,
+            cohorts.COHORT_ASSIGNMENT_ALREADY_PRESENT,
+            cohorts.COHORT_ASSIGNMENT_PREASSIGNED,
+        ])
+        self.assertEqual(CohortMembership.objects.get(user=user, course_id=self.course_key).course_user_group, cohort)
+        self.assertEqual(
+            UnregisteredLearnerCohortAssignments.objects.get(email="new_email@example.com").course_user_group,
+            cohort
+        )
@@ -3,6 +3,10 @@ Contains methods for accessing weekly course highlights. Weekly highlights is a
 schedule experience built on the Schedules app.
 """
 import logging
+from datetime import datetime
+
+from django.conf import settings
+from pytz import UTC
 
 from courseware.module_render import get_module_for_descriptor
 from courseware.model_data import FieldDataCache
@@ -62,6 +66,46 @@ def get_week_highlights(user, course_key, week_num):
     return highlights
 
 
+def get_week_highlights_for_all_learners(course_key, week_num):
+    """
+    Get highlights (list of unicode strings) for a given week, if they are
+    the same for every learner in the course.  That is the case when no
+    section with highlights is hidden from any learner, so the highlights
+    can be read from the course descriptor without building a per-user
+    course module.
+    week_num starts at 1.
+
+    Returns:
+        The highlights, or None if they may differ between learners, in which
+        case get_week_highlights must be used for each learner.
+
+    Raises:
+        CourseUpdateDoesNotExist: if highlights do not exist for
+            the requested week_num.
+    """
+    course_descriptor = _get_course_with_highlights(course_key)
+    sections_with_highlights = _get_sections_with_highlights(course_descriptor)
+    if not all(_is_visible_to_all_learners(section) for section in sections_with_highlights):
+        return None
+    return _get_highlights_for_week(
+        sections_with_highlights,
+        week_num,
+        course_key,
+    )
+
+
+def _is_visible_to_all_learners(section):
+    """
+    Is the section released and not restricted to staff or to any group?
+    """
+    is_released = (
+        settings.FEATURES.get('DISABLE_START_DATES', False) or
+        section.start is None or
+        section.start <= datetime.now(UTC)
+    )
+    return is_released and not section.visible_to_staff_only and not any(section.group_access.values())
+
+
 def _get_course_with_highlights(course_key):
     # pylint: disable=missing-docstring
     if not COURSE_UPDATE_WAFFLE_FLAG.is_enabled(course_key):
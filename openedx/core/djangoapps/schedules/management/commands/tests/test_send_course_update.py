@@ -52,15 +52,21 @@ class TestSendCourseUpdate(ScheduleUpsellTestMixin, ScheduleSendEmailTestMixin,
         self.highlights_patcher = patch('openedx.core.djangoapps.schedules.resolvers.get_week_highlights')
         mock_highlights = self.highlights_patcher.start()
         mock_highlights.return_value = ['Highlight {}'.format(num + 1) for num in range(3)]
+        self.shared_highlights_patcher = patch(
+            'openedx.core.djangoapps.schedules.resolvers.get_week_highlights_for_all_learners',
+            return_value=None,
+        )
+        self.shared_highlights_patcher.start()
         self.addCleanup(self.stop_highlights_patcher)
 
     def stop_highlights_patcher(self):
         """
-        Stops the patcher for the get_week_highlights method
-        if the patch is still in progress.
+        Stops the patchers for the highlights methods
+        if the patches are still in progress.
         """
-        if _is_started(self.highlights_patcher):
-            self.highlights_patcher.stop()
+        for patcher in (self.highlights_patcher, self.shared_highlights_patcher):
+            if _is_started(patcher):
+                patcher.stop()
 
     @ddt.data(
         ExperienceTest(experience=ScheduleExperience.EXPERIENCES.default, offset=expected_offsets[0], email_sent=False),
@@ -73,7 +79,7 @@ class TestSendCourseUpdate(ScheduleUpsellTestMixin, ScheduleSendEmailTestMixin,
     @override_waffle_flag(COURSE_UPDATE_WAFFLE_FLAG, True)
     @patch('openedx.core.djangoapps.schedules.signals.get_current_site')
     def test_with_course_data(self, mock_get_current_site):
-        self.highlights_patcher.stop()
+        self.stop_highlights_patcher()
         mock_get_current_site.return_value = self.site_config.site
 
         course = CourseFactory(highlights_enabled_for_messaging=True, self_paced=True)
@@ -14,7 +14,10 @@ from edx_ace.recipient import Recipient
 
 from courseware.date_summary import verified_upgrade_deadline_link, verified_upgrade_link_is_valid
 from openedx.core.djangoapps.monitoring_utils import function_trace, set_custom_metric
-from openedx.core.djangoapps.schedules.content_highlights import get_week_highlights
+from openedx.core.djangoapps.schedules.content_highlights import (
+    get_week_highlights,
+    get_week_highlights_for_all_learners
+)
 from openedx.core.djangoapps.schedules.exceptions import CourseUpdateDoesNotExist
 from openedx.core.djangoapps.schedules.models import Schedule, ScheduleExperience
 from openedx.core.djangoapps.schedules.utils import PrefixedDebugLoggerMixin
@@ -345,12 +348,13 @@ class CourseUpdateResolver(BinnedSchedulesBaseResolver):
         )
 
         template_context = get_base_template_context(self.site)
+        highlights_by_course = {}
         for schedule in schedules:
             enrollment = schedule.enrollment
             user = enrollment.user
 
             try:
-                week_highlights = get_week_highlights(user, enrollment.course_id, week_num)
+                week_highlights = self._get_week_highlights(user, enrollment.course_id, week_num, highlights_by_course)
             except CourseUpdateDoesNotExist:
                 LOG.warning(
                     'Weekly highlights for user {} in week {} of course {} does not exist or is disabled'.format(
@@ -373,6 +377,32 @@ class CourseUpdateResolver(BinnedSchedulesBaseResolver):
 
                 yield (user, schedule.enrollment.course.closest_released_language, template_context)
 
+    @staticmethod
+    def _get_week_highlights(user, course_key, week_num, highlights_by_course):
+        """
+        Get the week's highlights for the user, resolving them once per course
+        when they are the same for every learner.
+
+        Arguments:
+            highlights_by_course (dict): Highlights already resolved for the
+                courses in this bin, updated in place.
+
+        Raises:
+            CourseUpdateDoesNotExist: if highlights do not exist for the week.
+        """
+        if course_key not in highlights_by_course:
+            try:
+                highlights_by_course[course_key] = get_week_highlights_for_all_learners(course_key, week_num)
+            except CourseUpdateDoesNotExist as exception:
+                highlights_by_course[course_key] = exception
+
+        highlights = highlights_by_course[course_key]
+        if isinstance(highlights, CourseUpdateDoesNotExist):
+            raise highlights
+        if highlights is None:
+            return get_week_highlights(user, course_key, week_num)
+        return highlights
+
 
 def _get_trackable_course_home_url(course_id):
     """
@@ -1,6 +1,10 @@
 # -*- coding: utf-8 -*-
 from openedx.core.djangoapps.schedules.config import COURSE_UPDATE_WAFFLE_FLAG
-from openedx.core.djangoapps.schedules.content_highlights import get_week_highlights, course_has_highlights
+from openedx.core.djangoapps.schedules.content_highlights import (
+    course_has_highlights,
+    get_week_highlights,
+    get_week_highlights_for_all_learners
+)
 from openedx.core.djangoapps.schedules.exceptions import CourseUpdateDoesNotExist
 from openedx.core.djangolib.testing.utils import skip_unless_lms
 from openedx.core.djangoapps.waffle_utils.testutils import override_waffle_flag
@@ -129,3 +133,24 @@ class TestContentHighlights(ModuleStoreTestCase):
         self.assertTrue(course_has_highlights(self.course_key))
         with self.assertRaises(CourseUpdateDoesNotExist):
             get_week_highlights(self.user, self.course_key, week_num=1)
+
+    @override_waffle_flag(COURSE_UPDATE_WAFFLE_FLAG, True)
+    def test_highlights_for_all_learners(self):
+        with self.store.bulk_operations(self.course_key):
+            self._create_chapter(highlights=[u'a', u'b'])
+            self._create_chapter(highlights=[u'c'])
+
+        self.assertEqual(
+            get_week_highlights_for_all_learners(self.course_key, week_num=2),
+            get_week_highlights(self.user, self.course_key, week_num=2),
+        )
+        with self.assertRaises(CourseUpdateDoesNotExist):
+            get_week_highlights_for_all_learners(self.course_key, week_num=3)
+
+    @override_waffle_flag(COURSE_UPDATE_WAFFLE_FLAG, True)
+    def test_highlights_for_all_learners_with_staff_only_section(self):
+        with self.store.bulk_operations(self.course_key):
+            self._create_chapter(highlights=[u'a'])
+            self._create_chapter(highlights=[u"I'm a secret!"], visible_to_staff_only=True)
+
+        self.assertIsNone(get_week_highlights_for_all_learners(self.course_key, week_num=1))
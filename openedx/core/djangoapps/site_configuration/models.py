@@ -3,16 +3,32 @@ Django models for site configurations.
 """
 import collections
 from logging import getLogger
+from uuid import uuid4
 
+import crum
 from django.contrib.sites.models import Site
-from django.db import models
-from django.db.models.signals import post_save
+from django.core.cache import cache
+from django.db import models, transaction
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from jsonfield.fields import JSONField
 from model_utils.models import TimeStampedModel
 
+from openedx.core.djangoapps.request_cache import clear_cache as clear_request_cache
+from openedx.core.djangoapps.request_cache import get_cache as get_request_cache
+
 logger = getLogger(__name__)  # pylint: disable=invalid-name
 
+# Shared cache key holding the current version of the org index. Changing the
+# version makes every process rebuild its copy of the index.
+ORG_INDEX_VERSION_CACHE_KEY = 'site_configuration.org_index.version'
+
+# Name of the request cache holding the org index used during a request.
+ORG_INDEX_REQUEST_CACHE = 'site_configuration.org_index'
+
+# Process-wide (version, {org: SiteConfiguration}) index of enabled site configurations.
+_org_index = (None, {})  # pylint: disable=invalid-name
+
 
 class SiteConfiguration(models.Model):
     """
@@ -74,14 +90,9 @@ class SiteConfiguration(models.Model):
         Returns:
             Configuration value for the given key.
         """
-        for configuration in cls.objects.filter(values__contains=org, enabled=True).all():
-            course_org_filter = configuration.get_value('course_org_filter', [])
-            # The value of 'course_org_filter' can be configured as a string representing
-            # a single organization or a list of strings representing multiple organizations.
-            if not isinstance(course_org_filter, list):
-                course_org_filter = [course_org_filter]
-            if org in course_org_filter:
-                return configuration.get_value(name, default)
+        configuration = cls._get_org_index().get(org)
+        if configuration is not None:
+            return configuration.get_value(name, default)
         return default
 
     @classmethod
@@ -93,14 +104,7 @@ class SiteConfiguration(models.Model):
         Returns:
             A list of all organizations present in site configuration.
         """
-        org_filter_set = set()
-
-        for configuration in cls.objects.filter(values__contains='course_org_filter', enabled=True).all():
-            course_org_filter = configuration.get_value('course_org_filter', [])
-            if not isinstance(course_org_filter, list):
-                course_org_filter = [course_org_filter]
-            org_filter_set.update(course_org_filter)
-        return org_filter_set
+        return set(cls._get_org_index())
 
     @classmethod
     def has_org(cls, org):
@@ -110,7 +114,51 @@ class SiteConfiguration(models.Model):
         Returns:
             True if given organization is present in site configurations otherwise False.
         """
-        return org in cls.get_all_orgs()
+        return org in cls._get_org_index()
+
+    @classmethod
+    def _get_org_index(cls):
+        """
+        Return a mapping of each org to the enabled site configuration whose
+        'course_org_filter' contains it.
+
+        The mapping is built from a single scan of the enabled configurations
+        and kept for the life of the process, until the version stored in the
+        shared cache changes. The version is only checked once per request.
+        """
+        if crum.get_current_request() is None:
+            return cls._get_current_org_index()
+
+        request_cache = get_request_cache(ORG_INDEX_REQUEST_CACHE)
+        if 'org_index' not in request_cache:
+            request_cache['org_index'] = cls._get_current_org_index()
+        return request_cache['org_index']
+
+    @classmethod
+    def _get_current_org_index(cls):
+        """
+        Return the process-wide org index, rebuilding it if its version is outdated.
+        """
+        global _org_index  # pylint: disable=global-statement,invalid-name
+
+        version = cache.get(ORG_INDEX_VERSION_CACHE_KEY)
+        if version is None:
+            cache.add(ORG_INDEX_VERSION_CACHE_KEY, uuid4().hex, None)
+            version = cache.get(ORG_INDEX_VERSION_CACHE_KEY)
+
+        index_version, configurations_by_org = _org_index
+        if version is None or version != index_version:
+            configurations_by_org = {}
+            for configuration in cls.objects.filter(enabled=True).order_by('id'):
+                course_org_filter = configuration.get_value('course_org_filter', [])
+                # The value of 'course_org_filter' can be configured as a string representing
+                # a single organization or a list of strings representing multiple organizations.
+                if not isinstance(course_org_filter, list):
+                    course_org_filter = [course_org_filter]
+                for org in course_org_filter:
+                    configurations_by_org.setdefault(org, configuration)
+            _org_index = (version, configurations_by_org)
+        return configurations_by_org
 
 
 class SiteConfigurationHistory(TimeStampedModel):
@@ -159,3 +207,21 @@ def update_site_configuration_history(sender, instance, **kwargs):  # pylint: di
         values=instance.values,
         enabled=instance.enabled,
     )
+
+
+@receiver(post_save, sender=SiteConfiguration)
+@receiver(post_delete, sender=SiteConfiguration)
+def invalidate_org_index(sender, **kwargs):  # pylint: disable=unused-argument
+    """
+    Invalidate the org index of every process when a site configuration changes.
+
+    The version is bumped again once the transaction commits, so that no
+    process can cache an index built from the uncommitted data.
+    """
+    def bump_version():
+        cache.set(ORG_INDEX_VERSION_CACHE_KEY, uuid4().hex, None)
+
+    bump_version()
+    # The current request sees its own changes right away.
+    clear_request_cache(ORG_INDEX_REQUEST_CACHE)
+    transaction.on_commit(bump_version)
@@ -1,14 +1,21 @@
 """
 Tests for site configuration's django models.
 """
-from mock import patch
+from mock import Mock, patch
 
+from django.core.cache import cache
 from django.test import TestCase
 from django.db import IntegrityError, transaction
 from django.contrib.sites.models import Site
 
-from openedx.core.djangoapps.site_configuration.models import SiteConfigurationHistory, SiteConfiguration
+from openedx.core.djangoapps.request_cache import clear_cache
+from openedx.core.djangoapps.site_configuration.models import (
+    ORG_INDEX_REQUEST_CACHE,
+    SiteConfiguration,
+    SiteConfigurationHistory
+)
 from openedx.core.djangoapps.site_configuration.tests.factories import SiteConfigurationFactory
+from openedx.core.djangolib.testing.utils import CacheIsolationTestCase
 
 
 class SiteConfigurationTests(TestCase):
@@ -317,3 +324,49 @@ class SiteConfigurationTests(TestCase):
             list(SiteConfiguration.get_all_orgs()),
             expected_orgs,
         )
+
+
+class SiteConfigurationOrgIndexTests(CacheIsolationTestCase):
+    """
+    Tests for the process-wide org index of SiteConfiguration.
+    """
+    ENABLED_CACHES = ['default']
+
+    def setUp(self):
+        super(SiteConfigurationOrgIndexTests, self).setUp()
+        self.site_configuration = SiteConfigurationFactory.create(
+            site=Site.objects.create(domain='org-index.example.com', name='org-index.example.com'),
+            values={'course_org_filter': ['IndexX', 'IndexY'], 'platform_name': 'Index'},
+        )
+
+    def test_lookups_do_not_query_once_indexed(self):
+        self.assertEqual(SiteConfiguration.get_all_orgs(), {'IndexX', 'IndexY'})
+        with self.assertNumQueries(0):
+            self.assertTrue(SiteConfiguration.has_org('IndexY'))
+            self.assertEqual(SiteConfiguration.get_value_for_org('IndexX', 'platform_name'), 'Index')
+            self.assertEqual(SiteConfiguration.get_value_for_org('OtherX', 'platform_name', 'default'), 'default')
+
+    def test_save_invalidates_index(self):
+        self.assertTrue(SiteConfiguration.has_org('IndexX'))
+        self.site_configuration.values = {'course_org_filter': 'IndexZ'}
+        self.site_configuration.save()
+        self.assertEqual(SiteConfiguration.get_all_orgs(), {'IndexZ'})
+
+    def test_delete_invalidates_index(self):
+        self.assertTrue(SiteConfiguration.has_org('IndexX'))
+        self.site_configuration.delete()
+        self.assertFalse(SiteConfiguration.has_org('IndexX'))
+
+    @patch('openedx.core.djangoapps.site_configuration.models.crum.get_current_request', Mock(return_value=Mock()))
+    def test_version_checked_once_per_request(self):
+        clear_cache(ORG_INDEX_REQUEST_CACHE)
+        self.addCleanup(clear_cache, ORG_INDEX_REQUEST_CACHE)
+        with patch('openedx.core.djangoapps.site_configuration.models.cache', Mock(wraps=cache)) as mock_cache:
+            self.assertTrue(SiteConfiguration.has_org('IndexX'))
+            self.assertEqual(SiteConfiguration.get_all_orgs(), {'IndexX', 'IndexY'})
+            self.assertEqual(mock_cache.get.call_count, 1)
+
+            # Changes made during the request are seen by the request.
+            self.site_configuration.values = {'course_org_filter': 'IndexZ'}
+            self.site_configuration.save()
+            self.assertEqual(SiteConfiguration.get_all_orgs(), {'IndexZ'})
@@ -23,6 +23,22 @@ from openedx.core.djangoapps.request_cache.middleware import RequestCache, reque
 
 logger = getLogger(__name__)  # pylint: disable=invalid-name
 
+# Process-wide tables of theme lookups which would otherwise hit the filesystem on every request.
+# Theme directories and template overrides only change on deploy, so entries are kept for the
+# lifetime of the process; call `clear_theme_lookup_caches` to reload them (e.g. in development).
+_THEME_BASE_DIRS = {}
+_THEME_TEMPLATE_PATHS = {}
+
+
+def clear_theme_lookup_caches():
+    """
+    Forget all resolved theme base directories and themed template paths.
+
+    Use this as a reload hook after themes or theme templates are added or removed on disk.
+    """
+    _THEME_BASE_DIRS.clear()
+    _THEME_TEMPLATE_PATHS.clear()
+
 
 @request_cached
 def get_template_path(relative_path, **kwargs):
@@ -82,12 +98,12 @@ def get_template_path_with_theme(relative_path):
     # strip `/` if present at the start of relative_path
     template_name = re.sub(r'^/+', '', relative_path)
 
-    template_path = theme.template_path / template_name
-    absolute_path = theme.path / "templates" / template_name
-    if absolute_path.exists():
-        return str(template_path)
-    else:
-        return relative_path
+    key = (unicode(theme.themes_base_dir), theme.theme_dir_name, theme.project_root, template_name)
+    if key not in _THEME_TEMPLATE_PATHS:
+        absolute_path = theme.path / "templates" / template_name
+        _THEME_TEMPLATE_PATHS[key] = str(theme.template_path / template_name) if absolute_path.exists() else None
+
+    return _THEME_TEMPLATE_PATHS[key] or relative_path
 
 
 def get_all_theme_template_dirs():
@@ -247,8 +263,14 @@ def get_theme_base_dir(theme_dir_name, suppress_error=False):
     Returns:
         (str): Base directory that contains the given theme
     """
-    for themes_dir in get_theme_base_dirs():
+    themes_dirs = get_theme_base_dirs()
+    key = (tuple(unicode(themes_dir) for themes_dir in themes_dirs), theme_dir_name)
+    if key in _THEME_BASE_DIRS:
+        return _THEME_BASE_DIRS[key]
+
+    for themes_dir in themes_dirs:
         if theme_dir_name in get_theme_dirs(themes_dir):
+            _THEME_BASE_DIRS[key] = themes_dir
             return themes_dir
 
     if suppress_error:
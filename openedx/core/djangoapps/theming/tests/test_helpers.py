@@ -10,7 +10,7 @@ from openedx.core.djangoapps.theming.tests.test_util import with_comprehensive_t
 from openedx.core.djangoapps.site_configuration import helpers as configuration_helpers
 from openedx.core.djangoapps.theming import helpers as theming_helpers
 from openedx.core.djangoapps.theming.helpers import get_template_path_with_theme, strip_site_theme_templates_path, \
-    get_themes, Theme, get_theme_base_dir
+    get_themes, Theme, get_theme_base_dir, clear_theme_lookup_caches
 from openedx.core.djangolib.testing.utils import skip_unless_cms, skip_unless_lms
 from openedx.core.djangoapps.request_cache.middleware import RequestCache
 
@@ -233,6 +233,32 @@ class TestHelpersLMS(TestCase):
         template_path = get_template_path_with_theme('header.html')
         self.assertEqual(template_path, 'header.html')
 
+    @with_comprehensive_theme('red-theme')
+    def test_get_template_path_with_theme_is_cached_across_requests(self):
+        """
+        Tests theme directories and template paths are resolved once per process until explicitly reloaded.
+        """
+        clear_theme_lookup_caches()
+        self.addCleanup(clear_theme_lookup_caches)
+        self.assertEqual(get_template_path_with_theme('header.html'), 'red-theme/lms/templates/header.html')
+        self.assertEqual(get_template_path_with_theme('course.html'), 'course.html')
+
+        with patch('openedx.core.djangoapps.theming.helpers.get_theme_dirs') as mock_get_theme_dirs:
+            with patch('path.Path.exists') as mock_exists:
+                RequestCache.clear_request_cache()
+                self.assertEqual(get_template_path_with_theme('header.html'), 'red-theme/lms/templates/header.html')
+                self.assertEqual(get_template_path_with_theme('course.html'), 'course.html')
+                self.assertFalse(mock_get_theme_dirs.called)
+                self.assertFalse(mock_exists.called)
+
+        RequestCache.clear_request_cache()
+        clear_theme_lookup_caches()
+        with patch(
+            'openedx.core.djangoapps.theming.helpers.get_theme_dirs', return_value=['red-theme']
+        ) as mock_get_theme_dirs:
+            self.assertEqual(get_template_path_with_theme('header.html'), 'red-theme/lms/templates/header.html')
+            self.assertTrue(mock_get_theme_dirs.called)
+
     @with_comprehensive_theme('red-theme')
     def test_strip_site_theme_templates_path_theme_enabled(self):
         """
@@ -71,6 +71,8 @@ from waffle import flag_is_active, switch_is_active
 
 from openedx.core.djangoapps.request_cache import get_cache as get_request_cache
 
+from .snapshot import get_snapshot
+
 log = logging.getLogger(__name__)
 
 
@@ -133,7 +135,11 @@ class WaffleSwitchNamespace(WaffleNamespace):
         namespaced_switch_name = self._namespaced_name(switch_name)
         value = self._cached_switches.get(namespaced_switch_name)
         if value is None:
-            value = switch_is_active(namespaced_switch_name)
+            snapshot = get_snapshot()
+            if snapshot:
+                value = snapshot.is_switch_active(namespaced_switch_name)
+            else:
+                value = switch_is_active(namespaced_switch_name)
             self._cached_switches[namespaced_switch_name] = value
         return value
 
@@ -270,13 +276,22 @@ class WaffleFlagNamespace(WaffleNamespace):
             # The callback needs to handle its own caching if it wants it.
             value = self._cached_flags.get(namespaced_flag_name)
             if value is None:
+                snapshot = get_snapshot()
 
                 if flag_undefined_default is not None:
                     # determine if the flag is undefined in waffle
-                    try:
-                        Flag.objects.get(name=namespaced_flag_name)
-                    except Flag.DoesNotExist:
-                        value = flag_undefined_default
+                    if snapshot:
+                        if not snapshot.flag_exists(namespaced_flag_name):
+                            value = flag_undefined_default
+                    else:
+                        try:
+                            Flag.objects.get(name=namespaced_flag_name)
+                        except Flag.DoesNotExist:
+                            value = flag_undefined_default
+
+                if value is None and snapshot:
+                    # flags forced on or off for everyone don't depend on the request
+                    value = snapshot.flag_value(namespaced_flag_name)
 
                 if value is None:
                     request = crum.get_current_request()
@@ -364,7 +379,11 @@ class CourseWaffleFlag(WaffleFlag):
             force_override = self.waffle_namespace._cached_flags.get(cache_key)
 
             if force_override is None:
-                force_override = WaffleFlagCourseOverrideModel.override_value(namespaced_flag_name, course_key)
+                snapshot = get_snapshot()
+                if snapshot:
+                    force_override = snapshot.course_override(namespaced_flag_name, course_key)
+                else:
+                    force_override = WaffleFlagCourseOverrideModel.override_value(namespaced_flag_name, course_key)
                 self.waffle_namespace._cached_flags[cache_key] = force_override
 
             if force_override == WaffleFlagCourseOverrideModel.ALL_CHOICES.on:
@@ -1,15 +1,21 @@
 """
 Models for configuring waffle utils.
 """
+from django.db import transaction
 from django.db.models import CharField
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.utils.translation import ugettext_lazy as _
 from model_utils import Choices
 from opaque_keys.edx.django.models import CourseKeyField
 from six import text_type
+from waffle.models import Flag, Switch
 
 from config_models.models import ConfigurationModel
 from openedx.core.djangoapps.request_cache.middleware import request_cached
 
+from .snapshot import bump_snapshot_version
+
 
 class WaffleFlagCourseOverrideModel(ConfigurationModel):
     """
@@ -60,3 +66,20 @@ class WaffleFlagCourseOverrideModel(ConfigurationModel):
         enabled_label = "Enabled" if self.enabled else "Not Enabled"
         # pylint: disable=no-member
         return u"Course '{}': Persistent Grades {}".format(text_type(self.course_id), enabled_label)
+
+
+@receiver(post_save, sender=Switch)
+@receiver(post_delete, sender=Switch)
+@receiver(post_save, sender=Flag)
+@receiver(post_delete, sender=Flag)
+@receiver(post_save, sender=WaffleFlagCourseOverrideModel)
+@receiver(post_delete, sender=WaffleFlagCourseOverrideModel)
+def invalidate_waffle_snapshot(sender, **kwargs):  # pylint: disable=unused-argument
+    """
+    Invalidate the waffle snapshot of every process when a switch, flag or course override changes.
+
+    The version is bumped again once the transaction commits, so that no
+    process can keep a snapshot loaded from the uncommitted data.
+    """
+    bump_snapshot_version()
+    transaction.on_commit(bump_snapshot_version)
@@ -0,0 +1,150 @@
+"""
+Process-wide snapshot of waffle switches, flags and course overrides.
+
+Checking a switch or flag normally costs a waffle cache or database lookup
+the first time it is checked in each request. When the ENABLE_WAFFLE_SNAPSHOT
+feature is enabled, all switches, flags and course overrides are instead loaded
+at once into a snapshot shared by all the requests served by the process.
+
+The snapshot is tagged with a version stored in the shared django cache, which
+is checked once per request and bumped whenever a switch, flag or course
+override is saved or deleted, so that each process reloads its snapshot.
+"""
+from uuid import uuid4
+
+import crum
+from django.conf import settings
+from django.core.cache import cache
+
+from openedx.core.djangoapps.request_cache import get_cache as get_request_cache
+
+SNAPSHOT_VERSION_CACHE_KEY = 'waffle_utils.snapshot.version'
+
+# Process-wide (version, WaffleSnapshot) pair.
+_snapshot = (None, None)  # pylint: disable=invalid-name
+
+
+class WaffleSnapshot(object):
+    """
+    The state of all waffle switches, flags and course overrides at a point in time.
+    """
+    def __init__(self, switches, flags, course_overrides):
+        """
+        Arguments:
+            switches (dict): active value of each switch, by name.
+            flags (dict): Flag instance of each flag, by name.
+            course_overrides (dict): override choice of each enabled course
+                override, by (flag name, course key).
+        """
+        self.switches = switches
+        self.flags = flags
+        self.course_overrides = course_overrides
+
+    @classmethod
+    def load(cls):
+        """
+        Loads a snapshot of the current switches, flags and course overrides from the database.
+        """
+        # Import is placed here to avoid model import at project startup.
+        from waffle.models import Flag, Switch
+        from .models import WaffleFlagCourseOverrideModel
+
+        switches = dict(Switch.objects.values_list('name', 'active'))
+        flags = {flag.name: flag for flag in Flag.objects.all()}
+
+        # Only the latest entry for each (flag, course) is current.
+        course_overrides = {}
+        overrides = WaffleFlagCourseOverrideModel.objects.order_by('change_date', 'id').values_list(
+            'waffle_flag', 'course_id', 'override_choice', 'enabled'
+        )
+        for waffle_flag, course_id, override_choice, enabled in overrides:
+            course_overrides[(waffle_flag, course_id)] = override_choice if enabled else None
+
+        return cls(
+            switches,
+            flags,
+            {key: choice for key, choice in course_overrides.iteritems() if choice is not None},
+        )
+
+    def is_switch_active(self, namespaced_switch_name):
+        """
+        Returns whether the given switch is active, like waffle's switch_is_active.
+        """
+        if namespaced_switch_name in self.switches:
+            return self.switches[namespaced_switch_name]
+        return getattr(settings, 'WAFFLE_SWITCH_DEFAULT', False)
+
+    def flag_exists(self, namespaced_flag_name):
+        """
+        Returns whether the given flag is defined.
+        """
+        return namespaced_flag_name in self.flags
+
+    def flag_value(self, namespaced_flag_name):
+        """
+        Returns whether the given flag is active, if this can be decided without
+        a request, i.e. it is forced on or off for everyone. Otherwise returns None.
+        """
+        flag = self.flags.get(namespaced_flag_name)
+        if flag is None or flag.everyone is None or flag.testing or getattr(settings, 'WAFFLE_OVERRIDE', False):
+            return None
+        return flag.everyone
+
+    def course_override(self, namespaced_flag_name, course_key):
+        """
+        Returns the override choice of the flag for the course, like
+        WaffleFlagCourseOverrideModel.override_value.
+        """
+        # Import is placed here to avoid model import at project startup.
+        from .models import WaffleFlagCourseOverrideModel
+
+        return self.course_overrides.get(
+            (namespaced_flag_name, course_key),
+            WaffleFlagCourseOverrideModel.ALL_CHOICES.unset,
+        )
+
+
+def get_snapshot():
+    """
+    Returns the current WaffleSnapshot, or None if snapshots are disabled or
+    no shared cache is available to keep them up to date.
+
+    The snapshot version is only checked once per request.
+    """
+    if not settings.FEATURES.get('ENABLE_WAFFLE_SNAPSHOT', False):
+        return None
+
+    if crum.get_current_request() is None:
+        return _get_current_snapshot()
+
+    request_cache = get_request_cache('waffle_utils.snapshot')
+    if 'snapshot' not in request_cache:
+        request_cache['snapshot'] = _get_current_snapshot()
+    return request_cache['snapshot']
+
+
+def _get_current_snapshot():
+    """
+    Returns the process-wide snapshot, reloading it if its version is outdated.
+    """
+    global _snapshot  # pylint: disable=global-statement, invalid-name
+
+    version = cache.get(SNAPSHOT_VERSION_CACHE_KEY)
+    if version is None:
+        cache.add(SNAPSHOT_VERSION_CACHE_KEY, uuid4().hex, None)
+        version = cache.get(SNAPSHOT_VERSION_CACHE_KEY)
+        if version is None:
+            return None
+
+    snapshot_version, snapshot = _snapshot
+    if version != snapshot_version:
+        snapshot = WaffleSnapshot.load()
+        _snapshot = (version, snapshot)
+    return snapshot
+
+
+def bump_snapshot_version():
+    """
+    Marks the snapshot of every process as outdated.
+    """
+    cache.set(SNAPSHOT_VERSION_CACHE_KEY, uuid4().hex, None)
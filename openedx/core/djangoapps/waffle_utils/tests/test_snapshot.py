@@ -0,0 +1,111 @@
+"""
+Tests for the process-wide waffle snapshot.
+"""
+import crum
+from django.conf import settings
+from django.test.client import RequestFactory
+from mock import patch
+from opaque_keys.edx.keys import CourseKey
+from waffle.models import Flag, Switch
+
+from openedx.core.djangoapps.request_cache.middleware import RequestCache
+from openedx.core.djangolib.testing.utils import CacheIsolationTestCase
+
+from .. import CourseWaffleFlag, WaffleFlagNamespace, WaffleSwitchNamespace
+from ..models import WaffleFlagCourseOverrideModel
+from ..snapshot import get_snapshot
+
+
+@patch.dict(settings.FEATURES, {'ENABLE_WAFFLE_SNAPSHOT': True})
+class TestWaffleSnapshot(CacheIsolationTestCase):
+    """
+    Tests the waffle snapshot used by the waffle namespaces.
+    """
+    ENABLED_CACHES = ['default']
+
+    TEST_COURSE_KEY = CourseKey.from_string("edX/DemoX/Demo_Course")
+    TEST_SWITCHES = WaffleSwitchNamespace("test_namespace")
+    TEST_FLAGS = WaffleFlagNamespace("test_namespace")
+    TEST_COURSE_FLAG = CourseWaffleFlag(TEST_FLAGS, "test_flag")
+
+    def setUp(self):
+        super(TestWaffleSnapshot, self).setUp()
+        self.new_request()
+        self.addCleanup(crum.set_current_request, None)
+
+    def new_request(self):
+        """
+        Simulates the start of a new request.
+        """
+        crum.set_current_request(RequestFactory().request())
+        RequestCache.clear_request_cache()
+
+    def test_switch(self):
+        Switch.objects.create(name="test_namespace.on", active=True)
+        self.assertTrue(self.TEST_SWITCHES.is_enabled("on"))
+
+        self.new_request()
+        with self.assertNumQueries(0):
+            self.assertTrue(self.TEST_SWITCHES.is_enabled("on"))
+            self.assertFalse(self.TEST_SWITCHES.is_enabled("undefined"))
+
+        switch = Switch.objects.get(name="test_namespace.on")
+        switch.active = False
+        switch.save()
+        self.new_request()
+        self.assertFalse(self.TEST_SWITCHES.is_enabled("on"))
+
+    def test_flag_for_everyone(self):
+        Flag.objects.create(name="test_namespace.everyone", everyone=True)
+        self.new_request()
+        with patch('openedx.core.djangoapps.waffle_utils.flag_is_active') as mock_flag_is_active:
+            self.assertTrue(self.TEST_FLAGS.is_flag_active("everyone"))
+            self.assertFalse(self.TEST_FLAGS.is_flag_active("undefined", flag_undefined_default=False))
+        self.assertFalse(mock_flag_is_active.called)
+
+    def test_flag_depending_on_request(self):
+        Flag.objects.create(name="test_namespace.staff", staff=True)
+        self.new_request()
+        with patch('openedx.core.djangoapps.waffle_utils.flag_is_active', return_value=True) as mock_flag_is_active:
+            self.assertTrue(self.TEST_FLAGS.is_flag_active("staff"))
+        self.assertTrue(mock_flag_is_active.called)
+
+    def test_course_override(self):
+        WaffleFlagCourseOverrideModel.objects.create(
+            waffle_flag="test_namespace.test_flag",
+            course_id=self.TEST_COURSE_KEY,
+            override_choice=WaffleFlagCourseOverrideModel.ALL_CHOICES.on,
+            enabled=True,
+        )
+        self.new_request()
+        with self.assertNumQueries(3):
+            # loads the snapshot: switches, flags and course overrides
+            self.assertTrue(self.TEST_COURSE_FLAG.is_enabled(self.TEST_COURSE_KEY))
+
+        # the latest entry for the course is disabled
+        WaffleFlagCourseOverrideModel.objects.create(
+            waffle_flag="test_namespace.test_flag",
+            course_id=self.TEST_COURSE_KEY,
+            override_choice=WaffleFlagCourseOverrideModel.ALL_CHOICES.on,
+            enabled=False,
+        )
+        self.new_request()
+        self.assertEqual(
+            get_snapshot().course_override("test_namespace.test_flag", self.TEST_COURSE_KEY),
+            WaffleFlagCourseOverrideModel.ALL_CHOICES.unset,
+        )
+
+    def test_disabled(self):
+        with patch.dict(settings.FEATURES, {'ENABLE_WAFFLE_SNAPSHOT': False}):
+            self.assertIsNone(get_snapshot())
+
+
+@patch.dict(settings.FEATURES, {'ENABLE_WAFFLE_SNAPSHOT': True})
+class TestWaffleSnapshotWithoutCache(CacheIsolationTestCase):
+    """
+    Tests that no snapshot is used when there is no shared cache to invalidate it.
+    """
+    ENABLED_CACHES = []
+
+    def test_no_shared_cache(self):
+        self.assertIsNone(get_snapshot())
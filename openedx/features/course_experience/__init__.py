@@ -43,6 +43,9 @@ LATEST_UPDATE_FLAG = CourseWaffleFlag(WAFFLE_FLAG_NAMESPACE, 'latest_update')
 # Waffle flag to enable the use of Bootstrap for course experience pages
 USE_BOOTSTRAP_FLAG = CourseWaffleFlag(WAFFLE_FLAG_NAMESPACE, 'use_bootstrap', flag_undefined_default=True)
 
+# Waffle flag to share the course outline between users who see the same course content
+CACHE_COURSE_OUTLINE_FLAG = CourseWaffleFlag(WAFFLE_FLAG_NAMESPACE, 'cache_course_outline')
+
 
 def course_home_page_title(course):  # pylint: disable=unused-argument
     """
@@ -18,11 +18,14 @@ from waffle.testutils import override_switch
 
 from courseware.tests.factories import StaffFactory
 from gating import api as lms_gating_api
+from lms.djangoapps.course_api.blocks.api import get_blocks
 from lms.djangoapps.course_api.blocks.transformers.milestones import MilestonesAndSpecialExamsTransformer
 from milestones.tests.utils import MilestonesTestCaseMixin
 from opaque_keys.edx.keys import CourseKey, UsageKey
 from openedx.core.djangoapps.site_configuration.models import SiteConfiguration
+from openedx.core.djangoapps.waffle_utils.testutils import override_waffle_flag
 from openedx.core.lib.gating import api as gating_api
+from openedx.features.course_experience import CACHE_COURSE_OUTLINE_FLAG
 from openedx.features.course_experience.views.course_outline import (
     CourseOutlineFragmentView, DEFAULT_COMPLETION_TRACKING_START
 )
@@ -458,6 +461,36 @@ class TestCourseOutlineResumeCourse(SharedModuleStoreTestCase, CompletionWaffleT
         content = pq(response.content)
         self.assertTrue(content('.action-resume-course').attr('href').endswith('/vertical/' + vertical2.url_name))
 
+    @override_waffle_flag(CACHE_COURSE_OUTLINE_FLAG, active=True)
+    def test_resume_course_with_cached_outline(self):
+        """
+        Tests that the course outline is shared between users, while their
+        completions are not.
+        """
+        self.override_waffle_switch(True)
+
+        course = CourseFactory.create(default_store=ModuleStoreEnum.Type.split)
+        with self.store.bulk_operations(course.id):
+            chapter = ItemFactory.create(category='chapter', parent_location=course.location)
+            sequential = ItemFactory.create(category='sequential', parent_location=chapter.location)
+            vertical = ItemFactory.create(category='vertical', parent_location=sequential.location)
+        CourseEnrollment.enroll(self.user, course.id)
+        other_user = UserFactory(password=TEST_PASSWORD)
+        CourseEnrollment.enroll(other_user, course.id)
+
+        with patch('openedx.features.course_experience.utils.get_blocks', wraps=get_blocks) as mock_get_blocks:
+            self.visit_course_home(course, start_count=1, resume_count=0)
+
+            self.complete_sequential(course, vertical)
+            response = self.visit_course_home(course, start_count=0, resume_count=1)
+            content = pq(response.content)
+            self.assertTrue(content('.action-resume-course').attr('href').endswith('/vertical/' + vertical.url_name))
+
+            self.client.login(username=other_user.username, password=TEST_PASSWORD)
+            self.visit_course_home(course, start_count=1, resume_count=0)
+
+        self.assertEqual(mock_get_blocks.call_count, 1)
+
     def test_resume_course_deleted_sequential(self):
         """
         Tests resume course when the last completed sequential is deleted and
@@ -1,14 +1,52 @@
 """
 Common utilities for the course experience, including course outline.
 """
+from hashlib import sha1
+
 from completion.models import BlockCompletion
+from django.core.cache import cache
 
-from lms.djangoapps.course_api.blocks.api import get_blocks
+from lms.djangoapps.course_api.blocks.api import get_blocks, get_blocks_transformers
+from lms.djangoapps.course_blocks.usage_info import CourseUsageInfo
 from lms.djangoapps.course_blocks.utils import get_student_module_as_dict
-from opaque_keys.edx.keys import CourseKey
+from opaque_keys.edx.keys import CourseKey, UsageKey
+from openedx.core.djangoapps.content.block_structure.api import get_block_structure_manager
 from openedx.core.djangoapps.request_cache.middleware import request_cached
 from xmodule.modulestore.django import modulestore
 
+from . import CACHE_COURSE_OUTLINE_FLAG
+
+# Number of seconds for which a shared course outline is cached. Outlines are
+# cached per course version, so they don't need to be invalidated on publish.
+COURSE_OUTLINE_CACHE_TIMEOUT = 60 * 60 * 24
+
+# Deeper query for course tree traversing/marking complete
+# and last completed block
+COURSE_OUTLINE_BLOCK_TYPES = [
+    'course',
+    'chapter',
+    'sequential',
+    'vertical',
+    'html',
+    'problem',
+    'video',
+    'discussion',
+    'drag-and-drop-v2',
+    'poll',
+    'word_cloud'
+]
+COURSE_OUTLINE_REQUESTED_FIELDS = [
+    'children',
+    'display_name',
+    'type',
+    'due',
+    'graded',
+    'special_exam_info',
+    'show_gated_sections',
+    'format'
+]
+COURSE_OUTLINE_NAV_DEPTH = 3
+
 
 @request_cached
 def get_course_outline_block_tree(request, course_id):
@@ -16,24 +54,6 @@ def get_course_outline_block_tree(request, course_id):
     Returns the root block of the course outline, with children as blocks.
     """
 
-    def populate_children(block, all_blocks):
-        """
-        Replace each child id with the full block for the child.
-
-        Given a block, replaces each id in its children array with the full
-        representation of that child, which will be looked up by id in the
-        passed all_blocks dict. Recursively do the same replacement for children
-        of those children.
-        """
-        children = block.get('children', [])
-
-        for i in range(len(children)):
-            child_id = block['children'][i]
-            child_detail = populate_children(all_blocks[child_id], all_blocks)
-            block['children'][i] = child_detail
-
-        return block
-
     def set_last_accessed_default(block):
         """
         Set default of False for resume_block on all blocks.
@@ -49,13 +69,13 @@ def get_course_outline_block_tree(request, course_id):
         Mark 'most recent completed block as 'resume_block'
 
         """
-        last_completed_child_position = BlockCompletion.get_latest_block_completed(user, course_key)
+        course_block_completions, latest_completion = _get_course_completions(user, course_key)
 
-        if last_completed_child_position:
+        if latest_completion:
             # Mutex w/ NOT 'course_block_completions'
             recurse_mark_complete(
-                course_block_completions=BlockCompletion.get_course_completions(user, course_key),
-                latest_completion=last_completed_child_position,
+                course_block_completions=course_block_completions,
+                latest_completion=latest_completion,
                 block=block
             )
 
@@ -67,18 +87,18 @@ def get_course_outline_block_tree(request, course_id):
         If all blocks are complete, mark parent block complete
         mark parent blocks of 'last_complete' as 'last_complete'
 
-        :param course_block_completions: dict[course_completion_object] =  completion_value
-        :param latest_completion: course_completion_object
+        :param course_block_completions: dict[block id] = completion_value
+        :param latest_completion: id of the block completed last
         :param block: course_outline_root_block block object or child block
 
         :return:
             block: course_outline_root_block block object or child block
         """
-        block_key = block.serializer.instance
+        block_key = block['id']
 
         if course_block_completions.get(block_key):
             block['complete'] = True
-            if block_key == latest_completion.full_block_key:
+            if block_key == latest_completion:
                 block['resume_block'] = True
 
         if block.get('children'):
@@ -101,7 +121,7 @@ def get_course_outline_block_tree(request, course_id):
         """
         Recursively marks the branch to the last accessed block.
         """
-        block_key = block.serializer.instance
+        block_key = UsageKey.from_string(block['id'])
         student_module_dict = get_student_module_as_dict(user, course_key, block_key)
 
         last_accessed_child_position = student_module_dict.get('position')
@@ -118,54 +138,133 @@ def get_course_outline_block_tree(request, course_id):
                 block['children'][-1]['resume_block'] = True
 
     course_key = CourseKey.from_string(course_id)
+
+    course_outline_root_block = _get_course_outline(request, course_key)
+    if course_outline_root_block:
+        set_last_accessed_default(course_outline_root_block)
+
+        mark_blocks_completed(
+            block=course_outline_root_block,
+            user=request.user,
+            course_key=course_key
+        )
+    return course_outline_root_block
+
+
+def _get_course_outline(request, course_key):
+    """
+    Returns the root block of the course outline for the requesting user,
+    without any completion data.
+
+    When the CACHE_COURSE_OUTLINE_FLAG is enabled, the outline is cached
+    and shared between all the users for whom the course blocks are
+    transformed in the same way.
+    """
     course_usage_key = modulestore().make_course_usage_key(course_key)
+    if not CACHE_COURSE_OUTLINE_FLAG.is_enabled(course_key):
+        return _build_course_outline(request, course_usage_key)
+
+    collected_block_structure = get_block_structure_manager(course_key).get_collected()
+    cache_key = _get_course_outline_cache_key(request, course_usage_key, collected_block_structure)
+    if cache_key is None:
+        return _build_course_outline(request, course_usage_key, collected_block_structure)
+
+    course_outline_root_block = cache.get(cache_key)
+    if course_outline_root_block is None:
+        course_outline_root_block = _build_course_outline(request, course_usage_key, collected_block_structure)
+        cache.set(cache_key, course_outline_root_block, COURSE_OUTLINE_CACHE_TIMEOUT)
+    return course_outline_root_block
+
 
-    # Deeper query for course tree traversing/marking complete
-    # and last completed block
-    block_types_filter = [
-        'course',
-        'chapter',
-        'sequential',
-        'vertical',
-        'html',
-        'problem',
-        'video',
-        'discussion',
-        'drag-and-drop-v2',
-        'poll',
-        'word_cloud'
-    ]
+def _get_course_outline_cache_key(request, course_usage_key, collected_block_structure):
+    """
+    Returns the cache key of the course outline of the requesting user, or
+    None if the outline can't be shared with other users.
+    """
+    course_version = collected_block_structure.get_xblock_field(course_usage_key, 'course_version')
+    if course_version is None:
+        return None
+
+    transformers = get_blocks_transformers(
+        request.user,
+        requested_fields=COURSE_OUTLINE_REQUESTED_FIELDS,
+        nav_depth=COURSE_OUTLINE_NAV_DEPTH,
+    )
+    transformers.usage_info = CourseUsageInfo(course_usage_key.course_key, request.user)
+    usage_signature = transformers.get_usage_signature(collected_block_structure)
+    if usage_signature is None:
+        return None
+
+    return u'course_experience.course_outline.{}'.format(sha1(repr((
+        unicode(course_usage_key),
+        unicode(course_version),
+        usage_signature,
+        # The urls of the blocks are absolute.
+        request.build_absolute_uri('/'),
+    ))).hexdigest())
+
+
+def _build_course_outline(request, course_usage_key, collected_block_structure=None):
+    """
+    Returns the root block of the course outline for the requesting user,
+    with children as blocks.
+    """
     all_blocks = get_blocks(
         request,
         course_usage_key,
         user=request.user,
-        nav_depth=3,
-        requested_fields=[
-            'children',
-            'display_name',
-            'type',
-            'due',
-            'graded',
-            'special_exam_info',
-            'show_gated_sections',
-            'format'
-        ],
-        block_types_filter=block_types_filter
+        nav_depth=COURSE_OUTLINE_NAV_DEPTH,
+        requested_fields=COURSE_OUTLINE_REQUESTED_FIELDS,
+        block_types_filter=COURSE_OUTLINE_BLOCK_TYPES,
+        collected_block_structure=collected_block_structure,
     )
 
     course_outline_root_block = all_blocks['blocks'].get(all_blocks['root'], None)
     if course_outline_root_block:
-        populate_children(course_outline_root_block, all_blocks['blocks'])
-        set_last_accessed_default(course_outline_root_block)
-
-        mark_blocks_completed(
-            block=course_outline_root_block,
-            user=request.user,
-            course_key=course_key
-        )
+        course_outline_root_block = _populate_children(course_outline_root_block, all_blocks['blocks'])
     return course_outline_root_block
 
 
+def _populate_children(block, all_blocks):
+    """
+    Returns a copy of the block, replacing each child id with a copy of
+    the full representation of that child, which will be looked up by
+    id in the passed all_blocks dict. Recursively do the same
+    replacement for children of those children.
+    """
+    block = dict(block)
+    if 'children' in block:
+        block['children'] = [_populate_children(all_blocks[child_id], all_blocks) for child_id in block['children']]
+    return block
+
+
+def _get_course_completions(user, course_key):
+    """
+    Returns the user's completion of each block of the course, by block
+    id, and the id of the block completed last, from a single query.
+    """
+    course_block_completions = {}
+    latest_completion = None
+    latest_modified = None
+    if not user.is_authenticated:
+        return course_block_completions, latest_completion
+
+    completions = BlockCompletion.objects.filter(
+        user=user,
+        course_key=course_key,
+    ).values_list(
+        'block_key',
+        'completion',
+        'modified',
+    )
+    for block_key, completion, modified in completions:
+        block_id = unicode(block_key.map_into_course(course_key))
+        course_block_completions[block_id] = completion
+        if latest_modified is None or modified > latest_modified:
+            latest_completion, latest_modified = block_id, modified
+    return course_block_completions, latest_completion
+
+
 def get_resume_block(block):
     """
     Gets the deepest block marked as 'resume_block'.